@@ -0,0 +1,76 @@
+"""Rewrite the generated package ``__init__`` modules so their re-exports load on first access.
+
+The generator re-exports every model and ``DefaultApi`` eagerly, so importing any one model module
+pulls in ~70 others. Run after ``openapi-generator-cli generate`` (``pnpm openapi:gen:py`` does);
+the re-export imports move under ``if TYPE_CHECKING:`` and a PEP 562 ``__getattr__`` resolves them
+at runtime. Running it twice is a no-op.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+PACKAGE = "ai_stats_generated"
+ROOT = Path(__file__).resolve().parent.parent / "src" / "gen" / PACKAGE
+INITS = (ROOT / "__init__.py", ROOT / "models" / "__init__.py", ROOT / "api" / "__init__.py")
+MARKER = "_LAZY_IMPORTS"
+REEXPORT = re.compile(rf"^from ({re.escape(PACKAGE)}(?:\.\w+)+) import (\w+)(?: as (\w+))?$")
+
+LOADER = '''
+# Re-exports are imported on first attribute access (PEP 562), not when the package is imported.
+{marker} = {{
+{entries}
+}}
+
+
+def __getattr__(name):
+    try:
+        module, attribute = {marker}[name]
+    except KeyError:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}") from None
+    value = getattr(importlib.import_module(module), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set({marker}))
+'''
+
+
+def rewrite(source: str) -> str:
+    lines = source.splitlines()
+    exports = {}
+    first = last = None
+    for index, line in enumerate(lines):
+        match = REEXPORT.match(line)
+        if match:
+            module, attribute, alias = match.groups()
+            exports[alias or attribute] = (module, attribute)
+            first = index if first is None else first
+            last = index
+    if first is None:
+        return source
+    # Keep the generator's "# import models into ..." comment with the imports it introduces.
+    while first > 0 and lines[first - 1].startswith("#") and "noqa" not in lines[first - 1]:
+        first -= 1
+    block = [f"    {line}" if line else line for line in lines[first : last + 1]]
+    entries = "\n".join(f'    "{name}": ("{module}", "{attribute}"),' for name, (module, attribute) in exports.items())
+    head = lines[:first]
+    while head and not head[-1]:
+        head.pop()
+    out = [*head, "", "import importlib", "from typing import TYPE_CHECKING", "", "if TYPE_CHECKING:", *block, *lines[last + 1 :]]
+    return "\n".join(out).rstrip("\n") + "\n" + LOADER.format(marker=MARKER, entries=entries)
+
+
+def main() -> None:
+    for path in INITS:
+        source = path.read_text(encoding="utf-8")
+        if MARKER in source:
+            continue
+        path.write_text(rewrite(source), encoding="utf-8")
+        print(f"deferred re-exports in {path.relative_to(ROOT.parent)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
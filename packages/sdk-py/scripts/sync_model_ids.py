@@ -0,0 +1,19 @@
+"""Regenerate ``src/ai_stats/model_ids.txt`` from the generated ``ModelId`` enum.
+
+Run after ``pnpm openapi:gen:py``; ``tests/test_catalog.py`` fails while the two disagree.
+"""
+
+from pathlib import Path
+
+from ai_stats_generated.models.model_id import ModelId
+
+TARGET = Path(__file__).resolve().parent.parent / "src" / "ai_stats" / "model_ids.txt"
+
+
+def main() -> None:
+    TARGET.write_text("".join(f"{model}\n" for model in sorted(member.value for member in ModelId)), encoding="utf-8")
+    print(f"wrote {len(ModelId)} model ids to {TARGET}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from contextlib import asynccontextmanager
+from functools import cached_property, lru_cache, partial
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple, Type, Union
+
+from ai_stats_generated import Configuration
+import httpx
+
+from ._client import normalize_base_url, with_model
+from ._batch import DEFAULT_ENDPOINT, MAX_BATCH_BYTES, MAX_BATCH_LINES, BatchItem, BatchShard, batch_lines, shard_lines, shard_upload
+from ._binary import Destination, awrite_chunks
+from ._cache import AsyncCacheTransport, ResponseCache
+from ._concurrency import amap_concurrent
+from ._deserialize import CompiledApiClient, M, load_model
+from ._embeddings import (
+    DEFAULT_BATCH_SIZE,
+    EmbeddingBlock,
+    EmbeddingMatrix,
+    abatch_texts,
+    aembed_corpus,
+    batch_retry,
+    decode_embeddings,
+    embeddings_request,
+    estimate_tokens,
+)
+from ._errors import raise_for_status
+from ._hedging import HedgePolicy, LatencyHistogram, aresume, arun_hedged
+from ._multipart import DEFAULT_CHUNK_SIZE, MultipartUpload, Progress, as_file_part, audio_upload
+from ._pool import DEFAULT_POOL, AsyncPoolMetricsTransport, PoolMetrics, PoolOptions, PoolStats
+from ._ratelimit import RateLimiter
+from ._rest import HttpxRESTResponse, build_request, json_request, request_extensions, to_httpx_timeout
+from ._retry import DEFAULT_RETRY, AsyncRetryTransport, RetryPolicy
+from ._singleflight import SingleFlight, flight_key
+from ._streaming import ChatCompletionChunk, ServerSentEvent, aiter_json_events, aiter_sse
+from ._types import (
+    AudioSpeechRequest,
+    AudioTranscriptionRequest,
+    AudioTranscriptionResponse,
+    AudioTranslationRequest,
+    AudioTranslationResponse,
+    BatchRequest,
+    BatchResponse,
+    ChatCompletionsParams,
+    ChatCompletionsRequest,
+    ChatCompletionsResponse,
+    EmbeddingsRequest,
+    EmbeddingsResponse,
+    FileListResponse,
+    FileObject,
+    GenerationResponse,
+    GetAnalytics200Response,
+    GetAnalyticsRequest,
+    HealthzGet200Response,
+    ImageEditResponse,
+    ImageGenerationRequest,
+    ImageGenerationResponse,
+    ModelListResponse,
+    ModerationRequest,
+    ModerationResponse,
+    ResponsesRequest,
+    ResponsesResponse,
+    Root200Response,
+    VideoGenerationRequest,
+    VideoGenerationResponse,
+)
+
+if TYPE_CHECKING:
+    from ai_stats_generated.api.default_api import DefaultApi
+
+
+@lru_cache(maxsize=None)
+def _serializer_params(operation: str) -> tuple[str, ...]:
+    from ai_stats_generated.api.default_api import DefaultApi
+
+    serialize = getattr(DefaultApi, f"_{operation}_serialize")
+    return tuple(name for name in inspect.signature(serialize).parameters if name != "self")
+
+
+# ``_response_types_map`` of each generated ``DefaultApi`` operation the client calls (status -> model
+# name). tests/test_client.py checks it against the generated operations after every regeneration.
+RESPONSE_TYPES: Dict[str, Dict[str, Optional[str]]] = {
+    "create_batch": {"200": "BatchResponse"},
+    "create_chat_completion": {"200": "ChatCompletionsResponse"},
+    "create_embedding": {"200": "EmbeddingsResponse"},
+    "create_image": {"200": "ImagesGenerationResponse"},
+    "create_image_edit": {"200": "ImagesEditResponse"},
+    "create_moderation": {"200": "ModerationsResponse"},
+    "create_response": {"200": "ResponsesResponse"},
+    "create_speech": {"200": "bytearray"},
+    "create_transcription": {"200": "AudioTranscriptionResponse"},
+    "create_translation": {"200": "AudioTranslationResponse"},
+    "create_video": {"200": "VideoGenerationResponse"},
+    "get_analytics": {"200": "GetAnalytics200Response"},
+    "get_generation": {"200": "GenerationResponse", "401": "GetGeneration401Response", "404": "GetGeneration404Response"},
+    "healthz": {"200": "Healthz200Response"},
+    "list_files": {"200": "ListFilesResponse"},
+    "list_models": {"200": "ListModels200Response", "500": "ListModels500Response"},
+    "retrieve_batch": {"200": "BatchResponse"},
+    "retrieve_file": {"200": "FileResponse"},
+    "root": {"200": "Root200Response"},
+}
+
+
+def _coerce(model: Any, value: Any) -> Any:
+    return value if isinstance(value, model) else model.from_dict(value)
+
+
+class AsyncAIStats:
+    """Asyncio-native gateway client backed by a pooled ``httpx.AsyncClient``.
+
+    Mirrors the ``AIStats`` surface with awaitable methods; streaming endpoints are async iterators.
+    Requests are built and decoded by the generated ``DefaultApi``/``ApiClient`` helpers so every
+    operation stays in step with the OpenAPI spec.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeout: Union[float, httpx.Timeout, None] = None,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        pool: PoolOptions = DEFAULT_POOL,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+        hedge: Optional[HedgePolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight_ttl: float = 2.0,
+        trusted_responses: bool = False,
+    ):
+        if not api_key:
+            raise ValueError("api_key is required")
+
+        host = normalize_base_url(base_url)
+        self._base_url = host
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        configuration = Configuration(host=host, access_token=api_key)
+        self._client = CompiledApiClient(configuration=configuration)
+        self._client.trusted_responses = trusted_responses
+        # Pool-wait metrics are taken per attempt, whichever transport is underneath.
+        self.pool_metrics = PoolMetrics()
+        network = AsyncPoolMetricsTransport(
+            transport or httpx.AsyncHTTPTransport(**pool.transport_options(limits, http2=http2)), self.pool_metrics, pool.max_streams
+        )
+        # Cached responses short-circuit retries and pacing; every other attempt goes through both.
+        stack = AsyncRetryTransport(network, retry, rate_limiter)
+        if cache is not None:
+            stack = AsyncCacheTransport(stack, cache)
+        self._http = httpx.AsyncClient(
+            base_url=host,
+            headers=self._headers,
+            timeout=pool.timeout(timeout),
+            transport=stack,
+        )
+        self._hedge = hedge
+        # Per-(model, kind) latencies of hedged calls; drives the hedge delay.
+        self.latency = LatencyHistogram()
+        # Concurrent identical model-list/health/generation lookups share one call for a short while.
+        self._single_flight = SingleFlight(single_flight_ttl)
+
+    @cached_property
+    def _api(self) -> DefaultApi:
+        # The generated operations module is large; load it with the first call that needs it.
+        from ai_stats_generated.api.default_api import DefaultApi
+
+        return DefaultApi(api_client=self._client)
+
+    def pool_stats(self) -> PoolStats:
+        """Requests sent, connections opened, and time spent waiting for a pooled connection."""
+        return self.pool_metrics.stats()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncAIStats":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _call(self, operation: str, *, _request_timeout: Any = None, **params: Any) -> Any:
+        names = _serializer_params(operation)
+        unknown = set(params).difference(names)
+        if unknown:
+            raise TypeError(f"{operation}() got unexpected arguments: {', '.join(sorted(unknown))}")
+        serialized = getattr(self._api, f"_{operation}_serialize")(**{name: params.get(name) for name in names})
+        request = build_request(*serialized)
+        if _request_timeout:
+            request["timeout"] = to_httpx_timeout(_request_timeout)
+        resp = await self._http.request(**request)
+        raise_for_status(resp)
+        rest_response = HttpxRESTResponse(resp)
+        rest_response.read()
+        return self._client.response_deserialize(rest_response, RESPONSE_TYPES[operation]).data
+
+    @asynccontextmanager
+    async def _open_stream(self, path: str, payload: Any) -> AsyncIterator[httpx.Response]:
+        async with self._http.stream("POST", path, **json_request(payload)) as resp:
+            if resp.is_error:
+                await resp.aread()
+                raise_for_status(resp)
+            yield resp
+
+    async def _stream_lines(self, path: str, payload: Any) -> AsyncIterator[str]:
+        async with self._open_stream(path, payload) as resp:
+            async for line in resp.aiter_lines():
+                if line:
+                    yield line
+
+    async def _stream_events(self, path: str, payload: Any) -> AsyncIterator[ServerSentEvent]:
+        async with self._open_stream(path, payload) as resp:
+            async for event in aiter_sse(resp.aiter_bytes()):
+                yield event
+
+    async def _hedged_events(self, path: str, payload: Any) -> AsyncIterator[ServerSentEvent]:
+        async def open_stream(model: str) -> Tuple[AsyncGenerator[ServerSentEvent, None], Optional[ServerSentEvent]]:
+            events = self._stream_events(path, with_model(payload, model))
+            try:
+                return events, await events.__anext__()
+            except StopAsyncIteration:
+                return events, None
+            except BaseException:
+                await events.aclose()
+                raise
+
+        async def release(opened: Tuple[AsyncGenerator[ServerSentEvent, None], Optional[ServerSentEvent]]) -> None:
+            await opened[0].aclose()
+
+        events, first = await arun_hedged(
+            open_stream, payload.model, policy=self._hedge, histogram=self.latency, kind="first_byte", release=release
+        )
+        async for event in aresume(first, events):
+            yield event
+
+    async def generate_text(self, request: ChatCompletionsRequest | ChatCompletionsParams) -> ChatCompletionsResponse:
+        """Create a chat completion.
+
+        With a ``hedge`` policy a duplicate request (optionally to an alternate model) is raced
+        against a slow primary once it exceeds the model's observed latency percentile.
+        """
+        payload = request if isinstance(request, ChatCompletionsRequest) else ChatCompletionsRequest.from_dict({**request, "stream": False})
+        if self._hedge is None:
+            return await self._call("create_chat_completion", chat_completions_request=payload)
+
+        async def attempt(model: str) -> ChatCompletionsResponse:
+            request = with_model(payload, model)
+            return await self._call("create_chat_completion", chat_completions_request=request)
+
+        return await arun_hedged(attempt, payload.model, policy=self._hedge, histogram=self.latency, kind="response")
+
+    async def stream_text(self, request: ChatCompletionsRequest | ChatCompletionsParams) -> AsyncIterator[str]:
+        payload = request if isinstance(request, ChatCompletionsRequest) else ChatCompletionsRequest.from_dict({**request, "stream": True})
+        async for line in self._stream_lines("/chat/completions", payload):
+            yield line
+
+    def map_chat_completions(
+        self,
+        requests: Union[Iterable[ChatCompletionsRequest | ChatCompletionsParams], AsyncIterable[ChatCompletionsRequest | ChatCompletionsParams]],
+        *,
+        concurrency: int = 64,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[int, Union[ChatCompletionsResponse, Exception]]]:
+        """Run ``generate_text`` over ``requests`` with at most ``concurrency`` calls in flight.
+
+        Accepts sync or async iterables, pulled lazily. Yields ``(index, response)`` in input order,
+        or as they complete when ``ordered=False``.
+        """
+        return amap_concurrent(
+            self.generate_text,
+            requests,
+            concurrency=concurrency,
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        )
+
+    async def chat_completions(self, request: Optional[ChatCompletionsParams] = None, **params: Any) -> Dict[str, Any]:
+        """Create a chat completion and return the decoded JSON body as a plain dict."""
+        payload = ChatCompletionsRequest.from_dict({**(request or {}), **params, "stream": False})
+        resp = await self._http.post("/chat/completions", **json_request(payload))
+        raise_for_status(resp)
+        return resp.json()
+
+    def stream_chat_completions(self, request: Optional[ChatCompletionsParams] = None, **params: Any) -> AsyncIterator[ChatCompletionChunk]:
+        """Stream a chat completion, yielding each decoded chunk until ``[DONE]``.
+
+        Feed the chunks to ``ChatCompletionAccumulator`` to rebuild the final response.
+        """
+        payload = request if isinstance(request, ChatCompletionsRequest) else ChatCompletionsRequest.from_dict({**(request or {}), **params, "stream": True})
+        events = self._stream_events if self._hedge is None else self._hedged_events
+        return aiter_json_events(events("/chat/completions", payload))
+
+    async def generate_image(self, request: ImageGenerationRequest | dict[str, Any]) -> ImageGenerationResponse:
+        return await self._call("create_image", images_generation_request=_coerce(ImageGenerationRequest, request))
+
+    async def generate_image_edit(self, request: dict[str, Any]) -> ImageEditResponse:
+        return await self._call("create_image_edit", **request)
+
+    async def generate_moderation(self, request: ModerationRequest | dict[str, Any]) -> ModerationResponse:
+        return await self._call("create_moderation", moderations_request=_coerce(ModerationRequest, request))
+
+    async def generate_video(self, request: VideoGenerationRequest | dict[str, Any]) -> VideoGenerationResponse:
+        return await self._call("create_video", video_generation_request=_coerce(VideoGenerationRequest, request))
+
+    async def generate_embedding(self, body: EmbeddingsRequest | dict[str, Any]) -> EmbeddingsResponse:
+        return await self._call("create_embedding", embeddings_request=_coerce(EmbeddingsRequest, body))
+
+    async def embed(self, body: EmbeddingsRequest | dict[str, Any]) -> EmbeddingMatrix:
+        """Embed ``body["input"]`` into one contiguous float32 matrix; see ``AIStats.embed``."""
+        return await self._embed(body)
+
+    async def _embed(self, body: EmbeddingsRequest | dict[str, Any], extensions: Optional[Dict[str, Any]] = None) -> EmbeddingMatrix:
+        request = json_request(embeddings_request(body))
+        if extensions:
+            request["extensions"] = {**request["extensions"], **extensions}
+        resp = await self._http.post("/embeddings", **request)
+        raise_for_status(resp)
+        return decode_embeddings(resp.content)
+
+    def embed_corpus(
+        self,
+        texts: Union[Iterable[str], AsyncIterable[str]],
+        model: str,
+        *,
+        batch_size: Optional[int] = DEFAULT_BATCH_SIZE,
+        token_budget: Optional[int] = None,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+        concurrency: int = 4,
+        dimensions: Optional[int] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+    ) -> AsyncIterator[EmbeddingBlock]:
+        """Embed a sync or async corpus in ordered blocks; see ``AIStats.embed_corpus``."""
+        batches = abatch_texts(texts, batch_size=batch_size, token_budget=token_budget, count_tokens=count_tokens)
+        return aembed_corpus(partial(self._embed, extensions=batch_retry(retry)), batches, model, concurrency=concurrency, dimensions=dimensions)
+
+    async def generate_transcription(
+        self,
+        body: AudioTranscriptionRequest,
+        *,
+        file: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> AudioTranscriptionResponse:
+        """Transcribe audio given by ``audio_url``/``audio_b64``, or streamed from ``file``."""
+        if file is None:
+            return await self._call("create_transcription", **body)
+        upload = audio_upload(body, file, chunk_size=chunk_size, progress=progress)
+        return await self._upload("/audio/transcriptions", upload, AudioTranscriptionResponse, body.get("model"))
+
+    async def generate_speech(self, body: dict[str, Any]) -> bytes:
+        return await self._call("create_speech", audio_speech_request=_coerce(AudioSpeechRequest, body))
+
+    async def stream_speech(self, body: AudioSpeechRequest | dict[str, Any], *, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream synthesised audio, yielding bytes as the gateway sends them.
+
+        Only one chunk is held in memory at a time, so playback can start before synthesis finishes.
+        ``chunk_size`` re-slices the body into fixed-size chunks; by default chunks are passed on as
+        they arrive.
+        """
+        async with self._open_stream("/audio/speech", _coerce(AudioSpeechRequest, body)) as resp:
+            async for chunk in resp.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def save_speech(self, body: AudioSpeechRequest | dict[str, Any], destination: Destination, *, chunk_size: Optional[int] = None) -> int:
+        """Stream synthesised audio into a path or binary file object; return the number of bytes written."""
+        return await awrite_chunks(self.stream_speech(body, chunk_size=chunk_size), destination)
+
+    async def generate_translation(
+        self,
+        body: AudioTranslationRequest,
+        *,
+        file: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> AudioTranslationResponse:
+        """Translate audio into English; ``file`` streams as in ``generate_transcription``."""
+        if file is None:
+            return await self._call("create_translation", **body)
+        upload = audio_upload(body, file, chunk_size=chunk_size, progress=progress)
+        return await self._upload("/audio/translations", upload, AudioTranslationResponse, body.get("model"))
+
+    async def generate_response(self, request: ResponsesRequest | dict[str, Any]) -> ResponsesResponse:
+        return await self._call("create_response", responses_request=_coerce(ResponsesRequest, request))
+
+    async def stream_response(self, request: ResponsesRequest | dict[str, Any]) -> AsyncIterator[str]:
+        payload = request if isinstance(request, ResponsesRequest) else ResponsesRequest.from_dict({**request, "stream": True})
+        async for line in self._stream_lines("/responses", payload):
+            yield line
+
+    def stream_response_events(self, request: ResponsesRequest | dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a response, yielding each decoded server-sent event payload."""
+        payload = request if isinstance(request, ResponsesRequest) else ResponsesRequest.from_dict({**request, "stream": True})
+        return aiter_json_events(self._stream_events("/responses", payload))
+
+    async def create_batch(self, request: BatchRequest | dict[str, Any]) -> BatchResponse:
+        return await self._call("create_batch", batch_request=_coerce(BatchRequest, request))
+
+    async def create_batches(
+        self,
+        requests: Iterable[BatchItem],
+        *,
+        endpoint: str = DEFAULT_ENDPOINT,
+        completion_window: str = "24h",
+        metadata: Optional[Dict[str, Any]] = None,
+        max_lines: int = MAX_BATCH_LINES,
+        max_bytes: int = MAX_BATCH_BYTES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+    ) -> AsyncIterator[BatchShard]:
+        """Stream ``requests`` into batch files and submit one batch per file; see ``AIStats.create_batches``.
+
+        ``requests`` is a plain iterable. It is read and encoded in a worker thread while each file
+        uploads, so a slow generator does not block the event loop.
+        """
+        shards = shard_lines(batch_lines(requests, endpoint, start), max_lines=max_lines, max_bytes=max_bytes, start=start)
+        while True:
+            shard = await asyncio.to_thread(next, shards, None)
+            if shard is None:
+                return
+            file = await self._upload("/files", shard_upload(shard, chunk_size=chunk_size), FileObject)
+            request = BatchRequest(input_file_id=file.id, endpoint=endpoint, completion_window=completion_window, metadata=metadata)
+            yield BatchShard(shard.start, shard.count, file, await self.create_batch(request))
+
+    async def get_batch(self, batch_id: str) -> BatchResponse:
+        return await self._call("retrieve_batch", batch_id=batch_id)
+
+    async def list_files(self) -> FileListResponse:
+        return await self._call("list_files")
+
+    async def get_file(self, file_id: str) -> FileObject:
+        return await self._call("retrieve_file", file_id=file_id)
+
+    async def _upload(self, path: str, upload: MultipartUpload, klass: Type[M], model: Optional[str] = None) -> M:
+        base = self._http.build_request("POST", path, headers=upload.headers, extensions=request_extensions(model))
+        # The body is replayable, so retries resend the file from disk instead of from a buffered copy.
+        request = httpx.Request(base.method, base.url, headers=base.headers, stream=upload, extensions=base.extensions)
+        resp = await self._http.send(request)
+        raise_for_status(resp)
+        return load_model(klass, resp.content, trusted=self._client.trusted_responses)
+
+    async def upload_file(
+        self,
+        *,
+        purpose: Optional[str] = None,
+        file: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> FileObject:
+        """Upload ``file``, streamed from disk in ``chunk_size`` pieces; see ``AIStats.upload_file``."""
+        if file is None:
+            raise ValueError("file is required")
+        fields = [("purpose", purpose)] if purpose else []
+        upload = MultipartUpload([*fields, ("file", as_file_part(file))], chunk_size=chunk_size, progress=progress)
+        return await self._upload("/files", upload, FileObject)
+
+    async def get_models(self, params: dict[str, Any] | None = None) -> ModelListResponse:
+        params = params or {}
+        return await self._single_flight.ado(
+            flight_key("list_models", params), lambda: self._call("list_models", **params)
+        )
+
+    async def get_health(self) -> HealthzGet200Response:
+        return await self._single_flight.ado(flight_key("healthz", {}), lambda: self._call("healthz"))
+
+    async def get_generation(self, generation_id: str) -> GenerationResponse:
+        # A generation changes while it runs, so only concurrent lookups are shared, never reused.
+        return await self._single_flight.ado(
+            flight_key("get_generation", {"id": generation_id}),
+            lambda: self._call("get_generation", id=generation_id),
+            ttl=0,
+        )
+
+    async def get_analytics(self, request: GetAnalyticsRequest | dict[str, Any]) -> GetAnalytics200Response:
+        return await self._call("get_analytics", get_analytics_request=_coerce(GetAnalyticsRequest, request))
+
+    async def get_root(self) -> Root200Response:
+        return await self._call("root")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from ._multipart import DEFAULT_CHUNK_SIZE, FilePart, MultipartUpload, Progress
+from ._serialize import dumps, encode_json
+
+if TYPE_CHECKING:
+    from ._types import BatchResponse, FileObject
+
+# Per-input-file limits of the upstream batch API.
+MAX_BATCH_LINES = 50_000
+MAX_BATCH_BYTES = 200 * 1024 * 1024
+
+DEFAULT_ENDPOINT = "/v1/chat/completions"
+
+BatchItem = Union[Any, Tuple[str, Any]]
+
+
+def batch_lines(requests: Iterable[BatchItem], endpoint: str = DEFAULT_ENDPOINT, start: int = 0) -> Iterator[bytes]:
+    """Encode each request as one JSONL line of the batch input format.
+
+    Items are request bodies (generated models or dicts), or ``(custom_id, body)`` pairs; bare
+    bodies get ``custom_id`` ``"request-<n>"``, numbered from ``start`` across the whole iterable.
+    Each body is serialized once and spliced into its line as bytes.
+    """
+    url = dumps(endpoint)
+    for index, item in enumerate(requests, start):
+        custom_id, body = item if isinstance(item, tuple) else (f"request-{index}", item)
+        yield b'{"custom_id":' + dumps(custom_id) + b',"method":"POST","url":' + url + b',"body":' + encode_json(body) + b"}\n"
+
+
+class Shard:
+    """One input file's worth of lines, pulled from the shared line iterator while it uploads.
+
+    ``count`` is final once ``lines()`` has been exhausted. Lines are not kept, so a shard whose
+    upload fails cannot be replayed; its ``start`` is where the input has to be restarted from.
+    """
+
+    def __init__(self, sharder: "_Sharder", start: int) -> None:
+        self.start = start
+        self.count = 0
+        self.size = 0
+        self._sharder = sharder
+
+    def lines(self) -> Iterator[bytes]:
+        sharder = self._sharder
+        while True:
+            line = sharder.take()
+            if line is None:
+                return
+            if len(line) > sharder.max_bytes:
+                raise ValueError(f"request {self.start + self.count} alone exceeds the {sharder.max_bytes}-byte file limit")
+            if self.count and (self.count >= sharder.max_lines or self.size + len(line) > sharder.max_bytes):
+                sharder.carry = line
+                return
+            self.count += 1
+            self.size += len(line)
+            yield line
+
+
+class _Sharder:
+    def __init__(self, lines: Iterable[bytes], max_lines: int, max_bytes: int) -> None:
+        self._lines = iter(lines)
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        # A line that did not fit the previous shard opens the next one.
+        self.carry: Optional[bytes] = None
+
+    def take(self) -> Optional[bytes]:
+        line, self.carry = self.carry, None
+        return line if line is not None else next(self._lines, None)
+
+    def pending(self) -> bool:
+        if self.carry is None:
+            self.carry = next(self._lines, None)
+        return self.carry is not None
+
+
+def shard_lines(
+    lines: Iterable[bytes], *, max_lines: int = MAX_BATCH_LINES, max_bytes: int = MAX_BATCH_BYTES, start: int = 0
+) -> Iterator[Shard]:
+    """Split ``lines`` into consecutive shards of at most ``max_lines`` lines and ``max_bytes`` bytes.
+
+    Lines are never buffered: each shard pulls from the source as it is consumed, so exhaust one
+    shard's ``lines()`` before asking for the next. Shard ``start`` offsets count from ``start``.
+    """
+    sharder = _Sharder(lines, max_lines, max_bytes)
+    while sharder.pending():
+        shard = Shard(sharder, start)
+        yield shard
+        start += shard.count
+
+
+def shard_upload(shard: Shard, *, chunk_size: int = DEFAULT_CHUNK_SIZE, progress: Optional[Progress] = None) -> MultipartUpload:
+    """``/files`` form uploading ``shard`` as a ``purpose=batch`` JSONL file."""
+    file = FilePart(shard.lines(), f"batch-{shard.start}.jsonl", "application/jsonl")
+    return MultipartUpload([("purpose", "batch"), ("file", file)], chunk_size=chunk_size, progress=progress)
+
+
+class BatchShard(NamedTuple):
+    """A submitted shard: requests ``start`` to ``start + count`` of the input, its file and its batch."""
+
+    start: int
+    count: int
+    file: "FileObject"
+    batch: "BatchResponse"
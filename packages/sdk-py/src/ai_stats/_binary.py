@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+from typing import AsyncIterable, BinaryIO, Iterable, Union
+
+Destination = Union[str, "os.PathLike[str]", BinaryIO]
+
+
+def _partial(path: Union[str, "os.PathLike[str]"]) -> str:
+    return f"{os.fspath(path)}.part"
+
+
+def write_chunks(chunks: Iterable[bytes], destination: Destination) -> int:
+    """Write ``chunks`` to a binary file object or a path as they arrive; return the byte count.
+
+    Paths are written through a ``.part`` sibling that replaces the target only once the body is
+    complete, so a failed download never leaves a truncated file behind.
+    """
+    if not isinstance(destination, (str, os.PathLike)):
+        written = 0
+        for chunk in chunks:
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+    partial = _partial(destination)
+    try:
+        with open(partial, "wb") as file:
+            written = write_chunks(chunks, file)
+        os.replace(partial, destination)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return written
+
+
+async def awrite_chunks(chunks: AsyncIterable[bytes], destination: Destination) -> int:
+    """Async counterpart of ``write_chunks``; each chunk is written before the next is awaited."""
+    if not isinstance(destination, (str, os.PathLike)):
+        written = 0
+        async for chunk in chunks:
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+    partial = _partial(destination)
+    try:
+        with open(partial, "wb") as file:
+            written = await awrite_chunks(chunks, file)
+        os.replace(partial, destination)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return written
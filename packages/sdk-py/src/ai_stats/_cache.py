@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, FrozenSet, NamedTuple, Optional, Protocol, Tuple, Union
+from weakref import WeakKeyDictionary
+
+import httpx
+
+CACHE_HEADER = "x-ai-stats-cache"
+
+# Connection-level headers, and those describing the body as it came off the wire; a replay carries
+# the decoded bytes, and its own cache state.
+_UNSTORED_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+        "content-encoding",
+        "content-length",
+        CACHE_HEADER,
+    }
+)
+
+# Deterministic endpoints: chat completions only when pinned with ``temperature=0`` or a ``seed``.
+CACHEABLE_PATHS = frozenset({"/chat/completions", "/embeddings", "/moderations"})
+
+
+class CacheBackend(Protocol):
+    """Byte store behind ``ResponseCache``. Implementations must be thread-safe."""
+
+    evictions: int
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCache:
+    """In-process LRU with per-entry TTL, bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[bytes, Optional[float]]] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+            self._size += len(value)
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._size > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _drop(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._size -= len(value)
+
+
+class SQLiteCache:
+    """On-disk cache in a single SQLite file; survives restarts and can be shared between processes.
+
+    Least-recently-used rows are evicted once ``max_entries`` is exceeded.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL, used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_used ON responses (used)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT value, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+            return bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires, used) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl if ttl is not None else None, now),
+            )
+            excess = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY used LIMIT ?)", (excess,)
+                )
+                self.evictions += excess
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+
+
+class ResponseCache:
+    """Content-addressed cache for deterministic gateway calls.
+
+    Keys hash the full request URL, a digest of the ``Authorization`` header and the canonical JSON
+    request body, so dicts and ``ChatCompletionsRequest`` objects that serialise alike share an
+    entry while different gateways or API keys never see each other's responses. Only successful
+    non-streaming responses are stored. Concurrent identical requests are coalesced onto one
+    in-flight call. Pass the same instance to several clients to share entries and stats.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttl: Optional[float] = 3600.0,
+        paths: FrozenSet[str] = CACHEABLE_PATHS,
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+        self.paths = paths
+        self._lock = threading.Lock()
+        # One count per cacheable request, by how it was answered (the ``x-ai-stats-cache`` value).
+        self._counts = {"hit": 0, "miss": 0, "coalesced": 0}
+        self._in_flight: Dict[str, Future] = {}
+        # asyncio futures belong to one event loop, so each loop coalesces on its own.
+        self._async_in_flight: WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]] = WeakKeyDictionary()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self._counts["hit"], self._counts["miss"], self._counts["coalesced"], self.backend.evictions)
+
+    def key(self, request: httpx.Request) -> Optional[str]:
+        """Return the cache key for ``request``, or ``None`` when it must not be cached."""
+        if request.method != "POST" or not any(request.url.path.endswith(path) for path in self.paths):
+            return None
+        try:
+            body = json.loads(request.content)
+        except (httpx.RequestNotRead, ValueError):
+            return None
+        if not isinstance(body, dict) or body.get("stream"):
+            return None
+        if request.url.path.endswith("/chat/completions") and body.get("temperature") != 0 and body.get("seed") is None:
+            return None
+        credential = hashlib.sha256(request.headers.get("authorization", "").encode()).hexdigest()
+        canonical = json.dumps([str(request.url), credential, body], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _record(self, state: str) -> None:
+        with self._lock:
+            self._counts[state] += 1
+
+    def _lookup(self, key: str) -> Optional[bytes]:
+        value = self.backend.get(key)
+        if value is not None:
+            self._record("hit")
+        return value
+
+    def _loop_in_flight(self) -> Dict[str, asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            table = self._async_in_flight.get(loop)
+            if table is None:
+                table = self._async_in_flight[loop] = {}
+            return table
+
+    def _claim(self, key: str) -> Tuple[bool, Future]:
+        with self._lock:
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                return False, pending
+            pending = self._in_flight[key] = Future()
+            return True, pending
+
+    def _settle(self, key: str, pending: Union[Future, asyncio.Future], value: Optional[bytes], table: Dict) -> None:
+        if value is not None:
+            self.backend.set(key, value, self.ttl)
+        with self._lock:
+            table.pop(key, None)
+        if not pending.done():
+            pending.set_result(value)
+
+
+def _entry(response: httpx.Response, body: bytes) -> bytes:
+    """Cache value for ``response``: its end-to-end headers as a JSON line, then the decoded ``body``."""
+    headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _UNSTORED_HEADERS]
+    return json.dumps(headers, separators=(",", ":")).encode() + b"\n" + body
+
+
+def _cached_response(request: httpx.Request, value: bytes, state: str) -> httpx.Response:
+    headers, _, body = value.partition(b"\n")
+    return httpx.Response(
+        200,
+        headers=[*map(tuple, json.loads(headers)), (CACHE_HEADER, state)],
+        content=body,
+        request=request,
+    )
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Serves cacheable requests from ``cache`` and coalesces identical ones in flight."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache) -> None:
+        self._transport = transport
+        self._cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = self._cache.key(request)
+        if key is None:
+            return self._transport.handle_request(request)
+        value = self._cache._lookup(key)
+        if value is not None:
+            return _cached_response(request, value, "hit")
+        leader, pending = self._cache._claim(key)
+        if not leader:
+            value = pending.result()
+            if value is not None:
+                self._cache._record("coalesced")
+                return _cached_response(request, value, "coalesced")
+            # The leader's call failed; send our own rather than share its error.
+            self._cache._record("miss")
+            return self._transport.handle_request(request)
+        self._cache._record("miss")
+        value = None
+        try:
+            response = self._transport.handle_request(request)
+            if response.status_code != 200:
+                return response
+            try:
+                value = _entry(response, response.read())
+            finally:
+                response.close()
+            return _cached_response(request, value, "miss")
+        finally:
+            self._cache._settle(key, pending, value, self._cache._in_flight)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``CacheTransport``."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache) -> None:
+        self._transport = transport
+        self._cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cache = self._cache
+        key = cache.key(request)
+        if key is None:
+            return await self._transport.handle_async_request(request)
+        value = cache._lookup(key)
+        if value is not None:
+            return _cached_response(request, value, "hit")
+        in_flight = cache._loop_in_flight()
+        pending = in_flight.get(key)
+        if pending is not None:
+            value = await asyncio.shield(pending)
+            if value is not None:
+                cache._record("coalesced")
+                return _cached_response(request, value, "coalesced")
+            cache._record("miss")
+            return await self._transport.handle_async_request(request)
+        pending = in_flight[key] = asyncio.get_running_loop().create_future()
+        cache._record("miss")
+        value = None
+        try:
+            response = await self._transport.handle_async_request(request)
+            if response.status_code != 200:
+                return response
+            try:
+                value = _entry(response, await response.aread())
+            finally:
+                await response.aclose()
+            return _cached_response(request, value, "miss")
+        finally:
+            cache._settle(key, pending, value, in_flight)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sys
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, FrozenSet, Iterable, Iterator, Optional, Tuple, Union
+
+DATA_FILE = Path(__file__).with_name("model_ids.txt")
+
+
+def _model_id(model: Any) -> str:
+    return getattr(model, "value", model)
+
+
+class ModelCatalog:
+    """Immutable catalogue of gateway model ids.
+
+    Ids are interned and kept twice: in a ``frozenset`` for O(1) membership and in a sorted tuple
+    for ordered iteration and prefix lookups by binary search. Accepts ``ModelId`` members anywhere
+    a plain id is accepted.
+    """
+
+    __slots__ = ("_ids", "_sorted", "_organisations")
+
+    def __init__(self, ids: Iterable[Any]) -> None:
+        self._sorted: Tuple[str, ...] = tuple(sorted({sys.intern(str(_model_id(model))) for model in ids}))
+        self._ids: FrozenSet[str] = frozenset(self._sorted)
+        self._organisations: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DATA_FILE) -> "ModelCatalog":
+        """Read a catalogue from a file holding one model id per line."""
+        with open(path, encoding="utf-8") as lines:
+            return cls(line.strip() for line in lines if line.strip())
+
+    def __contains__(self, model: Any) -> bool:
+        return _model_id(model) in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sorted)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __repr__(self) -> str:
+        return f"ModelCatalog({len(self)} models)"
+
+    def validate(self, model: Any) -> str:
+        """Return ``model`` as a plain id, raising ``ValueError`` when the gateway does not know it."""
+        model_id = _model_id(model)
+        if model_id not in self._ids:
+            raise ValueError(f"unknown model id: {model_id!r}")
+        return model_id
+
+    def with_prefix(self, prefix: str) -> Tuple[str, ...]:
+        """Every id starting with ``prefix``, in sorted order."""
+        start = bisect_left(self._sorted, prefix)
+        end = start
+        while end < len(self._sorted) and self._sorted[end].startswith(prefix):
+            end += 1
+        return self._sorted[start:end]
+
+    def by_organisation(self, organisation: str) -> Tuple[str, ...]:
+        """Ids published by ``organisation`` (the part before ``/``), e.g. ``"anthropic"``."""
+        return self.with_prefix(f"{organisation}/")
+
+    def organisations(self) -> Tuple[str, ...]:
+        if self._organisations is None:
+            self._organisations = tuple(sorted({model.partition("/")[0] for model in self._sorted}))
+        return self._organisations
+
+
+def __getattr__(name: str) -> Any:
+    # Read the data file the first time the shared catalogue is needed.
+    if name == "MODEL_CATALOG":
+        value = globals()["MODEL_CATALOG"] = ModelCatalog.load()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
+
+from ai_stats_generated import Configuration
+import httpx
+
+from ._batch import DEFAULT_ENDPOINT, MAX_BATCH_BYTES, MAX_BATCH_LINES, BatchItem, BatchShard, batch_lines, shard_lines, shard_upload
+from ._binary import Destination, write_chunks
+from ._cache import CacheTransport, ResponseCache
+from ._concurrency import map_concurrent
+from ._deserialize import M, load_model
+from ._embeddings import (
+    DEFAULT_BATCH_SIZE,
+    EmbeddingBlock,
+    EmbeddingMatrix,
+    batch_retry,
+    batch_texts,
+    decode_embeddings,
+    embed_corpus,
+    embeddings_request,
+    estimate_tokens,
+)
+from ._errors import raise_for_status
+from ._hedging import HedgePolicy, LatencyHistogram, resume, run_hedged
+from ._multipart import DEFAULT_CHUNK_SIZE, MultipartUpload, Progress, as_file_part, audio_upload
+from ._pool import DEFAULT_POOL, PoolMetrics, PoolMetricsTransport, PoolOptions, PoolStats
+from ._ratelimit import RateLimiter
+from ._rest import HttpxApiClient, json_request, request_extensions
+from ._retry import DEFAULT_RETRY, RetryPolicy, RetryTransport
+from ._singleflight import SingleFlight, flight_key
+from ._streaming import ChatCompletionChunk, ServerSentEvent, iter_json_events, iter_sse
+from ._types import (
+    AudioSpeechRequest,
+    AudioTranscriptionRequest,
+    AudioTranscriptionResponse,
+    AudioTranslationRequest,
+    AudioTranslationResponse,
+    BatchRequest,
+    BatchResponse,
+    ChatCompletionsParams,
+    ChatCompletionsRequest,
+    ChatCompletionsResponse,
+    EmbeddingsRequest,
+    EmbeddingsResponse,
+    FileListResponse,
+    FileObject,
+    GenerationResponse,
+    GetAnalytics200Response,
+    GetAnalyticsRequest,
+    HealthzGet200Response,
+    ImageEditResponse,
+    ImageGenerationRequest,
+    ImageGenerationResponse,
+    ModelListResponse,
+    ModerationRequest,
+    ModerationResponse,
+    ResponsesRequest,
+    ResponsesResponse,
+    Root200Response,
+    VideoGenerationRequest,
+    VideoGenerationResponse,
+)
+
+if TYPE_CHECKING:
+    from ai_stats_generated.api.default_api import DefaultApi
+
+DEFAULT_BASE_URL = "https://api.ai-stats.phaseo.app/v1"
+
+
+def normalize_base_url(base_url: Optional[str]) -> str:
+    host = (base_url or DEFAULT_BASE_URL).rstrip("/")
+    # A bare origin such as "https://api.ai-stats.phaseo.app" targets the v1 gateway.
+    if httpx.URL(host).path in ("", "/"):
+        host = f"{host}/v1"
+    return host
+
+
+def with_model(payload: Any, model: str) -> Any:
+    return payload if model == payload.model else payload.model_copy(update={"model": model})
+
+
+class AIStats:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeout: Union[float, httpx.Timeout, None] = None,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        pool: PoolOptions = DEFAULT_POOL,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+        hedge: Optional[HedgePolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight_ttl: float = 2.0,
+        trusted_responses: bool = False,
+    ):
+        if not api_key:
+            raise ValueError("api_key is required")
+
+        host = normalize_base_url(base_url)
+        self._base_url = host
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        configuration = Configuration(host=host, access_token=api_key)
+        # Pool-wait metrics are taken per attempt, whichever transport is underneath.
+        self.pool_metrics = PoolMetrics()
+        network = PoolMetricsTransport(
+            transport or httpx.HTTPTransport(**pool.transport_options(limits, http2=http2)), self.pool_metrics, pool.max_streams
+        )
+        # Cached responses short-circuit retries and pacing; every other attempt goes through both.
+        stack = RetryTransport(network, retry, rate_limiter)
+        if cache is not None:
+            stack = CacheTransport(stack, cache)
+        # One long-lived pool serves both the generated API and the hand-written calls,
+        # so keep-alive connections are reused across every endpoint.
+        self._http = httpx.Client(
+            base_url=host,
+            headers=self._headers,
+            timeout=pool.timeout(timeout),
+            transport=stack,
+        )
+        self._client = HttpxApiClient(configuration, self._http)
+        # Gateway responses are built with ``model_construct``; request bodies are still validated.
+        self._client.trusted_responses = trusted_responses
+        self._hedge = hedge
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        # Per-(model, kind) latencies of hedged calls; drives the hedge delay.
+        self.latency = LatencyHistogram()
+        # Concurrent identical model-list/health/generation lookups share one call for a short while.
+        self._single_flight = SingleFlight(single_flight_ttl)
+
+    @cached_property
+    def _api(self) -> DefaultApi:
+        # The generated operations module is large; load it with the first call that needs it.
+        from ai_stats_generated.api.default_api import DefaultApi
+
+        return DefaultApi(api_client=self._client)
+
+    def pool_stats(self) -> PoolStats:
+        """Requests sent, connections opened, and time spent waiting for a pooled connection."""
+        return self.pool_metrics.stats()
+
+    def close(self) -> None:
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+        self._http.close()
+
+    def __enter__(self) -> "AIStats":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def generate_text(self, request: ChatCompletionsRequest | ChatCompletionsParams) -> ChatCompletionsResponse:
+        """Create a chat completion.
+
+        With a ``hedge`` policy a duplicate request (optionally to an alternate model) is raced
+        against a slow primary once it exceeds the model's observed latency percentile.
+        """
+        payload = request if isinstance(request, ChatCompletionsRequest) else ChatCompletionsRequest.from_dict({**request, "stream": False})
+        if self._hedge is None:
+            return self._post("/chat/completions", payload, ChatCompletionsResponse)
+        return run_hedged(
+            lambda model: self._post("/chat/completions", with_model(payload, model), ChatCompletionsResponse),
+            payload.model,
+            policy=self._hedge,
+            histogram=self.latency,
+            kind="response",
+            executor=self._executor(),
+        )
+
+    def stream_text(self, request: ChatCompletionsRequest | ChatCompletionsParams) -> Iterator[str]:
+        payload = request if isinstance(request, ChatCompletionsRequest) else ChatCompletionsRequest.from_dict({**request, "stream": True})
+        return self._stream_lines("/chat/completions", payload)
+
+    def map_chat_completions(
+        self,
+        requests: Iterable[ChatCompletionsRequest | ChatCompletionsParams],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[int, Union[ChatCompletionsResponse, Exception]]]:
+        """Run ``generate_text`` over ``requests`` with at most ``concurrency`` calls in flight.
+
+        Requests are pulled lazily from the iterable and share this client's connection pool.
+        Yields ``(index, response)`` in input order, or as they complete when ``ordered=False``.
+        With ``return_exceptions=True`` failures are yielded in place of the response.
+        """
+        return map_concurrent(
+            self.generate_text,
+            requests,
+            concurrency=concurrency,
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        )
+
+    def _post(self, path: str, payload: Any, klass: Type[M]) -> M:
+        resp = self._http.post(path, **json_request(payload))
+        raise_for_status(resp)
+        return load_model(klass, resp.content or b"{}", trusted=self._client.trusted_responses)
+
+    @contextmanager
+    def _open_stream(self, path: str, payload: Any) -> Iterator[httpx.Response]:
+        with self._http.stream("POST", path, **json_request(payload)) as resp:
+            if resp.is_error:
+                resp.read()
+                raise_for_status(resp)
+            yield resp
+
+    def _stream_lines(self, path: str, payload: Any) -> Iterator[str]:
+        with self._open_stream(path, payload) as resp:
+            for line in resp.iter_lines():
+                if line:
+                    yield line
+
+    def _stream_events(self, path: str, payload: Any) -> Iterator[ServerSentEvent]:
+        with self._open_stream(path, payload) as resp:
+            yield from iter_sse(resp.iter_bytes())
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(thread_name_prefix="ai-stats-hedge")
+        return self._hedge_executor
+
+    def _hedged_events(self, path: str, payload: Any) -> Iterator[ServerSentEvent]:
+        def open_stream(model: str) -> Tuple[Iterator[ServerSentEvent], Optional[ServerSentEvent]]:
+            events = self._stream_events(path, with_model(payload, model))
+            return events, next(events, None)
+
+        events, first = run_hedged(
+            open_stream,
+            payload.model,
+            policy=self._hedge,
+            histogram=self.latency,
+            kind="first_byte",
+            executor=self._executor(),
+            release=lambda opened: opened[0].close(),
+        )
+        yield from resume(first, events)
+
+    def stream_chat_completions(self, request: Optional[ChatCompletionsParams] = None, **params: Any) -> Iterator[ChatCompletionChunk]:
+        """Stream a chat completion, yielding each decoded chunk until ``[DONE]``.
+
+        Feed the chunks to ``ChatCompletionAccumulator`` to rebuild the final response.
+        """
+        payload = request if isinstance(request, ChatCompletionsRequest) else ChatCompletionsRequest.from_dict({**(request or {}), **params, "stream": True})
+        events = self._stream_events if self._hedge is None else self._hedged_events
+        return iter_json_events(events("/chat/completions", payload))
+
+    def generate_image(self, request: ImageGenerationRequest) -> ImageGenerationResponse:
+        return self._api.create_image(request)
+
+    def generate_image_edit(self, request: dict[str, Any]) -> ImageEditResponse:
+        return self._api.create_image_edit(**request)
+
+    def generate_moderation(self, request: ModerationRequest) -> ModerationResponse:
+        return self._api.create_moderation(request)
+
+    def generate_video(self, request: VideoGenerationRequest) -> VideoGenerationResponse:
+        return self._api.create_video(request)
+
+    def generate_embedding(self, body: EmbeddingsRequest | dict[str, Any]) -> EmbeddingsResponse:
+        payload = body if isinstance(body, EmbeddingsRequest) else EmbeddingsRequest.from_dict(body)
+        return self._api.create_embedding(payload)
+
+    def embed(self, body: EmbeddingsRequest | dict[str, Any]) -> EmbeddingMatrix:
+        """Embed ``body["input"]`` into one contiguous float32 matrix, alongside the usage.
+
+        Vectors are requested as base64 and decoded straight into a shared buffer instead of one
+        Python float per component; see ``EmbeddingMatrix``.
+        """
+        return self._embed(body)
+
+    def _embed(self, body: EmbeddingsRequest | dict[str, Any], extensions: Optional[Dict[str, Any]] = None) -> EmbeddingMatrix:
+        request = json_request(embeddings_request(body))
+        if extensions:
+            request["extensions"] = {**request["extensions"], **extensions}
+        resp = self._http.post("/embeddings", **request)
+        raise_for_status(resp)
+        return decode_embeddings(resp.content)
+
+    def embed_corpus(
+        self,
+        texts: Iterable[str],
+        model: str,
+        *,
+        batch_size: Optional[int] = DEFAULT_BATCH_SIZE,
+        token_budget: Optional[int] = None,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+        concurrency: int = 4,
+        dimensions: Optional[int] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+    ) -> Iterator[EmbeddingBlock]:
+        """Embed a corpus of any size through ``embed``, yielding ``EmbeddingBlock``s in corpus order.
+
+        Texts are pulled lazily and packed into batches of at most ``batch_size`` texts and
+        ``token_budget`` tokens (by ``count_tokens``; pass ``len`` for a character budget). At most
+        ``concurrency`` batches are in flight, so memory stays bounded whatever the corpus size. A
+        failed batch is retried on its own under ``retry``, which replaces the client's policy for
+        these requests; 5xx errors and lost responses are retried too, since embeddings are idempotent.
+        """
+        batches = batch_texts(texts, batch_size=batch_size, token_budget=token_budget, count_tokens=count_tokens)
+        embed = partial(self._embed, extensions=batch_retry(retry))
+        return embed_corpus(embed, batches, model, concurrency=concurrency, dimensions=dimensions)
+
+    def generate_transcription(
+        self,
+        body: AudioTranscriptionRequest,
+        *,
+        file: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> AudioTranscriptionResponse:
+        """Transcribe audio given by ``audio_url``/``audio_b64``, or streamed from ``file``.
+
+        ``file`` is base64-encoded into ``audio_b64`` chunk by chunk while it uploads, so long
+        recordings are never held in memory.
+        """
+        if file is None:
+            return self._api.create_transcription(**body)
+        upload = audio_upload(body, file, chunk_size=chunk_size, progress=progress)
+        return self._upload("/audio/transcriptions", upload, AudioTranscriptionResponse, body.get("model"))
+
+    def generate_speech(self, body: dict[str, Any]) -> Any:
+        payload = AudioSpeechRequest.from_dict(body)
+        return self._api.create_speech(payload)
+
+    def stream_speech(self, body: AudioSpeechRequest | dict[str, Any], *, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Stream synthesised audio, yielding bytes as the gateway sends them.
+
+        Only one chunk is held in memory at a time, so playback can start before synthesis finishes.
+        ``chunk_size`` re-slices the body into fixed-size chunks; by default chunks are passed on as
+        they arrive.
+        """
+        payload = body if isinstance(body, AudioSpeechRequest) else AudioSpeechRequest.from_dict(body)
+        with self._open_stream("/audio/speech", payload) as resp:
+            yield from resp.iter_bytes(chunk_size)
+
+    def save_speech(self, body: AudioSpeechRequest | dict[str, Any], destination: Destination, *, chunk_size: Optional[int] = None) -> int:
+        """Stream synthesised audio into a path or binary file object; return the number of bytes written."""
+        return write_chunks(self.stream_speech(body, chunk_size=chunk_size), destination)
+
+    def generate_translation(
+        self,
+        body: AudioTranslationRequest,
+        *,
+        file: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> AudioTranslationResponse:
+        """Translate audio into English; ``file`` streams as in ``generate_transcription``."""
+        if file is None:
+            return self._api.create_translation(**body)
+        upload = audio_upload(body, file, chunk_size=chunk_size, progress=progress)
+        return self._upload("/audio/translations", upload, AudioTranslationResponse, body.get("model"))
+
+    def generate_response(self, request: ResponsesRequest) -> ResponsesResponse:
+        payload = request if isinstance(request, ResponsesRequest) else ResponsesRequest.from_dict(request)
+        return self._post("/responses", payload, ResponsesResponse)
+
+    def stream_response(self, request: ResponsesRequest) -> Iterator[str]:
+        payload = request if isinstance(request, ResponsesRequest) else ResponsesRequest.from_dict({**request, "stream": True})
+        return self._stream_lines("/responses", payload)
+
+    def stream_response_events(self, request: ResponsesRequest | dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Stream a response, yielding each decoded server-sent event payload."""
+        payload = request if isinstance(request, ResponsesRequest) else ResponsesRequest.from_dict({**request, "stream": True})
+        return iter_json_events(self._stream_events("/responses", payload))
+
+    def create_batch(self, request: BatchRequest | dict[str, Any]) -> BatchResponse:
+        payload = request if isinstance(request, BatchRequest) else BatchRequest.from_dict(request)
+        return self._api.create_batch(payload)
+
+    def create_batches(
+        self,
+        requests: Iterable[BatchItem],
+        *,
+        endpoint: str = DEFAULT_ENDPOINT,
+        completion_window: str = "24h",
+        metadata: Optional[Dict[str, Any]] = None,
+        max_lines: int = MAX_BATCH_LINES,
+        max_bytes: int = MAX_BATCH_BYTES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+    ) -> Iterator[BatchShard]:
+        """Stream ``requests`` into JSONL batch input files and submit one batch per file.
+
+        Each request (a body, or a ``(custom_id, body)`` pair) is serialized once and streamed
+        straight into a ``/files`` upload; no temporary file is written and only one line is held
+        at a time. A new file is started whenever the next line would exceed ``max_lines`` lines or
+        ``max_bytes`` bytes. Yields a ``BatchShard`` as each file's batch is created.
+
+        The upload has no size up front, so it is sent with chunked transfer encoding and is not
+        retried once it has started. A failed shard cannot be resumed: the lines it had pulled from
+        ``requests`` are gone and the error ends the iteration. To restart, pass the requests after
+        the last ``BatchShard`` yielded with ``start=shard.start + shard.count`` (the original
+        ``start`` if nothing was yielded). ``start`` numbers the ``request-<n>`` ids of bare bodies and
+        the shards' ``start`` offsets, so they carry on from the first call instead of repeating.
+        """
+        lines = batch_lines(requests, endpoint, start)
+        for shard in shard_lines(lines, max_lines=max_lines, max_bytes=max_bytes, start=start):
+            file = self._upload("/files", shard_upload(shard, chunk_size=chunk_size), FileObject)
+            request = BatchRequest(input_file_id=file.id, endpoint=endpoint, completion_window=completion_window, metadata=metadata)
+            yield BatchShard(shard.start, shard.count, file, self.create_batch(request))
+
+    def get_batch(self, batch_id: str) -> BatchResponse:
+        return self._api.retrieve_batch(batch_id)
+
+    def list_files(self) -> FileListResponse:
+        return self._api.list_files()
+
+    def get_file(self, file_id: str) -> FileObject:
+        return self._api.retrieve_file(file_id)
+
+    def _upload(self, path: str, upload: MultipartUpload, klass: Type[M], model: Optional[str] = None) -> M:
+        base = self._http.build_request("POST", path, headers=upload.headers, extensions=request_extensions(model))
+        # The body is replayable, so retries resend the file from disk instead of from a buffered copy.
+        request = httpx.Request(base.method, base.url, headers=base.headers, stream=upload, extensions=base.extensions)
+        resp = self._http.send(request)
+        raise_for_status(resp)
+        return load_model(klass, resp.content, trusted=self._client.trusted_responses)
+
+    def upload_file(
+        self,
+        *,
+        purpose: Optional[str] = None,
+        file: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> FileObject:
+        """Upload ``file`` (a ``pathlib.Path``, file object, bytes or ``(filename, content)`` tuple).
+
+        The file is streamed from disk in ``chunk_size`` pieces; ``progress(sent, total)`` is called
+        as the body goes out.
+        """
+        if file is None:
+            raise ValueError("file is required")
+        fields = [("purpose", purpose)] if purpose else []
+        upload = MultipartUpload([*fields, ("file", as_file_part(file))], chunk_size=chunk_size, progress=progress)
+        return self._upload("/files", upload, FileObject)
+
+    def get_models(self, params: dict[str, Any] | None = None) -> ModelListResponse:
+        params = params or {}
+        return self._single_flight.do(flight_key("list_models", params), lambda: self._api.list_models(**params))
+
+    def get_health(self) -> HealthzGet200Response:
+        return self._single_flight.do(flight_key("healthz", {}), self._api.healthz)
+
+    def get_analytics(self, request: GetAnalyticsRequest | dict[str, Any]) -> GetAnalytics200Response:
+        payload = request if isinstance(request, GetAnalyticsRequest) else GetAnalyticsRequest.from_dict(request)
+        return self._api.get_analytics(payload)
+
+    def get_root(self) -> Root200Response:
+        return self._api.root()
+
+    def get_generation(self, generation_id: str) -> GenerationResponse:
+        # A generation changes while it runs, so only concurrent lookups are shared, never reused.
+        return self._single_flight.do(
+            flight_key("get_generation", {"id": generation_id}), lambda: self._api.get_generation(id=generation_id), ttl=0
+        )
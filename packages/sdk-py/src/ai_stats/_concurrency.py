@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable as AsyncIterableABC
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+Outcome = Tuple[int, Union[R, BaseException]]
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def _settle(index: int, future: Future, return_exceptions: bool) -> Outcome:
+    try:
+        return index, future.result()
+    except Exception as exc:
+        if not return_exceptions:
+            raise
+        return index, exc
+
+
+def map_concurrent(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    concurrency: int,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> Iterator[Outcome]:
+    """Run ``fn`` over ``items`` on a thread pool with at most ``concurrency`` calls in flight.
+
+    Inputs are pulled lazily, so memory is bounded by the window rather than the input size.
+    Yields ``(index, result)`` pairs in input order, or as they complete when ``ordered`` is false.
+    """
+    _check_concurrency(concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ai-stats")
+    try:
+        if ordered:
+            window: deque[Tuple[int, Future]] = deque()
+            for index, item in enumerate(items):
+                window.append((index, executor.submit(fn, item)))
+                if len(window) >= concurrency:
+                    yield _settle(*window.popleft(), return_exceptions)
+            while window:
+                yield _settle(*window.popleft(), return_exceptions)
+        else:
+            in_flight: Dict[Future, int] = {}
+            for index, item in enumerate(items):
+                in_flight[executor.submit(fn, item)] = index
+                if len(in_flight) >= concurrency:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield _settle(in_flight.pop(future), future, return_exceptions)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _settle(in_flight.pop(future), future, return_exceptions)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def _aenumerate(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[Tuple[int, T]]:
+    index = 0
+    if isinstance(items, AsyncIterableABC):
+        async for item in items:
+            yield index, item
+            index += 1
+    else:
+        for item in items:
+            yield index, item
+            index += 1
+
+
+def _settle_task(index: int, task: asyncio.Task, return_exceptions: bool) -> Outcome:
+    exc = task.exception()
+    if exc is None:
+        return index, task.result()
+    if not return_exceptions or not isinstance(exc, Exception):
+        raise exc
+    return index, exc
+
+
+async def amap_concurrent(
+    fn: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    *,
+    concurrency: int,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> AsyncIterator[Outcome]:
+    """Async counterpart of ``map_concurrent``: a semaphore-style window of tasks on one event loop."""
+    _check_concurrency(concurrency)
+    tasks: Dict[asyncio.Task, int] = {}
+    window: deque[Tuple[int, asyncio.Task]] = deque()
+    try:
+        async for index, item in _aenumerate(items):
+            task = asyncio.ensure_future(fn(item))
+            if ordered:
+                window.append((index, task))
+                if len(window) >= concurrency:
+                    head_index, head = window.popleft()
+                    await asyncio.wait({head})
+                    yield _settle_task(head_index, head, return_exceptions)
+            else:
+                tasks[task] = index
+                if len(tasks) >= concurrency:
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for finished in done:
+                        yield _settle_task(tasks.pop(finished), finished, return_exceptions)
+        while window:
+            head_index, head = window.popleft()
+            await asyncio.wait({head})
+            yield _settle_task(head_index, head, return_exceptions)
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                yield _settle_task(tasks.pop(finished), finished, return_exceptions)
+    finally:
+        leftovers: list[Any] = [task for _, task in window] + list(tasks)
+        for task in leftovers:
+            task.cancel()
+        if leftovers:
+            await asyncio.gather(*leftovers, return_exceptions=True)
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import decimal
+import json
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from ai_stats_generated import ApiClient, Configuration, rest
+import ai_stats_generated.models
+from dateutil.parser import parse
+from pydantic import BaseModel
+import pydantic_core
+
+from ._serialize import encode_json, validates_in_one_pass
+
+Deserializer = Callable[[Any], Any]
+M = TypeVar("M", bound=BaseModel)
+
+_JSON_CONTENT = re.compile(r"^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)", re.IGNORECASE)
+_TEXT_CONTENT = re.compile(r"^text\/[a-z.+-]+\s*(;|$)", re.IGNORECASE)
+_LIST_TYPE = re.compile(r"List\[(.*)]")
+_DICT_TYPE = re.compile(r"Dict\[([^,]*), (.*)]")
+
+
+def _primitive(klass: type) -> Deserializer:
+    def load(data: Any) -> Any:
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return str(data)
+        except TypeError:
+            return data
+
+    return load
+
+
+def _parsed(kind: str, convert: Callable[[str], Any]) -> Deserializer:
+    def load(data: Any) -> Any:
+        try:
+            return convert(data)
+        except ValueError:
+            raise rest.ApiException(status=0, reason=f"Failed to parse `{data}` as {kind} object")
+
+    return load
+
+
+def _enum(klass: type) -> Deserializer:
+    def load(data: Any) -> Any:
+        try:
+            return klass(data)
+        except ValueError:
+            raise rest.ApiException(status=0, reason=f"Failed to parse `{data}` as `{klass}`")
+
+    return load
+
+
+_NATIVE: dict[str, Deserializer] = {
+    "int": _primitive(int),
+    "long": _primitive(int),
+    "float": _primitive(float),
+    "str": _primitive(str),
+    "bool": _primitive(bool),
+    "bytes": _primitive(bytes),
+    "object": lambda data: data,
+    "date": _parsed("date", lambda value: parse(value).date()),
+    "datetime": _parsed("datetime", parse),
+    "decimal": decimal.Decimal,
+}
+
+
+def _nullable(load: Deserializer) -> Deserializer:
+    return lambda data: None if data is None else load(data)
+
+
+@lru_cache(maxsize=None)
+def compile_type(type_string: str) -> Deserializer:
+    """Compile an OpenAPI type string (``"List[Model]"``, ``"Dict[str, int]"``, ``"Model"``) into a loader.
+
+    Mirrors ``ApiClient.__deserialize`` but resolves the string once; later calls reuse the closure.
+    """
+    if type_string.startswith("List["):
+        match = _LIST_TYPE.match(type_string)
+        assert match is not None, "Malformed List type definition"
+        item = compile_type(match.group(1))
+        return _nullable(lambda data: [item(value) for value in data])
+    if type_string.startswith("Dict["):
+        match = _DICT_TYPE.match(type_string)
+        assert match is not None, "Malformed Dict type definition"
+        value_loader = compile_type(match.group(2))
+        return _nullable(lambda data: {key: value_loader(value) for key, value in data.items()})
+    if type_string in _NATIVE:
+        return _nullable(_NATIVE[type_string])
+    klass = getattr(ai_stats_generated.models, type_string)
+    if issubclass(klass, Enum):
+        return _nullable(_enum(klass))
+    return _nullable(klass.from_dict)
+
+
+@lru_cache(maxsize=None)
+def response_model(response_type: str) -> Optional[Type[BaseModel]]:
+    """The generated model named ``response_type``, or ``None`` for lists, dicts, primitives and enums."""
+    if response_type.startswith(("List[", "Dict[")) or response_type in _NATIVE:
+        return None
+    klass = getattr(ai_stats_generated.models, response_type, None)
+    return klass if isinstance(klass, type) and issubclass(klass, BaseModel) else None
+
+
+def _construct_loader(annotation: Any) -> Optional[Deserializer]:
+    """Loader turning trusted JSON data into ``annotation`` without validation, or ``None`` for as-is."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _construct_loader(get_args(annotation)[0])
+    if origin is Union:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _construct_loader(members[0]) if len(members) == 1 else None
+    if origin in (list, List):
+        item = _construct_loader(get_args(annotation)[0])
+        return None if item is None else lambda data: [None if value is None else item(value) for value in data] if isinstance(data, list) else data
+    if origin in (dict, Dict):
+        value_loader = _construct_loader(get_args(annotation)[1])
+        return None if value_loader is None else lambda data: {key: None if value is None else value_loader(value) for key, value in data.items()} if isinstance(data, dict) else data
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, Enum):
+        return _lenient_enum(annotation)
+    if issubclass(annotation, BaseModel):
+        # oneOf/anyOf wrappers must inspect their payload to pick a schema, so they keep validating.
+        if "actual_instance" in annotation.model_fields:
+            return annotation.from_dict
+        return lambda data: compile_construct(annotation)(data)
+    return None
+
+
+def _lenient_enum(klass: type) -> Deserializer:
+    def load(data: Any) -> Any:
+        try:
+            return klass(data)
+        except ValueError:
+            return data
+
+    return load
+
+
+@lru_cache(maxsize=None)
+def compile_construct(klass: Type[M]) -> Callable[[Any], M]:
+    """Build ``klass`` from trusted JSON data with ``model_construct``, recursing into nested models.
+
+    No field is validated; only nested models and enums are materialised so attribute access
+    behaves like a validated instance. Data of an unexpected shape is kept as sent.
+    """
+    fields = [(name, field.alias or name, _construct_loader(field.annotation)) for name, field in klass.model_fields.items()]
+    known = {key for _, key, _ in fields}
+    extras = "additional_properties" in klass.model_fields
+
+    def construct(data: Any) -> M:
+        if not isinstance(data, dict):
+            return data
+        values = {}
+        for name, key, load in fields:
+            if key in data:
+                value = data[key]
+                values[name] = value if load is None or value is None else load(value)
+        if extras:
+            values["additional_properties"] = {key: value for key, value in data.items() if key not in known}
+        return klass.model_construct(**values)
+
+    return construct
+
+
+def _holds_model(annotation: Any) -> bool:
+    if get_origin(annotation) is not None:
+        return any(_holds_model(arg) for arg in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _nested_fields(klass: type) -> Tuple[str, ...]:
+    return tuple(name for name, field in klass.model_fields.items() if _holds_model(field.annotation))
+
+
+def _set_every_field(value: Any) -> None:
+    """Mark every field of each model in ``value`` as set, as ``from_dict`` does by passing them all.
+
+    ``to_dict`` writes nullable fields that are set and ``None``, so this keeps its output the same.
+    """
+    if isinstance(value, BaseModel):
+        object.__setattr__(value, "__pydantic_fields_set__", set(type(value).model_fields))
+        for name in _nested_fields(type(value)):
+            _set_every_field(getattr(value, name))
+    elif isinstance(value, list):
+        for item in value:
+            _set_every_field(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _set_every_field(item)
+
+
+def load_model(klass: Type[M], raw: bytes | str, *, trusted: bool = False) -> M:
+    """Decode a JSON response body straight into ``klass``.
+
+    Models that validate in one pass go through ``model_validate_json`` (pydantic-core parses and
+    validates the whole tree without intermediate dicts); the rest fall back to ``from_dict`` over
+    pydantic-core's JSON parser. ``trusted`` skips validation and builds the tree with
+    ``compile_construct``.
+    """
+    if trusted:
+        return compile_construct(klass)(pydantic_core.from_json(raw))
+    if validates_in_one_pass(klass):
+        model = klass.model_validate_json(raw)
+        _set_every_field(model)
+        return model
+    return klass.from_dict(pydantic_core.from_json(raw))
+
+
+class CompiledApiClient(ApiClient):
+    """``ApiClient`` that encodes request bodies to wire bytes in one step and decodes responses
+    with ``compile_type`` instead of per-call reflection.
+
+    Set ``trusted_responses`` to build response models with ``model_construct`` instead of validating.
+    """
+
+    trusted_responses = False
+
+    def __init__(self, configuration: Optional[Configuration] = None, rest_client: Any = None) -> None:
+        # ``ApiClient.__init__`` always builds a urllib3 ``RESTClientObject``; the SDK sends requests over
+        # httpx, so only a ``rest_client`` passed in (or none at all) is kept.
+        self.configuration = configuration if configuration is not None else Configuration.get_default()
+        self.rest_client = rest_client
+        self.default_headers = {}
+        self.cookie = None
+        self.user_agent = "OpenAPI-Generator/0.1.0/python"
+        self.client_side_validation = self.configuration.client_side_validation
+
+    def param_serialize(
+        self,
+        method,
+        resource_path,
+        path_params=None,
+        query_params=None,
+        header_params=None,
+        body=None,
+        post_params=None,
+        files=None,
+        auth_settings=None,
+        collection_formats=None,
+        _host=None,
+        _request_auth=None,
+    ):
+        method, url, headers, _, post_params = super().param_serialize(
+            method,
+            resource_path,
+            path_params=path_params,
+            query_params=query_params,
+            header_params=header_params,
+            post_params=post_params,
+            files=files,
+            auth_settings=auth_settings,
+            collection_formats=collection_formats,
+            _host=_host,
+            _request_auth=_request_auth,
+        )
+        return method, url, headers, None if body is None else encode_json(body), post_params
+
+    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]) -> Any:
+        if not isinstance(response_type, str):
+            return super().deserialize(response_text, response_type, content_type)
+        if content_type is None:
+            try:
+                data = json.loads(response_text)
+            except ValueError:
+                data = response_text
+        elif _JSON_CONTENT.match(content_type):
+            if response_text == "":
+                data = ""
+            else:
+                klass = response_model(response_type)
+                if klass is not None:
+                    return load_model(klass, response_text, trusted=self.trusted_responses)
+                data = json.loads(response_text)
+        elif _TEXT_CONTENT.match(content_type):
+            data = response_text
+        else:
+            raise rest.ApiException(status=0, reason=f"Unsupported content type: {content_type}")
+        return compile_type(response_type)(data)
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import base64
+import sys
+from array import array
+from collections.abc import AsyncIterable as AsyncIterableABC
+from dataclasses import replace
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import pydantic_core
+
+from ._concurrency import amap_concurrent, map_concurrent
+from ._retry import RETRY_EXTENSION, RetryPolicy
+from ._types import EmbeddingsRequest
+
+if TYPE_CHECKING:
+    from ai_stats_generated.models.usage import Usage
+
+# The gateway sends base64 embeddings as little-endian float32.
+FLOAT32 = "<f4"
+
+DEFAULT_BATCH_SIZE = 128
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    # Imported on first decode rather than with the client: NumPy is optional and slow to import.
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def embeddings_request(body: Union[EmbeddingsRequest, Dict[str, Any]]) -> EmbeddingsRequest:
+    """``body`` as an ``EmbeddingsRequest`` asking for base64-encoded vectors."""
+    if isinstance(body, EmbeddingsRequest):
+        return body.model_copy(update={"encoding_format": "base64"})
+    return EmbeddingsRequest.from_dict({**body, "encoding_format": "base64"})
+
+
+def _row_bytes(embedding: Union[str, Sequence[float]]) -> bytes:
+    if isinstance(embedding, str):
+        return base64.b64decode(embedding)
+    # Upstreams that ignore ``encoding_format`` still send float lists.
+    floats = array("f", embedding)
+    if sys.byteorder == "big":
+        floats.byteswap()
+    return floats.tobytes()
+
+
+class EmbeddingMatrix:
+    """Embeddings of one request, as a single contiguous float32 matrix in input order.
+
+    With NumPy installed, ``vectors`` is a writable ``numpy.ndarray`` of shape ``(rows, dimensions)``
+    viewing the decoded buffer without a copy. Without it, ``vectors`` is a flat ``array.array("f")``
+    and rows are ``memoryview`` slices of it. No per-float Python objects are created either way.
+    """
+
+    __slots__ = ("vectors", "rows", "dimensions", "model", "usage")
+
+    def __init__(self, vectors: Any, rows: int, dimensions: int, model: Optional[str] = None, usage: Optional["Usage"] = None) -> None:
+        self.vectors = vectors
+        self.rows = rows
+        self.dimensions = dimensions
+        self.model = model
+        self.usage = usage
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, row: int) -> Any:
+        if not isinstance(self.vectors, array):
+            return self.vectors[row]
+        row = range(len(self))[row]
+        return memoryview(self.vectors)[row * self.dimensions : (row + 1) * self.dimensions]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[row] for row in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"EmbeddingMatrix({len(self)}x{self.dimensions}, model={self.model!r})"
+
+    def tolist(self) -> List[List[float]]:
+        return [list(row) if isinstance(self.vectors, array) else row.tolist() for row in self]
+
+
+def decode_embeddings(raw: Union[bytes, str]) -> EmbeddingMatrix:
+    """Decode an ``/embeddings`` response body into an ``EmbeddingMatrix``.
+
+    Each base64 row is decoded straight into one shared buffer, which NumPy then views in place.
+    """
+    from ai_stats_generated.models.usage import Usage
+
+    body = pydantic_core.from_json(raw)
+    data = body.get("data") or []
+    if any(item.get("index", position) != position for position, item in enumerate(data)):
+        data = sorted(data, key=lambda item: item["index"])
+    buffer = bytearray()
+    width = None
+    for item in data:
+        row = _row_bytes(item["embedding"])
+        if width is None:
+            width = len(row)
+        elif len(row) != width:
+            raise ValueError("embedding rows have different dimensions")
+        buffer += row
+    dimensions = (width or 0) // 4
+    numpy = _numpy()
+    if numpy is not None:
+        vectors = numpy.frombuffer(buffer, dtype=FLOAT32).reshape(len(data), dimensions)
+    else:
+        vectors = array("f")
+        vectors.frombytes(buffer)
+        if sys.byteorder == "big":
+            vectors.byteswap()
+    usage = body.get("usage")
+    return EmbeddingMatrix(vectors, len(data), dimensions, body.get("model"), Usage.from_dict(usage) if usage is not None else None)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for packing batches: about four characters per token."""
+    return len(text) // 4 + 1
+
+
+class _Packer:
+    """Groups texts into batches of at most ``batch_size`` texts and ``token_budget`` tokens.
+
+    A text over the budget on its own still gets a batch of its own.
+    """
+
+    def __init__(self, batch_size: Optional[int], token_budget: Optional[int], count_tokens: Callable[[str], int]) -> None:
+        if batch_size is None and token_budget is None:
+            raise ValueError("set batch_size, token_budget or both")
+        self.batch_size = batch_size
+        self.token_budget = token_budget
+        self.count_tokens = count_tokens
+        self.start = 0
+        self.batch: List[str] = []
+        self.tokens = 0
+
+    def add(self, text: str) -> Optional[Tuple[int, List[str]]]:
+        """Add ``text``; return the ``(start, texts)`` batch it closed, if any."""
+        closed = None
+        cost = self.count_tokens(text) if self.token_budget is not None else 0
+        if self.batch and self.token_budget is not None and self.tokens + cost > self.token_budget:
+            closed = self.flush()
+        self.batch.append(text)
+        self.tokens += cost
+        if self.batch_size is not None and len(self.batch) >= self.batch_size:
+            # Full batches go out as soon as they fill, so at most one batch closes per text.
+            closed = self.flush()
+        return closed
+
+    def flush(self) -> Optional[Tuple[int, List[str]]]:
+        if not self.batch:
+            return None
+        closed = (self.start, self.batch)
+        self.start += len(self.batch)
+        self.batch, self.tokens = [], 0
+        return closed
+
+
+def batch_texts(
+    texts: Iterable[str],
+    *,
+    batch_size: Optional[int] = DEFAULT_BATCH_SIZE,
+    token_budget: Optional[int] = None,
+    count_tokens: Callable[[str], int] = estimate_tokens,
+) -> Iterator[Tuple[int, List[str]]]:
+    """Pull ``texts`` lazily into ``(start, texts)`` batches; ``start`` is the corpus index of the first."""
+    packer = _Packer(batch_size, token_budget, count_tokens)
+    for text in texts:
+        closed = packer.add(text)
+        if closed is not None:
+            yield closed
+    closed = packer.flush()
+    if closed is not None:
+        yield closed
+
+
+async def abatch_texts(
+    texts: Union[Iterable[str], AsyncIterable[str]],
+    *,
+    batch_size: Optional[int] = DEFAULT_BATCH_SIZE,
+    token_budget: Optional[int] = None,
+    count_tokens: Callable[[str], int] = estimate_tokens,
+) -> AsyncIterator[Tuple[int, List[str]]]:
+    """``batch_texts`` over a sync or async iterable."""
+    if not isinstance(texts, AsyncIterableABC):
+        for closed in batch_texts(texts, batch_size=batch_size, token_budget=token_budget, count_tokens=count_tokens):
+            yield closed
+        return
+    packer = _Packer(batch_size, token_budget, count_tokens)
+    async for text in texts:
+        closed = packer.add(text)
+        if closed is not None:
+            yield closed
+    closed = packer.flush()
+    if closed is not None:
+        yield closed
+
+
+class EmbeddingBlock(NamedTuple):
+    """Vectors for the corpus texts ``start`` to ``start + len(embeddings)``."""
+
+    start: int
+    embeddings: EmbeddingMatrix
+
+
+def batch_retry(policy: Optional[RetryPolicy]) -> Dict[str, Any]:
+    """Request extensions sending an ``embed_corpus`` batch under ``policy`` instead of the client's.
+
+    Embedding a text again gives the same vectors, so a batch that hit a 5xx or lost its response is
+    resent even though ``/embeddings`` is a billed path. The retries happen in the transport only,
+    so they are not multiplied by a second loop above it, and ``deadline`` still bounds each batch.
+    """
+    return {RETRY_EXTENSION: None if policy is None else replace(policy, replay_generations=True)}
+
+
+def _body(model: str, texts: List[str], dimensions: Optional[int]) -> Dict[str, Any]:
+    body: Dict[str, Any] = {"model": model, "input": texts}
+    if dimensions is not None:
+        body["dimensions"] = dimensions
+    return body
+
+
+def embed_corpus(
+    embed: Callable[[Dict[str, Any]], EmbeddingMatrix],
+    batches: Iterable[Tuple[int, List[str]]],
+    model: str,
+    *,
+    concurrency: int,
+    dimensions: Optional[int] = None,
+) -> Iterator[EmbeddingBlock]:
+    """Send ``batches`` through ``embed`` with at most ``concurrency`` in flight; yield blocks in order.
+
+    Each batch is one ``embed`` call; retries are left to ``embed``'s transport (see ``batch_retry``),
+    so a failed batch is resent on its own and batches that succeeded are never sent again.
+    """
+
+    def run(batch: Tuple[int, List[str]]) -> EmbeddingBlock:
+        start, texts = batch
+        return EmbeddingBlock(start, embed(_body(model, texts, dimensions)))
+
+    for _, block in map_concurrent(run, batches, concurrency=concurrency):
+        yield block
+
+
+async def aembed_corpus(
+    embed: Callable[[Dict[str, Any]], Awaitable[EmbeddingMatrix]],
+    batches: AsyncIterable[Tuple[int, List[str]]],
+    model: str,
+    *,
+    concurrency: int,
+    dimensions: Optional[int] = None,
+) -> AsyncIterator[EmbeddingBlock]:
+    """Async counterpart of ``embed_corpus``."""
+
+    async def run(batch: Tuple[int, List[str]]) -> EmbeddingBlock:
+        start, texts = batch
+        return EmbeddingBlock(start, await embed(_body(model, texts, dimensions)))
+
+    async for _, block in amap_concurrent(run, batches, concurrency=concurrency):
+        yield block
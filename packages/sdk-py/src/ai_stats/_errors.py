@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import httpx
+
+
+class AIStatsError(httpx.HTTPStatusError):
+    """Raised when the gateway answers with a non-2xx status.
+
+    Subclasses ``httpx.HTTPStatusError`` so existing ``except`` clauses keep working,
+    and carries the gateway error code plus the request id for support tickets.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        request: httpx.Request,
+        response: httpx.Response,
+        code: Optional[str] = None,
+        request_id: Optional[str] = None,
+        attribution: Optional[str] = None,
+        body: Any = None,
+    ) -> None:
+        super().__init__(message, request=request, response=response)
+        self.status = response.status_code
+        self.code = code
+        self.request_id = request_id
+        self.attribution = attribution
+        self.body = body
+
+
+def _error_fields(body: Any) -> tuple[Optional[str], Optional[str]]:
+    if not isinstance(body, dict):
+        return None, None
+    error = body.get("error")
+    if isinstance(error, dict):
+        # OpenAI-style envelope: {"error": {"code": ..., "message": ...}}
+        code = error.get("code") or error.get("type")
+        return (str(code) if code is not None else None), error.get("message")
+    return (str(error) if error is not None else None), body.get("message")
+
+
+def raise_for_status(response: httpx.Response) -> None:
+    """Raise ``AIStatsError`` for an error response whose body has already been read."""
+    if not response.is_error:
+        return
+    try:
+        body: Any = response.json()
+    except ValueError:
+        body = response.text or None
+    code, detail = _error_fields(body)
+    message = f"{response.status_code} {response.reason_phrase}"
+    if detail:
+        message = f"{message}: {detail}"
+    raise AIStatsError(
+        message,
+        request=response.request,
+        response=response,
+        code=code,
+        request_id=response.headers.get("X-Gateway-Request-Id"),
+        attribution=response.headers.get("X-Gateway-Error-Attribution"),
+        body=body,
+    )
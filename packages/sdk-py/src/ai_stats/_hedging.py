@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+from . import _catalog
+
+T = TypeVar("T")
+
+
+class LatencyHistogram:
+    """Per-key latency histogram with log-spaced buckets.
+
+    Memory is fixed per key (one counter per bucket) and percentiles are accurate to the bucket
+    ``growth`` factor, which is plenty for choosing a hedge delay. Thread-safe.
+    """
+
+    def __init__(self, *, min_latency: float = 0.001, max_latency: float = 600.0, growth: float = 1.15) -> None:
+        if min_latency <= 0 or max_latency <= min_latency or growth <= 1:
+            raise ValueError("expected 0 < min_latency < max_latency and growth > 1")
+        self._min = min_latency
+        self._log_growth = math.log(growth)
+        self._growth = growth
+        self._size = int(math.ceil(math.log(max_latency / min_latency) / self._log_growth)) + 1
+        self._lock = threading.Lock()
+        self._counts: Dict[Hashable, List[int]] = {}
+        self._totals: Dict[Hashable, int] = {}
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self._min:
+            return 0
+        return min(self._size - 1, int(math.log(seconds / self._min) / self._log_growth) + 1)
+
+    def record(self, key: Hashable, seconds: float) -> None:
+        index = self._bucket(seconds)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * self._size
+            counts[index] += 1
+            self._totals[key] = self._totals.get(key, 0) + 1
+
+    def count(self, key: Hashable) -> int:
+        return self._totals.get(key, 0)
+
+    def percentile(self, key: Hashable, q: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding the ``q`` quantile (0-1), or ``None`` without samples."""
+        with self._lock:
+            counts = self._counts.get(key)
+            total = self._totals.get(key, 0)
+            if not counts:
+                return None
+            rank = max(1, math.ceil(q * total))
+            seen = 0
+            for index, count in enumerate(counts):
+                seen += count
+                if seen >= rank:
+                    return self._min * self._growth**index
+        return None
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to fire a duplicate request.
+
+    The delay is the ``percentile`` latency observed for the model, clamped to
+    ``[min_delay, max_delay]``; until ``min_samples`` responses have been seen ``initial_delay`` is used.
+    ``alternates`` maps a model id to the model the hedge should go to instead of repeating the
+    original; both must be in ``MODEL_CATALOG``.
+    """
+
+    percentile: float = 0.95
+    min_samples: int = 20
+    initial_delay: float = 2.0
+    min_delay: float = 0.05
+    max_delay: float = 30.0
+    alternates: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        unknown = [model for pair in self.alternates.items() for model in pair if model not in _catalog.MODEL_CATALOG]
+        if unknown:
+            raise ValueError(f"unknown model ids in alternates: {', '.join(sorted(set(unknown)))}")
+
+    def delay(self, histogram: LatencyHistogram, key: Hashable) -> float:
+        if histogram.count(key) < self.min_samples:
+            return self.initial_delay
+        observed = histogram.percentile(key, self.percentile) or self.initial_delay
+        return min(self.max_delay, max(self.min_delay, observed))
+
+    def alternate(self, model: str) -> str:
+        return self.alternates.get(model, model)
+
+
+def _timed(fn: Callable[[str], T], histogram: LatencyHistogram, kind: str) -> Callable[[str], T]:
+    def attempt(model: str) -> T:
+        started = time.monotonic()
+        result = fn(model)
+        histogram.record((model, kind), time.monotonic() - started)
+        return result
+
+    return attempt
+
+
+def run_hedged(
+    fn: Callable[[str], T],
+    model: str,
+    *,
+    policy: HedgePolicy,
+    histogram: LatencyHistogram,
+    kind: str,
+    executor: Executor,
+    release: Optional[Callable[[T], None]] = None,
+) -> T:
+    """Call ``fn(model)``; if it has not returned after the hedge delay, race a second call.
+
+    The first successful result wins. The loser is cancelled if it has not started, otherwise its
+    result is handed to ``release`` (e.g. to close a stream) once it arrives. If both calls fail the
+    primary's error is raised.
+    """
+    attempt = _timed(fn, histogram, kind)
+    primary = executor.submit(attempt, model)
+    done, _ = wait([primary], timeout=policy.delay(histogram, (model, kind)))
+    if done:
+        return primary.result()
+    hedge = executor.submit(attempt, policy.alternate(model))
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        winner = next((future for future in done if future.exception() is None), None)
+        if winner is not None:
+            for loser in (primary, hedge):
+                if loser is not winner:
+                    _discard(loser, release)
+            return winner.result()
+    return primary.result()
+
+
+def _discard(future: Future, release: Optional[Callable[[Any], None]]) -> None:
+    if future.cancel() or release is None:
+        return
+
+    def on_done(finished: Future) -> None:
+        if not finished.cancelled() and finished.exception() is None:
+            release(finished.result())
+
+    future.add_done_callback(on_done)
+
+
+async def arun_hedged(
+    fn: Callable[[str], Awaitable[T]],
+    model: str,
+    *,
+    policy: HedgePolicy,
+    histogram: LatencyHistogram,
+    kind: str,
+    release: Optional[Callable[[T], Awaitable[None]]] = None,
+) -> T:
+    """Async counterpart of ``run_hedged``; the losing task is cancelled outright.
+
+    A cancelled attempt is recorded with the time it ran, a lower bound on its latency, so slow
+    primaries still reach the histogram as they do in ``run_hedged``.
+    """
+
+    async def attempt(target: str) -> T:
+        started = time.monotonic()
+        try:
+            result = await fn(target)
+        except asyncio.CancelledError:
+            histogram.record((target, kind), time.monotonic() - started)
+            raise
+        histogram.record((target, kind), time.monotonic() - started)
+        return result
+
+    primary = asyncio.ensure_future(attempt(model))
+    tasks: Tuple[asyncio.Future, ...] = (primary,)
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=policy.delay(histogram, (model, kind)))
+        if done:
+            return primary.result()
+        tasks = (primary, asyncio.ensure_future(attempt(policy.alternate(model))))
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    # A loser that finished in the same tick still holds an open result.
+                    for loser in done:
+                        if loser is not task and loser.exception() is None and release is not None:
+                            await release(loser.result())
+                    return task.result()
+        return primary.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def resume(first: Optional[T], rest: Iterator[T]) -> Iterator[T]:
+    """Yield an already-read ``first`` item followed by ``rest``, closing ``rest`` when done."""
+    try:
+        if first is not None:
+            yield first
+        yield from rest
+    finally:
+        rest.close()
+
+
+async def aresume(first: Optional[T], rest: AsyncGenerator[T, None]) -> AsyncIterator[T]:
+    try:
+        if first is not None:
+            yield first
+        async for item in rest:
+            yield item
+    finally:
+        await rest.aclose()
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, List, Mapping, Tuple
+
+
+def attach(module_name: str, exports: Mapping[str, Tuple[str, str]]) -> Tuple[Any, Any]:
+    """PEP 562 ``__getattr__``/``__dir__`` resolving ``exports`` (name -> (module, attribute)) on first access.
+
+    Resolved names are cached on the module, so each one costs a single import.
+    """
+    module = sys.modules[module_name]
+    namespace = module.__dict__
+    package = module.__spec__.parent if module.__spec__ is not None else module_name
+
+    def __getattr__(name: str) -> Any:
+        try:
+            target, attribute = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(target, package), attribute)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
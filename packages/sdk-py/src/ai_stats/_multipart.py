@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import json
+import mimetypes
+import os
+import secrets
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+Progress = Callable[[int, Optional[int]], None]
+
+
+@dataclass(frozen=True)
+class FilePart:
+    """A file field of a multipart upload, read from ``source`` in bounded chunks while sending.
+
+    ``source`` is a path or a binary file object, sent from its current position. ``source`` can also
+    be an iterable of bytes produced while sending. Iterables and file objects that cannot seek
+    (pipes, ``sys.stdin.buffer``, sockets) have no size up front: the body then goes out with chunked
+    transfer encoding and can only be sent once.
+    ``encode_base64`` sends the content as base64 text, for fields such as ``audio_b64``.
+    """
+
+    source: Union[str, "os.PathLike[str]", BinaryIO, Iterable[bytes]]
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    encode_base64: bool = False
+
+
+def as_file_part(file: Any) -> FilePart:
+    """Coerce what ``httpx`` accepts for ``files=`` (content, a file object or a
+    ``(filename, content[, content_type])`` tuple), or a ``pathlib.Path``, into a ``FilePart``."""
+    if isinstance(file, FilePart):
+        return file
+    if isinstance(file, tuple):
+        filename, content, *rest = file
+        return FilePart(as_file_part(content).source, filename, rest[0] if rest else None)
+    if isinstance(file, str):
+        file = file.encode()
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        return FilePart(io.BytesIO(bytes(file)))
+    return FilePart(file)
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _coalesce(pieces: Iterable[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Regroup small pieces into chunks of about ``chunk_size`` bytes."""
+    buffer = bytearray()
+    for piece in pieces:
+        buffer += piece
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _read_full(file: BinaryIO, size: int) -> bytes:
+    """Read ``size`` bytes, or fewer only at end of file; pipes and sockets may return short reads."""
+    chunk = file.read(size)
+    if not chunk or len(chunk) == size:
+        return chunk
+    buffer = bytearray(chunk)
+    while len(buffer) < size:
+        more = file.read(size - len(buffer))
+        if not more:
+            break
+        buffer += more
+    return bytes(buffer)
+
+
+class _Part:
+    """One field: its header bytes, its encoded size, and a way to stream its body again."""
+
+    def __init__(self, name: str, value: Union[str, FilePart]) -> None:
+        disposition = f'form-data; name="{_quote(name)}"'
+        self.header = f"Content-Disposition: {disposition}\r\n\r\n".encode()
+        if isinstance(value, str):
+            self.body: Optional[bytes] = value.encode()
+            self.size = len(self.body)
+            return
+        self.body = None
+        self.file = value
+        source = value.source
+        self.size: Optional[int]
+        if not isinstance(source, (str, os.PathLike)) and not hasattr(source, "read"):
+            if value.encode_base64:
+                raise ValueError("base64 parts need a path or file object")
+            self.size = None
+            self.header = self._file_header(disposition, value.filename or "upload", value.content_type)
+            return
+        self.start: Optional[int]
+        self.raw_size: Optional[int]
+        if isinstance(source, (str, os.PathLike)):
+            self.start = 0
+            self.raw_size = os.path.getsize(source)
+            default_name = os.path.basename(os.fspath(source))
+        elif callable(getattr(source, "seekable", None)) and source.seekable():
+            self.start = source.tell()
+            self.raw_size = source.seek(0, io.SEEK_END) - self.start
+            source.seek(self.start)
+            default_name = os.path.basename(str(getattr(source, "name", "") or "upload"))
+        else:
+            # Read to end of file from wherever the stream is; it cannot be rewound for a retry.
+            self.start = self.raw_size = None
+            default_name = "upload"
+        if value.encode_base64:
+            self.size = None if self.raw_size is None else (self.raw_size + 2) // 3 * 4
+            return
+        self.size = self.raw_size
+        self.header = self._file_header(disposition, value.filename or default_name, value.content_type)
+
+    @staticmethod
+    def _file_header(disposition: str, filename: str, content_type: Optional[str]) -> bytes:
+        content_type = content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        return f'Content-Disposition: {disposition}; filename="{_quote(filename)}"\r\nContent-Type: {content_type}\r\n\r\n'.encode()
+
+    @contextmanager
+    def _open(self) -> Iterator[BinaryIO]:
+        source = self.file.source
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as file:
+                yield file
+        else:
+            if self.start is not None:
+                # Rewind so every attempt sends the same bytes.
+                source.seek(self.start)
+            yield source
+
+    def chunks(self, chunk_size: int) -> Iterator[bytes]:
+        if self.body is not None:
+            yield self.body
+            return
+        source = self.file.source
+        if not isinstance(source, (str, os.PathLike)) and not hasattr(source, "read"):
+            yield from _coalesce(source, chunk_size)
+            return
+        encode = self.file.encode_base64
+        # Base64 of consecutive 3-byte-aligned blocks concatenates into the base64 of the whole file.
+        read_size = max(3, chunk_size // 4 * 3) if encode else chunk_size
+        remaining = self.raw_size
+        with self._open() as file:
+            while remaining is None or remaining > 0:
+                # A short read would break the 3-byte alignment and put padding mid-stream.
+                chunk = _read_full(file, read_size if remaining is None else min(read_size, remaining))
+                if not chunk:
+                    if remaining is None:
+                        return
+                    raise ValueError(f"{source!r} shrank while it was being uploaded")
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield base64.b64encode(chunk) if encode else chunk
+
+
+class MultipartUpload(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Streaming ``multipart/form-data`` body.
+
+    Files are read from disk in ``chunk_size`` pieces while the request is sent, so memory use stays
+    bounded whatever the file size. ``Content-Length`` is computed up front. The body can be
+    iterated again from the start, which lets the retry transport resend it after a failed attempt
+    without buffering. ``progress(sent, total)`` is called after every chunk.
+
+    Parts produced from an iterable have no size up front: ``total`` is then ``None``, the body is
+    sent with chunked transfer encoding, and it can only be sent once.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[Tuple[str, Union[str, FilePart]]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[Progress] = None,
+    ) -> None:
+        self.boundary = secrets.token_hex(16)
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._parts: List[_Part] = [_Part(name, value) for name, value in fields]
+        delimiter = len(self.boundary) + 6  # --boundary\r\n before each part, \r\n after it
+        self.total: Optional[int] = None
+        if all(part.size is not None for part in self._parts):
+            self.total = sum(delimiter + len(part.header) + part.size for part in self._parts) + len(self.boundary) + 6
+        # Checked by the retry transport, as for ``httpx``'s own one-shot streams.
+        self._is_stream_consumed = False
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        length = {"Transfer-Encoding": "chunked"} if self.total is None else {"Content-Length": str(self.total)}
+        return {"Content-Type": f"multipart/form-data; boundary={self.boundary}", **length}
+
+    def _pieces(self) -> Iterator[bytes]:
+        for part in self._parts:
+            yield f"--{self.boundary}\r\n".encode() + part.header
+            yield from part.chunks(self.chunk_size)
+            yield b"\r\n"
+        yield f"--{self.boundary}--\r\n".encode()
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.total is None:
+            if self._is_stream_consumed:
+                raise httpx.StreamConsumed()
+            self._is_stream_consumed = True
+        sent = 0
+        for piece in self._pieces():
+            yield piece
+            sent += len(piece)
+            if self.progress is not None:
+                self.progress(sent, self.total)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if self.total is not None:
+            # File reads are short and blocking, as in ``httpx``'s own multipart stream.
+            for chunk in self:
+                yield chunk
+            return
+        # Parts of unknown size come from caller iterables, which may do real work per chunk; build
+        # each chunk in a worker thread instead of on the event loop.
+        chunks = iter(self)
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+def audio_upload(body: Dict[str, Any], file: Any, *, chunk_size: int = DEFAULT_CHUNK_SIZE, progress: Optional[Progress] = None) -> MultipartUpload:
+    """Form for ``/audio/transcriptions`` and ``/audio/translations`` with ``file`` streamed as ``audio_b64``."""
+    fields: List[Tuple[str, Union[str, FilePart]]] = [
+        (name, value if isinstance(value, str) else json.dumps(value)) for name, value in body.items() if value is not None
+    ]
+    fields.append(("audio_b64", replace(as_file_part(file), encode_base64=True)))
+    return MultipartUpload(fields, chunk_size=chunk_size, progress=progress)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Union
+from typing_extensions import NotRequired, TypedDict
+
+from ai_stats_generated.models.chat_completions_request_tool_choice import ChatCompletionsRequestToolChoice
+from ai_stats_generated.models.chat_message import ChatMessage
+from ai_stats_generated.models.model_id import ModelId
+from ai_stats_generated.models.reasoning_config import ReasoningConfig as ChatCompletionsRequestReasoning
+
+
+class ChatCompletionsParams(TypedDict, total=False):
+    reasoning: NotRequired[list[ChatCompletionsRequestReasoning]]
+    frequency_penalty: NotRequired[Union[float, int]]
+    logit_bias: NotRequired[Dict[str, Union[float, int]]]
+    max_output_tokens: NotRequired[int]
+    max_completions_tokens: NotRequired[int]
+    meta: NotRequired[bool]
+    model: ModelId
+    messages: list[ChatMessage]
+    presence_penalty: NotRequired[Union[float, int]]
+    seed: NotRequired[int]
+    stream: NotRequired[bool]
+    temperature: NotRequired[Union[float, int]]
+    tools: NotRequired[list[dict[str, Any]]]
+    max_tool_calls: NotRequired[int]
+    parallel_tool_calls: NotRequired[bool]
+    tool_choice: NotRequired[ChatCompletionsRequestToolChoice]
+    top_k: NotRequired[int]
+    logprobs: NotRequired[bool]
+    top_logprobs: NotRequired[int]
+    top_p: NotRequired[Union[float, int]]
+    usage: NotRequired[bool]
+
+
+class AudioTranscriptionRequest(TypedDict, total=False):
+    model: str
+    audio_url: NotRequired[str]
+    audio_b64: NotRequired[str]
+    language: NotRequired[str]
+
+
+class AudioTranslationRequest(TypedDict, total=False):
+    model: str
+    audio_url: NotRequired[str]
+    audio_b64: NotRequired[str]
+    language: NotRequired[str]
+    prompt: NotRequired[str]
+    temperature: NotRequired[Union[float, int]]
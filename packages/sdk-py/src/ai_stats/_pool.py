@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+import time
+import warnings
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from ._hedging import LatencyHistogram
+
+SocketOption = Union[Tuple[int, int, int], Tuple[int, int, Union[bytes, bytearray]], Tuple[int, int, None, int]]
+
+
+@dataclass(frozen=True)
+class PoolOptions:
+    """Connection pool sizing, keep-alive and socket settings for the built-in transport.
+
+    Unset timeouts fall back to the client's ``timeout``. ``socket_options`` are passed to every new
+    connection, e.g. ``[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]``.
+
+    ``max_streams`` caps the requests in flight at once; over HTTP/2 these are the streams
+    multiplexed on the pool's connections, on top of the server's own per-connection limit.
+    ``http1=False`` with ``http2=True`` speaks HTTP/2 with prior knowledge, e.g. cleartext h2c to a
+    local proxy.
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 30.0
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    write_timeout: Optional[float] = None
+    pool_timeout: Optional[float] = None
+    socket_options: Sequence[SocketOption] = ()
+    max_streams: Optional[int] = None
+    http1: bool = True
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self, default: Union[float, httpx.Timeout, None]) -> httpx.Timeout:
+        base = default if isinstance(default, httpx.Timeout) else httpx.Timeout(default)
+        return httpx.Timeout(
+            connect=base.connect if self.connect_timeout is None else self.connect_timeout,
+            read=base.read if self.read_timeout is None else self.read_timeout,
+            write=base.write if self.write_timeout is None else self.write_timeout,
+            pool=base.pool if self.pool_timeout is None else self.pool_timeout,
+        )
+
+    def transport_options(self, limits: Optional[httpx.Limits] = None, *, http2: bool = False) -> Dict[str, Any]:
+        """Keyword arguments for ``httpx.HTTPTransport``/``httpx.AsyncHTTPTransport``; ``limits`` overrides the sizing.
+
+        Without the optional ``h2`` package, ``http2=True`` warns and falls back to HTTP/1.1. Over TLS
+        the protocol is negotiated per connection, so servers without HTTP/2 get HTTP/1.1 as well.
+        """
+        if http2 and importlib.util.find_spec("h2") is None:
+            warnings.warn("http2=True needs the optional 'h2' package; falling back to HTTP/1.1", RuntimeWarning, stacklevel=3)
+            http2 = False
+        options: Dict[str, Any] = {"limits": limits or self.limits(), "http1": self.http1 or not http2, "http2": http2}
+        if self.socket_options:
+            options["socket_options"] = list(self.socket_options)
+        return options
+
+
+DEFAULT_POOL = PoolOptions()
+
+
+class PoolStats(NamedTuple):
+    requests: int
+    connections_opened: int
+    waiting: int
+    wait_p50: float
+    wait_p99: float
+    max_wait: float
+
+
+class PoolMetrics:
+    """Time spent waiting for a pooled connection, from the connection pool's trace events.
+
+    A request's wait ends at its first trace event: either a new connection being dialled or the
+    request headers going out on a reused one. Transports that emit no trace events (e.g.
+    ``httpx.MockTransport``) count requests only. Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._opened = 0
+        self._waiting = 0
+        self._max_wait = 0.0
+        self._waits = LatencyHistogram(min_latency=1e-5)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            requests, opened, waiting, max_wait = self._requests, self._opened, self._waiting, self._max_wait
+        return PoolStats(
+            requests,
+            opened,
+            waiting,
+            self._waits.percentile("pool", 0.5) or 0.0,
+            self._waits.percentile("pool", 0.99) or 0.0,
+            max_wait,
+        )
+
+    def _begin(self) -> "_Checkout":
+        with self._lock:
+            self._requests += 1
+            self._waiting += 1
+        return _Checkout(self)
+
+
+class _Checkout:
+    """One request's trip through the pool."""
+
+    def __init__(self, metrics: PoolMetrics) -> None:
+        self.metrics = metrics
+        self.started = time.monotonic()
+        self.acquired = False
+
+    def event(self, name: str) -> None:
+        metrics = self.metrics
+        if not self.acquired:
+            self.acquired = True
+            wait = time.monotonic() - self.started
+            metrics._waits.record("pool", wait)
+            with metrics._lock:
+                metrics._waiting -= 1
+                metrics._max_wait = max(metrics._max_wait, wait)
+        if name == "connection.connect_tcp.started":
+            with metrics._lock:
+                metrics._opened += 1
+
+    def done(self) -> None:
+        if not self.acquired:
+            self.acquired = True
+            with self.metrics._lock:
+                self.metrics._waiting -= 1
+
+
+_UPSTREAM_TRACE = "ai_stats.trace"
+
+
+def _upstream_trace(request: httpx.Request) -> Optional[Callable[[str, Dict[str, Any]], Any]]:
+    # Retries resend the same request; keep chaining to the caller's hook, not to our previous wrapper.
+    return request.extensions.get(_UPSTREAM_TRACE, request.extensions.get("trace"))
+
+
+def _traced(request: httpx.Request, upstream: Any, trace: Callable[[str, Dict[str, Any]], Any]) -> None:
+    request.extensions = {**request.extensions, _UPSTREAM_TRACE: upstream, "trace": trace}
+
+
+def _pool_timeout(request: httpx.Request) -> Optional[float]:
+    return request.extensions.get("timeout", {}).get("pool")
+
+
+class _Released(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that hands its stream slot back once it is closed."""
+
+    def __init__(self, stream: Any, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    def _free(self) -> None:
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._free()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._free()
+
+
+class PoolMetricsTransport(httpx.BaseTransport):
+    """Records ``PoolMetrics`` for every request sent through ``transport``.
+
+    With ``max_streams``, at most that many requests are in flight at once; each holds its slot until
+    its response is closed, and waiting longer than the pool timeout raises ``httpx.PoolTimeout``.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, metrics: PoolMetrics, max_streams: Optional[int] = None) -> None:
+        self._transport = transport
+        self._metrics = metrics
+        self._streams = threading.BoundedSemaphore(max_streams) if max_streams else None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        checkout = self._metrics._begin()
+        upstream = _upstream_trace(request)
+
+        def trace(name: str, info: Dict[str, Any]) -> None:
+            checkout.event(name)
+            if upstream is not None:
+                upstream(name, info)
+
+        _traced(request, upstream, trace)
+        try:
+            if self._streams is None:
+                return self._transport.handle_request(request)
+            timeout = _pool_timeout(request)
+            if not self._streams.acquire(timeout=-1 if timeout is None else timeout):
+                raise httpx.PoolTimeout("timed out waiting for a free stream", request=request)
+            try:
+                response = self._transport.handle_request(request)
+            except BaseException:
+                self._streams.release()
+                raise
+            response.stream = _Released(response.stream, self._streams.release)
+            return response
+        finally:
+            checkout.done()
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncPoolMetricsTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``PoolMetricsTransport``."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: PoolMetrics, max_streams: Optional[int] = None) -> None:
+        self._transport = transport
+        self._metrics = metrics
+        self._streams = asyncio.Semaphore(max_streams) if max_streams else None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        checkout = self._metrics._begin()
+        upstream = _upstream_trace(request)
+
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            checkout.event(name)
+            if upstream is not None:
+                await upstream(name, info)
+
+        _traced(request, upstream, trace)
+        try:
+            if self._streams is None:
+                return await self._transport.handle_async_request(request)
+            try:
+                await asyncio.wait_for(self._streams.acquire(), _pool_timeout(request))
+            except asyncio.TimeoutError:
+                raise httpx.PoolTimeout("timed out waiting for a free stream", request=request) from None
+            try:
+                response = await self._transport.handle_async_request(request)
+            except BaseException:
+                self._streams.release()
+                raise
+            response.stream = _Released(response.stream, self._streams.release)
+            return response
+        finally:
+            checkout.done()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
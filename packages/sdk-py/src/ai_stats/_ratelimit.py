@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Mapping, NamedTuple, Optional, Union
+
+import httpx
+
+MODEL_EXTENSION = "ai_stats.model"
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class RateLimit(NamedTuple):
+    requests_per_second: float
+    burst: int = 1
+
+
+RateLimitSpec = Union[float, RateLimit]
+
+
+def _as_limit(spec: RateLimitSpec) -> RateLimit:
+    limit = spec if isinstance(spec, RateLimit) else RateLimit(float(spec), max(1, int(spec)))
+    if limit.requests_per_second <= 0:
+        raise ValueError("requests_per_second must be positive")
+    return limit
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse ``Retry-After``/reset style values: seconds, ``1m30s``/``250ms`` durations or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+        return sum(float(number) * scale[unit] for number, unit in parts)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _Bucket:
+    """Token bucket whose rate backs off on 429s and creeps back up to its ceiling on success."""
+
+    def __init__(self, limit: Optional[RateLimit]) -> None:
+        self.ceiling = limit.requests_per_second if limit else None
+        self.rate = self.ceiling
+        self.burst = limit.burst if limit else 1
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self, now: float) -> float:
+        delay = max(0.0, self.blocked_until - now)
+        if self.rate is None:
+            return delay
+        self.tokens = min(float(self.burst), self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = max(self.updated, now)
+        self.tokens -= 1
+        if self.tokens < 0:
+            delay = max(delay, -self.tokens / self.rate)
+        return delay
+
+    def block(self, now: float, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = min(self.tokens, 0.0)
+        self.updated = max(self.updated, now)
+
+    def throttle(self) -> None:
+        if self.rate is not None:
+            self.rate = max(self.ceiling * 0.05, self.rate * 0.5)
+
+    def recover(self, allowed: Optional[float]) -> None:
+        if self.rate is None:
+            return
+        self.rate = min(self.ceiling, self.rate + self.ceiling * 0.05)
+        if allowed is not None:
+            self.rate = max(self.ceiling * 0.05, min(self.rate, allowed))
+
+
+class RateLimiter:
+    """Client-side request limiter keyed by model and provider.
+
+    ``requests_per_second`` caps every request the client sends; ``per_model`` and ``per_provider``
+    (the organisation prefix of a model id, e.g. ``"anthropic"``) add narrower buckets. Rates adapt
+    to the gateway: a 429 halves the bucket and honours ``Retry-After``, ``*-remaining``/``*-reset``
+    headers cap the rate to what is left in the window, and successes creep back to the ceiling.
+
+    Clients consult the limiter on every attempt, retries included. One instance is thread-safe and
+    may be shared by several ``AIStats``/``AsyncAIStats`` clients.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[RateLimitSpec] = None,
+        *,
+        per_model: Optional[Mapping[str, RateLimitSpec]] = None,
+        per_provider: Optional[Mapping[str, RateLimitSpec]] = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._global = _Bucket(_as_limit(requests_per_second)) if requests_per_second is not None else None
+        self._model_limits = {str(key): _as_limit(spec) for key, spec in (per_model or {}).items()}
+        self._provider_limits = {str(key): _as_limit(spec) for key, spec in (per_provider or {}).items()}
+        self._models: Dict[str, _Bucket] = {}
+        self._providers: Dict[str, _Bucket] = {}
+
+    def _buckets(self, model: Optional[str]) -> List[_Bucket]:
+        buckets = [self._global] if self._global else []
+        if model:
+            bucket = self._models.get(model)
+            if bucket is None:
+                bucket = self._models[model] = _Bucket(self._model_limits.get(model))
+            buckets.append(bucket)
+            provider = model.split("/", 1)[0] if "/" in model else None
+            if provider in self._provider_limits:
+                bucket = self._providers.get(provider)
+                if bucket is None:
+                    bucket = self._providers[provider] = _Bucket(self._provider_limits[provider])
+                buckets.append(bucket)
+        return buckets
+
+    def reserve(self, model: Optional[str] = None) -> float:
+        """Reserve a slot for one request and return how long the caller must wait before sending it."""
+        now = time.monotonic()
+        with self._lock:
+            return max((bucket.reserve(now) for bucket in self._buckets(model)), default=0.0)
+
+    def observe(self, model: Optional[str], response: httpx.Response) -> None:
+        """Feed a response's status and rate-limit headers back into the buckets it was sent through."""
+        headers = response.headers
+        remaining = headers.get("x-ratelimit-remaining-requests") or headers.get("ratelimit-remaining")
+        reset = _parse_seconds(headers.get("x-ratelimit-reset-requests") or headers.get("ratelimit-reset"))
+        now = time.monotonic()
+        with self._lock:
+            buckets = self._buckets(model)
+            if response.status_code == 429:
+                retry_after = _parse_seconds(headers.get("retry-after"))
+                if retry_after is None and headers.get("retry-after-ms"):
+                    retry_after = (_parse_seconds(headers["retry-after-ms"]) or 0.0) / 1000
+                for bucket in buckets:
+                    bucket.throttle()
+                    bucket.block(now, retry_after if retry_after is not None else 1.0 / (bucket.rate or 1.0))
+                return
+            allowed = None
+            if remaining is not None and remaining.isdigit() and reset:
+                if int(remaining) == 0:
+                    for bucket in buckets:
+                        bucket.block(now, reset)
+                allowed = max(int(remaining), 1) / reset
+            for bucket in buckets:
+                bucket.recover(allowed)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from ._deserialize import CompiledApiClient
+from ._errors import raise_for_status
+from ._ratelimit import MODEL_EXTENSION
+from ._serialize import JSONBody, encode_json
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class HttpxRESTResponse:
+    """Adapts an ``httpx.Response`` to the ``RESTResponse`` interface the generated client expects."""
+
+    def __init__(self, resp: httpx.Response) -> None:
+        self.response = resp
+        self.status = resp.status_code
+        self.reason = resp.reason_phrase
+        self.data: Optional[bytes] = None
+
+    def read(self) -> bytes:
+        if self.data is None:
+            self.data = self.response.read()
+        return self.data
+
+    def getheaders(self) -> httpx.Headers:
+        return self.response.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self.response.headers.get(name, default)
+
+
+def _form_value(value: Any) -> str:
+    if isinstance(value, (dict, bool)):
+        return json.dumps(value)
+    return value if isinstance(value, str) else str(value)
+
+
+def request_extensions(model: Optional[str]) -> Dict[str, Any]:
+    """Tag a request with its model id so transport-level policies (rate limits, retries) can key on it."""
+    return {MODEL_EXTENSION: model} if model else {}
+
+
+def json_request(payload: Any) -> Dict[str, Any]:
+    """``httpx`` arguments sending ``payload`` as a JSON body encoded exactly once."""
+    body = encode_json(payload)
+    return {"content": body, "headers": JSON_HEADERS, "extensions": request_extensions(body.model)}
+
+
+def build_request(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    body: Any = None,
+    post_params: Optional[List[Tuple[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Translate the output of ``ApiClient.param_serialize`` into ``httpx`` request arguments.
+
+    Mirrors the content-type dispatch in the generated ``RESTClientObject.request``.
+    """
+    headers = dict(headers or {})
+    request: Dict[str, Any] = {"method": method.upper(), "url": url, "headers": headers}
+    model = body.model if isinstance(body, JSONBody) else dict(post_params or []).get("model")
+    request["extensions"] = request_extensions(model)
+    if request["method"] in ("GET", "HEAD"):
+        return request
+
+    content_type = headers.get("Content-Type")
+    if post_params and body is not None:
+        raise ValueError("body parameter cannot be used with post_params parameter.")
+    if not content_type or re.search("json", content_type, re.IGNORECASE):
+        if body is not None:
+            request["content"] = body if isinstance(body, bytes) else encode_json(body)
+    elif content_type == "application/x-www-form-urlencoded":
+        request["data"] = {key: _form_value(value) for key, value in post_params or []}
+    elif content_type == "multipart/form-data":
+        # httpx writes its own boundary into the header.
+        del headers["Content-Type"]
+        # Plain fields go in as (None, value) parts so a form without files is still multipart.
+        request["files"] = [
+            (key, value if isinstance(value, tuple) else (None, _form_value(value)))
+            for key, value in post_params or []
+        ]
+    elif isinstance(body, (str, bytes)):
+        request["content"] = body
+    elif content_type.startswith("text/") and isinstance(body, bool):
+        request["content"] = "true" if body else "false"
+    else:
+        raise ValueError("Cannot prepare a request message for provided arguments. Please check that your arguments match declared content type.")
+    return request
+
+
+def to_httpx_timeout(request_timeout: Any) -> Any:
+    """Map the generated ``_request_timeout`` (total, or ``(connect, read)``) onto ``httpx.Timeout``."""
+    if isinstance(request_timeout, tuple) and len(request_timeout) == 2:
+        connect, read = request_timeout
+        return httpx.Timeout(None, connect=connect, read=read)
+    return request_timeout
+
+
+class HttpxRESTClient:
+    """Drop-in replacement for the generated urllib3 ``RESTClientObject``.
+
+    Sends every generated operation through the caller's ``httpx.Client`` so the generated API and
+    the hand-written wrapper methods share one connection pool, one TLS context and one timeout model.
+    """
+
+    def __init__(self, http: httpx.Client) -> None:
+        self.http = http
+
+    def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None) -> HttpxRESTResponse:
+        request = build_request(method, url, headers, body, post_params)
+        if _request_timeout:
+            request["timeout"] = to_httpx_timeout(_request_timeout)
+        resp = self.http.request(**request)
+        raise_for_status(resp)
+        return HttpxRESTResponse(resp)
+
+
+class HttpxApiClient(CompiledApiClient):
+    """Generated ``ApiClient`` whose ``call_api`` goes through a shared ``httpx.Client``."""
+
+    def __init__(self, configuration, http: httpx.Client) -> None:
+        super().__init__(configuration=configuration, rest_client=HttpxRESTClient(http))
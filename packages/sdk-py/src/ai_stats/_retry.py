@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import FrozenSet, Optional
+
+import httpx
+
+from ._ratelimit import MODEL_EXTENSION, RateLimiter, _parse_seconds
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Inference endpoints are stateless but billed, and a lost response does not mean the gateway
+# stopped generating: replaying one can charge twice, so that is opt-in (``replay_generations``).
+GENERATION_PATHS = frozenset(
+    {
+        "/chat/completions",
+        "/responses",
+        "/embeddings",
+        "/moderations",
+        "/images/generations",
+        "/images/edits",
+        "/audio/speech",
+        "/audio/transcriptions",
+        "/audio/translations",
+        "/video/generation",
+    }
+)
+
+# Read-only POSTs, safe to replay. ``/batches`` and ``/files`` create server-side objects and are left out.
+REPLAYABLE_PATHS = frozenset({"/analytics"})
+
+# Request extension overriding the client's policy for that request (``None`` turns retries off),
+# for callers that know more about whether it is safe to resend than the path does.
+RETRY_EXTENSION = "ai_stats.retry"
+
+# Errors raised before the request reached the gateway are safe to retry on any endpoint.
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_TRANSIENT = (httpx.ReadError, httpx.ReadTimeout, httpx.WriteError, httpx.WriteTimeout, httpx.RemoteProtocolError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How the client retries failed requests.
+
+    Delays use exponential backoff with full jitter (``uniform(0, min(max_backoff, backoff * 2**n))``),
+    stretched to honour ``Retry-After``. ``deadline`` bounds the total time spent on one call,
+    sleeps included: each attempt's timeouts are capped at the time left.
+
+    Requests the gateway never processed are retried on every endpoint: connection failures, a
+    429, or a 503 with ``Retry-After``. ``retry_statuses`` and mid-flight transport errors are
+    retried only where replaying is safe: idempotent methods and ``replayable_paths``, plus the
+    billed inference endpoints when ``replay_generations`` is set.
+    """
+
+    max_retries: int = 2
+    backoff: float = 0.5
+    max_backoff: float = 8.0
+    deadline: Optional[float] = 600.0
+    retry_statuses: FrozenSet[int] = frozenset({408, 429, 500, 502, 503, 504})
+    replayable_paths: FrozenSet[str] = field(default=REPLAYABLE_PATHS)
+    replay_generations: bool = False
+
+    def replayable(self, request: httpx.Request) -> bool:
+        if request.method in IDEMPOTENT_METHODS:
+            return True
+        paths = self.replayable_paths | GENERATION_PATHS if self.replay_generations else self.replayable_paths
+        path = request.url.path
+        return any(path == suffix or path.endswith(suffix) for suffix in paths)
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        delay = random.uniform(0.0, min(self.max_backoff, self.backoff * (2**attempt)))
+        if response is not None:
+            retry_after = _parse_seconds(response.headers.get("retry-after"))
+            if retry_after is None and response.headers.get("retry-after-ms"):
+                retry_after = (_parse_seconds(response.headers["retry-after-ms"]) or 0.0) / 1000
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+        return delay
+
+    def should_retry_status(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code not in self.retry_statuses:
+            return False
+        # The gateway refused these outright, before any work was done.
+        refused = response.status_code == 429 or (response.status_code == 503 and "retry-after" in response.headers)
+        return refused or self.replayable(request)
+
+    def should_retry_error(self, request: httpx.Request, exc: Exception) -> bool:
+        if isinstance(exc, _NOT_SENT):
+            return True
+        return isinstance(exc, _TRANSIENT) and self.replayable(request)
+
+
+DEFAULT_RETRY = RetryPolicy()
+
+
+class _Attempts:
+    """Attempt counter and deadline budget shared by the sync and async transports."""
+
+    def __init__(self, policy: Optional[RetryPolicy], request: httpx.Request) -> None:
+        self.policy = policy
+        self.request = request
+        self.attempt = 0
+        self.expires = time.monotonic() + policy.deadline if policy and policy.deadline is not None else None
+
+    def start(self) -> None:
+        """Cap the timeouts of the attempt about to be sent at the time left before the deadline."""
+        if self.expires is None:
+            return
+        remaining = max(0.0, self.expires - time.monotonic())
+        timeout = self.request.extensions.get("timeout") or {}
+        capped = {key: remaining if timeout.get(key) is None else min(timeout[key], remaining) for key in ("connect", "read", "write", "pool")}
+        self.request.extensions = {**self.request.extensions, "timeout": capped}
+
+    def _next_delay(self, response: Optional[httpx.Response] = None) -> Optional[float]:
+        # Generator-backed bodies cannot be sent twice.
+        if self.attempt >= self.policy.max_retries or getattr(self.request.stream, "_is_stream_consumed", False):
+            return None
+        delay = self.policy.delay(self.attempt, response)
+        if self.expires is not None and time.monotonic() + delay >= self.expires:
+            return None
+        self.attempt += 1
+        return delay
+
+    def after_error(self, exc: Exception) -> Optional[float]:
+        """Return how long to sleep before retrying after ``exc``, or ``None`` to give up."""
+        if self.policy is None or not self.policy.should_retry_error(self.request, exc):
+            return None
+        return self._next_delay()
+
+    def after_response(self, response: httpx.Response) -> Optional[float]:
+        """Return how long to sleep before retrying after ``response``, or ``None`` to return it."""
+        if self.policy is None or not self.policy.should_retry_status(self.request, response):
+            return None
+        return self._next_delay(response)
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Wraps a transport with pacing and retries.
+
+    Retries happen below ``httpx.Client``, before any response body is handed out, so a stream that
+    fails before its first byte is replayed transparently while a half-read stream is never repeated.
+    Each attempt is paced and observed by ``rate_limiter`` when one is given.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        policy: Optional[RetryPolicy] = DEFAULT_RETRY,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self._transport = transport
+        self._policy = policy
+        self._rate_limiter = rate_limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempts = _Attempts(request.extensions.get(RETRY_EXTENSION, self._policy), request)
+        model = request.extensions.get(MODEL_EXTENSION)
+        while True:
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve(model)
+                if wait > 0:
+                    time.sleep(wait)
+            attempts.start()
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as exc:
+                delay = attempts.after_error(exc)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            if self._rate_limiter is not None:
+                self._rate_limiter.observe(model, response)
+            delay = attempts.after_response(response)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``RetryTransport``."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: Optional[RetryPolicy] = DEFAULT_RETRY,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self._transport = transport
+        self._policy = policy
+        self._rate_limiter = rate_limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempts = _Attempts(request.extensions.get(RETRY_EXTENSION, self._policy), request)
+        model = request.extensions.get(MODEL_EXTENSION)
+        while True:
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve(model)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            attempts.start()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as exc:
+                delay = attempts.after_error(exc)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            if self._rate_limiter is not None:
+                self._rate_limiter.observe(model, response)
+            delay = attempts.after_response(response)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple, Optional
+
+from ._embeddings import EmbeddingMatrix, _numpy
+
+METRICS = ("cosine", "dot")
+# Rows scored per matrix multiply; bounds the temporary score matrix, and the pages an mmapped
+# matrix needs resident at once.
+DEFAULT_BLOCK_ROWS = 16384
+QUERY_BLOCK = 1024
+# Elements per (rows x centroids) score matrix while training and assigning IVF lists.
+_ASSIGN_ELEMENTS = 1 << 24
+
+
+def _require_numpy() -> Any:
+    numpy = _numpy()
+    if numpy is None:
+        raise ImportError('vector search needs NumPy: pip install "ai-stats-py-sdk[numpy]"')
+    return numpy
+
+
+def as_matrix(vectors: Any) -> Any:
+    """``vectors`` as a 2-D NumPy matrix, without copying ndarrays or memory maps.
+
+    Accepts an ``EmbeddingMatrix``, an ``EmbeddingStore`` (memory-mapped), or anything array-like.
+    """
+    np = _require_numpy()
+    if isinstance(vectors, EmbeddingMatrix):
+        vectors = vectors.vectors
+    elif callable(getattr(vectors, "vectors", None)):
+        vectors = vectors.vectors()
+    matrix = vectors if isinstance(vectors, np.ndarray) else np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError("vectors must be a 2-D matrix")
+    return matrix
+
+
+class Neighbors(NamedTuple):
+    """Top-k results per query, best first: ``scores`` and matrix ``rows``, both shaped ``(queries, k)``.
+
+    Where fewer than ``k`` rows were searched, the tail is padded with row ``-1`` and score ``-inf``.
+    """
+
+    scores: Any
+    rows: Any
+
+
+def _top_k(np: Any, scores: Any, rows: Any, k: int) -> Any:
+    """Keep the ``k`` best columns of ``scores`` (and the matching ``rows``), unordered."""
+    if scores.shape[1] <= k:
+        return scores, rows
+    keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(scores, keep, axis=1), np.take_along_axis(rows, keep, axis=1)
+
+
+def _sorted(np: Any, scores: Any, rows: Any, k: int) -> Neighbors:
+    order = np.argsort(-scores, axis=1, kind="stable")
+    scores, rows = np.take_along_axis(scores, order, axis=1), np.take_along_axis(rows, order, axis=1)
+    if scores.shape[1] < k:
+        missing = k - scores.shape[1]
+        scores = np.pad(scores, ((0, 0), (0, missing)), constant_values=-np.inf)
+        rows = np.pad(rows, ((0, 0), (0, missing)), constant_values=-1)
+    return Neighbors(scores, rows)
+
+
+class _Index:
+    def __init__(self, vectors: Any, metric: str, block_rows: int) -> None:
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}")
+        self.np = _require_numpy()
+        self.vectors = as_matrix(vectors)
+        self.metric = metric
+        self.block_rows = block_rows
+        self.norms: Optional[Any] = None
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def _block(self, start: int) -> Any:
+        return self.np.asarray(self.vectors[start : start + self.block_rows], dtype=self.np.float32)
+
+    def _row_norms(self, block: Any) -> Any:
+        norms = self.np.linalg.norm(block, axis=1)
+        # All-zero rows score 0 instead of NaN.
+        norms[norms == 0] = 1.0
+        return norms
+
+    def _queries(self, queries: Any) -> Any:
+        queries = self.np.atleast_2d(self.np.asarray(queries, dtype=self.np.float32))
+        if queries.shape[1] != self.vectors.shape[1]:
+            raise ValueError(f"queries have {queries.shape[1]} dimensions, the index has {self.vectors.shape[1]}")
+        if self.metric == "cosine":
+            queries = queries / self._row_norms(queries)[:, None]
+        return queries
+
+
+class BruteForceIndex(_Index):
+    """Exact nearest neighbours by blocked matrix multiply.
+
+    The matrix is scored ``block_rows`` rows at a time and each block's best ``k`` are merged with
+    ``argpartition``, so memory stays bounded and a memory-mapped matrix is streamed from disk
+    rather than loaded. ``metric`` is ``"cosine"`` (row norms are computed once, rows are not
+    copied) or ``"dot"``.
+    """
+
+    def __init__(self, vectors: Any, *, metric: str = "cosine", block_rows: int = DEFAULT_BLOCK_ROWS) -> None:
+        super().__init__(vectors, metric, block_rows)
+        if metric == "cosine":
+            self.norms = self.np.concatenate(
+                [self._row_norms(self._block(start)) for start in range(0, len(self), block_rows)] or [self.np.empty(0)]
+            )
+
+    def search(self, queries: Any, k: int = 10) -> Neighbors:
+        np = self.np
+        queries = self._queries(queries)
+        k = max(1, k)
+        results = [self._search(queries[start : start + QUERY_BLOCK], k) for start in range(0, len(queries), QUERY_BLOCK)]
+        if not results:
+            return Neighbors(np.empty((0, k), dtype=np.float32), np.empty((0, k), dtype=np.int64))
+        return Neighbors(np.concatenate([result.scores for result in results]), np.concatenate([result.rows for result in results]))
+
+    def _search(self, queries: Any, k: int) -> Neighbors:
+        np = self.np
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        for start in range(0, len(self), self.block_rows):
+            block = self._block(start)
+            scores = queries @ block.T
+            if self.norms is not None:
+                scores /= self.norms[start : start + len(block)]
+            rows = np.broadcast_to(np.arange(start, start + len(block)), scores.shape)
+            scores, rows = _top_k(np, scores, rows, k)
+            best_scores, best_rows = _top_k(np, np.concatenate([best_scores, scores], axis=1), np.concatenate([best_rows, rows], axis=1), k)
+        return _sorted(np, best_scores, best_rows, k)
+
+
+class IVFIndex(_Index):
+    """Approximate nearest neighbours over an inverted file of ``n_lists`` k-means clusters.
+
+    Centroids are trained on a random sample of up to ``sample_size`` rows (spherical k-means for
+    cosine), then every row is assigned to its nearest centroid in blocks. A search scores only the
+    rows of the ``n_probe`` lists closest to each query; raise ``n_probe`` for recall, lower it for
+    speed. Rows stay where they are: only the list order (one int64 per row) and row norms are held
+    in memory, so the matrix can be memory-mapped.
+    """
+
+    def __init__(
+        self,
+        vectors: Any,
+        n_lists: int,
+        *,
+        metric: str = "cosine",
+        n_probe: int = 8,
+        iterations: int = 10,
+        sample_size: Optional[int] = None,
+        seed: Optional[int] = 0,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+    ) -> None:
+        super().__init__(vectors, metric, block_rows)
+        np = self.np
+        if not len(self):
+            raise ValueError("cannot build an IVF index over an empty matrix")
+        rng = np.random.default_rng(seed)
+        self.n_lists = min(n_lists, len(self))
+        self.n_probe = n_probe
+        size = min(len(self), sample_size or 256 * self.n_lists)
+        # Sorted, so a memory-mapped matrix is read front to back.
+        sample = self._prepare(np.asarray(self.vectors[np.sort(rng.choice(len(self), size, replace=False))], dtype=np.float32))
+        self.centroids = self._train(sample, iterations, rng)
+
+        lists = np.empty(len(self), dtype=np.int64)
+        norms = []
+        for start in range(0, len(self), block_rows):
+            block = self._block(start)
+            if metric == "cosine":
+                norms.append(self._row_norms(block))
+                block = block / norms[-1][:, None]
+            lists[start : start + len(block)] = self._assign(block)
+        if metric == "cosine":
+            self.norms = np.concatenate(norms)
+        self.order = np.argsort(lists, kind="stable")
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(lists, minlength=self.n_lists))])
+
+    def _prepare(self, rows: Any) -> Any:
+        return rows / self._row_norms(rows)[:, None] if self.metric == "cosine" else rows
+
+    def _assign(self, rows: Any) -> Any:
+        np = self.np
+        step = max(1, _ASSIGN_ELEMENTS // len(self.centroids))
+        labels = np.empty(len(rows), dtype=np.int64)
+        # Spherical k-means maximises the dot product; Euclidean minimises |c|^2 - 2 x.c.
+        bias = None if self.metric == "cosine" else (self.centroids**2).sum(axis=1) / 2
+        for start in range(0, len(rows), step):
+            scores = rows[start : start + step] @ self.centroids.T
+            if bias is not None:
+                scores -= bias
+            labels[start : start + step] = scores.argmax(axis=1)
+        return labels
+
+    def _train(self, sample: Any, iterations: int, rng: Any) -> Any:
+        np = self.np
+        self.centroids = sample[rng.choice(len(sample), self.n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            labels = self._assign(sample)
+            counts = np.bincount(labels, minlength=self.n_lists)
+            filled = counts > 0
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            sums = np.add.reduceat(sample[np.argsort(labels, kind="stable")], starts[filled], axis=0)
+            self.centroids[filled] = sums / counts[filled, None]
+            # Re-seed empty clusters from random sample rows.
+            self.centroids[~filled] = sample[rng.choice(len(sample), int((~filled).sum()))]
+            self.centroids = self._prepare(self.centroids)
+        return self.centroids
+
+    def list_sizes(self) -> Any:
+        return self.np.diff(self.offsets)
+
+    def search(self, queries: Any, k: int = 10, *, n_probe: Optional[int] = None) -> Neighbors:
+        np = self.np
+        queries = self._queries(queries)
+        k = max(1, k)
+        probe = min(n_probe or self.n_probe, self.n_lists)
+        centroid_scores = queries @ self.centroids.T
+        if self.metric == "dot":
+            centroid_scores -= (self.centroids**2).sum(axis=1) / 2
+        probed = np.argpartition(-centroid_scores, probe - 1, axis=1)[:, :probe]
+        results = []
+        for query, lists in zip(queries, probed):
+            rows = np.sort(np.concatenate([self.order[self.offsets[lst] : self.offsets[lst + 1]] for lst in lists]))
+            scores = np.asarray(self.vectors[rows], dtype=np.float32) @ query
+            if self.norms is not None:
+                scores /= self.norms[rows]
+            results.append(_top_k(np, scores[None, :], rows[None, :], k))
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        rows = np.full((len(queries), k), -1, dtype=np.int64)
+        for position, (found_scores, found_rows) in enumerate(results):
+            scores[position, : found_scores.shape[1]] = found_scores[0]
+            rows[position, : found_rows.shape[1]] = found_rows[0]
+        return _sorted(np, scores, rows, k)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+import uuid
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, get_args, get_origin
+
+from pydantic import BaseModel, SecretStr
+from pydantic_core import PydanticUndefined
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _wraps(klass: type) -> bool:
+    # oneOf/anyOf wrappers and models collecting unknown keys only round-trip through ``from_dict``/``to_dict``.
+    return "actual_instance" in klass.model_fields or "additional_properties" in klass.model_fields
+
+
+def _decodes_plainly(klass: type) -> bool:
+    # ``from_dict`` swaps an explicit null for the field default, where validation keeps or rejects it.
+    return not _wraps(klass) and all(field.default is None or field.default is PydanticUndefined for field in klass.model_fields.values())
+
+
+def _encodes_plainly(klass: type) -> bool:
+    if _wraps(klass):
+        return False
+    # ``to_dict`` writes explicit nulls for nullable fields that were set, which ``exclude_none`` would drop.
+    # Set every field to None and see whether any null survives.
+    probe = klass.model_construct(**dict.fromkeys(klass.model_fields))
+    return None not in probe.to_dict().values()
+
+
+def _tree(annotation: Any, plain: Callable[[type], bool], seen: set) -> bool:
+    if get_origin(annotation) is not None:
+        return all(_tree(arg, plain, seen) for arg in get_args(annotation))
+    if not isinstance(annotation, type) or not issubclass(annotation, BaseModel) or annotation in seen:
+        return True
+    seen.add(annotation)
+    return plain(annotation) and all(_tree(field.annotation, plain, seen) for field in annotation.model_fields.values())
+
+
+@lru_cache(maxsize=None)
+def validates_in_one_pass(klass: type) -> bool:
+    """Whether ``model_validate_json`` builds the same tree as the generated ``from_dict``.
+
+    ``from_dict`` also marks every field as set; ``load_model`` does the same after validating.
+    """
+    return _tree(klass, _decodes_plainly, set())
+
+
+@lru_cache(maxsize=None)
+def dumps_in_one_pass(klass: type) -> bool:
+    """Whether ``model_dump_json(by_alias=True, exclude_none=True)`` writes what ``to_dict`` does."""
+    return _tree(klass, _encodes_plainly, set())
+
+
+class JSONBody(bytes):
+    """Request body already encoded to wire JSON, tagged with the model id it targets."""
+
+    model: Optional[str] = None
+
+
+def _default(value: Any) -> Any:
+    """Encode what the JSON encoder cannot, as the generated ``sanitize_for_serialization`` does."""
+    if isinstance(value, BaseModel) and callable(getattr(value, "to_dict", None)):
+        return value.to_dict()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if isinstance(value, SecretStr):
+        return value.get_secret_value()
+    if isinstance(value, bytes):
+        # UTF-8, as ``model_dump_json`` writes bytes, so both encoders agree.
+        return value.decode()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """Compact JSON bytes, via ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def encode_json(value: Any) -> JSONBody:
+    """Encode a request body to wire bytes in one step.
+
+    Generated models whose tree has no oneOf wrappers or nullable fields go straight through
+    pydantic-core's ``model_dump_json``; the rest are flattened with ``to_dict`` once and dumped.
+    """
+    if isinstance(value, BaseModel) and dumps_in_one_pass(type(value)):
+        body = JSONBody(value.model_dump_json(by_alias=True, exclude_none=True).encode())
+    elif isinstance(value, BaseModel) and callable(getattr(value, "to_dict", None)):
+        body = JSONBody(dumps(value.to_dict()))
+    else:
+        body = JSONBody(dumps(value))
+    model = value.get("model") if isinstance(value, dict) else getattr(value, "model", None)
+    if model:
+        body.model = str(getattr(model, "value", model))
+    return body
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_PRUNE_AT = 256
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one, and reuse the result for ``ttl`` seconds.
+
+    Callers sharing a key get the same deserialised object back, so a thundering herd costs a
+    single round-trip. Errors are shared with callers already waiting but never cached.
+    ``ttl=0`` keeps the coalescing and disables reuse; a per-call ``ttl`` overrides it.
+    """
+
+    def __init__(self, ttl: float = 2.0) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._results: Dict[Hashable, Tuple[Any, float]] = {}
+        self._calls: Dict[Hashable, Future] = {}
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def forget(self) -> None:
+        """Drop every cached result; calls already in flight are unaffected."""
+        with self._lock:
+            self._results.clear()
+
+    def _cached(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._results.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return True, entry[0]
+        return False, None
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        if len(self._results) >= _PRUNE_AT:
+            for stale in [k for k, (_, expires) in self._results.items() if expires <= now]:
+                del self._results[stale]
+        self._results[key] = (value, now + ttl)
+
+    def do(self, key: Hashable, fn: Callable[[], T], *, ttl: Optional[float] = None) -> T:
+        with self._lock:
+            hit, value = self._cached(key)
+            if hit:
+                return value
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+        if not leader:
+            return call.result()
+        try:
+            value = fn()
+        except BaseException as exc:
+            with self._lock:
+                del self._calls[key]
+            call.set_exception(exc)
+            raise
+        with self._lock:
+            del self._calls[key]
+            self._store(key, value, ttl)
+        call.set_result(value)
+        return value
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[T]], *, ttl: Optional[float] = None) -> T:
+        with self._lock:
+            hit, value = self._cached(key)
+            if hit:
+                return value
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(self._arun(key, fn, ttl))
+        # Shielded so one caller giving up does not cancel the call for everyone else.
+        return await asyncio.shield(task)
+
+    async def _arun(self, key: Hashable, fn: Callable[[], Awaitable[T]], ttl: Optional[float]) -> T:
+        try:
+            value = await fn()
+        except BaseException:
+            with self._lock:
+                del self._tasks[key]
+            raise
+        with self._lock:
+            del self._tasks[key]
+            self._store(key, value, ttl)
+        return value
+
+
+def flight_key(operation: str, params: Dict[str, Any]) -> Tuple[str, str]:
+    return operation, json.dumps(params, sort_keys=True, default=str)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import ast
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+from collections.abc import AsyncIterable as AsyncIterableABC
+from itertools import islice
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from ._embeddings import FLOAT32, EmbeddingBlock, EmbeddingMatrix, _numpy
+
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+# Fixed-size .npy header, rewritten in place as rows are appended; 64-byte aligned as the format asks.
+NPY_HEADER_SIZE = 128
+
+Record = Tuple[str, str]
+
+
+def _npy_header(rows: int, dimensions: int) -> bytes:
+    header = f"{{'descr': '{FLOAT32}', 'fortran_order': False, 'shape': ({rows}, {dimensions}), }}"
+    return NPY_MAGIC + struct.pack("<H", NPY_HEADER_SIZE - 10) + header.ljust(NPY_HEADER_SIZE - 11).encode("latin1") + b"\n"
+
+
+def _read_npy_header(file: BinaryIO) -> Tuple[int, int]:
+    """Return ``(header size, dimensions)`` of a float32 matrix ``.npy`` file."""
+    prefix = file.read(10)
+    if prefix[:8] != NPY_MAGIC:
+        raise ValueError(f"{file.name!r} is not a version 1.0 .npy file")
+    (length,) = struct.unpack("<H", prefix[8:])
+    header = ast.literal_eval(file.read(length).decode("latin1"))
+    shape = header.get("shape", ())
+    if header.get("descr") != FLOAT32 or header.get("fortran_order") or len(shape) != 2:
+        raise ValueError(f"{file.name!r} does not hold a C-order float32 matrix")
+    if 10 + length != NPY_HEADER_SIZE:
+        raise ValueError(f"{file.name!r} has a header this store cannot update in place")
+    return NPY_HEADER_SIZE, shape[1]
+
+
+def _float32_bytes(vectors: Any) -> memoryview:
+    if isinstance(vectors, EmbeddingMatrix):
+        vectors = vectors.vectors
+    numpy = _numpy()
+    if numpy is not None and isinstance(vectors, numpy.ndarray):
+        return memoryview(numpy.ascontiguousarray(vectors, dtype=FLOAT32).reshape(-1).view(numpy.uint8))
+    if isinstance(vectors, array):
+        if vectors.typecode != "f":
+            raise TypeError("expected an array of typecode 'f'")
+        if sys.byteorder == "big":
+            vectors = array("f", vectors)
+            vectors.byteswap()
+    return memoryview(vectors).cast("B")
+
+
+class EmbeddingStore:
+    """Append-only float32 vector file on disk with a sidecar id index, one id per line.
+
+    A path ending in ``.npy`` holds a NumPy ``.npy`` matrix that ``numpy.load(path, mmap_mode="r")``
+    opens once the store is closed; any other path holds raw little-endian float32 rows. Ids go to
+    ``<path>.ids``. Rows are written as they are appended, and reopening the store after a crash
+    drops any half-written row or id so both files agree again. ``vectors()`` memory-maps the rows
+    without reading them into RAM.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], dimensions: Optional[int] = None, *, durable: bool = False) -> None:
+        self.path = os.fspath(path)
+        self.ids_path = f"{self.path}.ids"
+        self.npy = self.path.endswith(".npy")
+        self.durable = durable
+        self.dimensions = dimensions
+        self.header_size = 0
+        self._data = open(self.path, "r+b" if os.path.exists(self.path) else "w+b")
+        self._ids = open(self.ids_path, "r+b" if os.path.exists(self.ids_path) else "w+b")
+        try:
+            self._rows = self._recover()
+        except BaseException:
+            self._data.close()
+            self._ids.close()
+            raise
+
+    def _recover(self) -> int:
+        data_size = os.fstat(self._data.fileno()).st_size
+        if self.npy and data_size < NPY_HEADER_SIZE:
+            # The header never made it to disk, so neither did any row.
+            data_size = 0
+            self._data.truncate(0)
+        if data_size and self.npy:
+            self.header_size, dimensions = _read_npy_header(self._data)
+            if self.dimensions not in (None, dimensions):
+                raise ValueError(f"{self.path!r} holds {dimensions}-dimensional vectors, not {self.dimensions}")
+            self.dimensions = dimensions
+        elif data_size and self.dimensions is None:
+            raise ValueError("dimensions is required to reopen a raw float32 store")
+        rows = (data_size - self.header_size) // (4 * self.dimensions) if data_size else 0
+        # Count complete id lines; a crash can leave either file ahead of the other.
+        ids, ids_size = 0, 0
+        self._ids.seek(0)
+        for line in self._ids:
+            if not line.endswith(b"\n") or ids == rows:
+                break
+            ids += 1
+            ids_size += len(line)
+        rows = min(rows, ids)
+        self._ids.truncate(ids_size)
+        self._ids.seek(ids_size)
+        if data_size:
+            self._data.truncate(self.header_size + rows * 4 * self.dimensions)
+            self._write_header(rows)
+        self._data.seek(0, os.SEEK_END)
+        return rows
+
+    def _write_header(self, rows: int) -> None:
+        if self.npy and self.dimensions is not None:
+            self._data.seek(0)
+            self._data.write(_npy_header(rows, self.dimensions))
+            self._data.seek(0, os.SEEK_END)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __enter__(self) -> "EmbeddingStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"EmbeddingStore({self.path!r}, {self._rows}x{self.dimensions})"
+
+    def append(self, vectors: Any, ids: Sequence[str]) -> None:
+        """Append float32 rows (an ``EmbeddingMatrix``, NumPy array or float32 buffer) and their ids."""
+        data = _float32_bytes(vectors)
+        if self.dimensions is None and ids:
+            self.dimensions = len(data) // 4 // len(ids)
+        if self.npy and not self.header_size and self.dimensions is not None:
+            self._data.write(_npy_header(0, self.dimensions))
+            self.header_size = NPY_HEADER_SIZE
+        if len(data) != len(ids) * 4 * (self.dimensions or 0):
+            raise ValueError(f"expected {len(ids)} rows of {self.dimensions} float32 values")
+        if any("\n" in row_id or "\r" in row_id for row_id in ids):
+            raise ValueError("ids cannot contain line breaks")
+        # Rows first, then ids: on reopen only rows that have both are kept.
+        self._data.write(data)
+        self._data.flush()
+        self._ids.write("".join(f"{row_id}\n" for row_id in ids).encode())
+        self._ids.flush()
+        if self.durable:
+            os.fsync(self._data.fileno())
+            os.fsync(self._ids.fileno())
+        self._rows += len(ids)
+
+    def flush(self) -> None:
+        """Bring the ``.npy`` header up to date so readers see every appended row."""
+        self._write_header(self._rows)
+        self._data.flush()
+
+    def close(self) -> None:
+        if self._data.closed:
+            return
+        self.flush()
+        self._data.close()
+        self._ids.close()
+
+    def ids(self) -> Iterator[str]:
+        """Stored ids in row order, read from the index file."""
+        rows = self._rows
+        with open(self.ids_path, encoding="utf-8", newline="\n") as lines:
+            for line in islice(lines, rows):
+                yield line[:-1]
+
+    def index(self) -> Dict[str, int]:
+        """Map every stored id to its row."""
+        return {row_id: row for row, row_id in enumerate(self.ids())}
+
+    def vectors(self) -> Any:
+        """The stored rows, memory-mapped read-only.
+
+        A ``numpy.memmap`` of shape ``(rows, dimensions)`` with NumPy installed, otherwise a flat
+        float32 ``memoryview``.
+        """
+        self.flush()
+        size = self._rows * 4 * (self.dimensions or 0)
+        numpy = _numpy()
+        if numpy is not None:
+            if not size:
+                return numpy.empty((0, self.dimensions or 0), dtype=FLOAT32)
+            return numpy.memmap(self.path, dtype=FLOAT32, mode="r", offset=self.header_size, shape=(self._rows, self.dimensions))
+        if not size:
+            return memoryview(b"").cast("f")
+        with open(self.path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)[self.header_size : self.header_size + size].cast("f")
+
+    def resume(self, records: Iterable[Record]) -> Iterator[Record]:
+        """Skip the ``(id, text)`` records already stored, checking their ids against the index."""
+        records = iter(records)
+        for stored_id, (record_id, _) in zip(self.ids(), records):
+            if stored_id != record_id:
+                raise ValueError(f"record {record_id!r} does not match stored id {stored_id!r}; is this the same corpus?")
+        yield from records
+
+    async def aresume(self, records: Union[Iterable[Record], AsyncIterable[Record]]) -> AsyncIterator[Record]:
+        """``resume`` over a sync or async iterable."""
+        if not isinstance(records, AsyncIterableABC):
+            for record in self.resume(records):
+                yield record
+            return
+        stored = self.ids()
+        async for record in records:
+            stored_id = next(stored, None)
+            if stored_id is None:
+                yield record
+            elif stored_id != record[0]:
+                raise ValueError(f"record {record[0]!r} does not match stored id {stored_id!r}; is this the same corpus?")
+
+    def write_corpus(self, embed: Callable[[Iterable[str]], Iterable[EmbeddingBlock]], records: Iterable[Record]) -> int:
+        """Embed the ``(id, text)`` records not stored yet and append them as blocks arrive.
+
+        ``embed`` maps texts to ordered blocks, e.g. ``lambda texts: client.embed_corpus(texts, model)``.
+        Rerunning the same call after a crash picks up where the last one stopped. Returns the
+        number of rows written.
+        """
+        pending: deque[str] = deque()
+
+        def texts() -> Iterator[str]:
+            for record_id, text in self.resume(records):
+                pending.append(record_id)
+                yield text
+
+        written = 0
+        for block in embed(texts()):
+            rows = len(block.embeddings)
+            self.append(block.embeddings, [pending.popleft() for _ in range(rows)])
+            written += rows
+        return written
+
+    async def awrite_corpus(
+        self,
+        embed: Callable[[AsyncIterator[str]], AsyncIterable[EmbeddingBlock]],
+        records: Union[Iterable[Record], AsyncIterable[Record]],
+    ) -> int:
+        """Async counterpart of ``write_corpus``; file writes are short and blocking."""
+        pending: deque[str] = deque()
+
+        async def texts() -> AsyncIterator[str]:
+            async for record_id, text in self.aresume(records):
+                pending.append(record_id)
+                yield text
+
+        written = 0
+        async for block in embed(texts()):
+            rows = len(block.embeddings)
+            self.append(block.embeddings, [pending.popleft() for _ in range(rows)])
+            written += rows
+        return written
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional
+from typing_extensions import NotRequired, TypedDict
+
+from ._types import ChatCompletionsResponse
+
+
+class FunctionDelta(TypedDict, total=False):
+    name: NotRequired[str]
+    arguments: NotRequired[str]
+
+
+class ToolCallDelta(TypedDict, total=False):
+    index: int
+    id: NotRequired[str]
+    type: NotRequired[str]
+    function: NotRequired[FunctionDelta]
+
+
+class ChoiceDelta(TypedDict, total=False):
+    role: NotRequired[str]
+    content: NotRequired[Optional[str]]
+    tool_calls: NotRequired[List[ToolCallDelta]]
+
+
+class ChunkChoice(TypedDict, total=False):
+    index: int
+    delta: ChoiceDelta
+    finish_reason: NotRequired[Optional[str]]
+
+
+class ChunkUsage(TypedDict, total=False):
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+class ChatCompletionChunk(TypedDict, total=False):
+    id: str
+    object: str
+    created: int
+    model: str
+    choices: List[ChunkChoice]
+    usage: NotRequired[Optional[ChunkUsage]]
+
+
+class ServerSentEvent(NamedTuple):
+    data: str
+    event: Optional[str] = None
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+    def json(self) -> Any:
+        return json.loads(self.data)
+
+
+class SSEDecoder:
+    """Incremental ``text/event-stream`` decoder fed with raw response bytes.
+
+    Handles ``\\n``/``\\r\\n``/``\\r`` line endings split across reads, multi-line ``data:`` fields,
+    ``:`` comments (keep-alives) and the ``event``/``id``/``retry`` fields.
+    """
+
+    def __init__(self) -> None:
+        self._pending = b""
+        self._data: List[bytes] = []
+        self._event: Optional[str] = None
+        self._id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        if self._pending:
+            chunk = self._pending + chunk
+            self._pending = b""
+        lines = chunk.splitlines(keepends=True)
+        # An unterminated line (or a "\r" whose "\n" may still be in flight) waits for more bytes.
+        if lines and not lines[-1].endswith(b"\n"):
+            self._pending = lines.pop()
+        events = []
+        for line in lines:
+            event = self._process(line.rstrip(b"\r\n"))
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> List[ServerSentEvent]:
+        pending, self._pending = self._pending, b""
+        events = []
+        for line in (pending.rstrip(b"\r\n"), b""):
+            event = self._process(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _process(self, line: bytes) -> Optional[ServerSentEvent]:
+        if not line:
+            return self._dispatch()
+        if line[:1] == b":":
+            return None
+        field, _, value = line.partition(b":")
+        if value[:1] == b" ":
+            value = value[1:]
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value.decode("utf-8")
+        elif field == b"id":
+            self._id = value.decode("utf-8")
+        elif field == b"retry" and value.isdigit():
+            self._retry = int(value)
+        return None
+
+    def _dispatch(self) -> Optional[ServerSentEvent]:
+        if not self._data:
+            self._event = None
+            return None
+        data = self._data[0] if len(self._data) == 1 else b"\n".join(self._data)
+        event = ServerSentEvent(data.decode("utf-8"), self._event, self._id, self._retry)
+        self._data = []
+        self._event = None
+        return event
+
+
+def iter_sse(chunks: Iterable[bytes]) -> Iterator[ServerSentEvent]:
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_sse(chunks: AsyncIterable[bytes]) -> AsyncIterator[ServerSentEvent]:
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.flush():
+        yield event
+
+
+def iter_json_events(events: Iterable[ServerSentEvent]) -> Iterator[Dict[str, Any]]:
+    for event in events:
+        if event.data == "[DONE]":
+            return
+        yield json.loads(event.data)
+
+
+async def aiter_json_events(events: AsyncIterable[ServerSentEvent]) -> AsyncIterator[Dict[str, Any]]:
+    async for event in events:
+        if event.data == "[DONE]":
+            return
+        yield json.loads(event.data)
+
+
+class ChatCompletionAccumulator:
+    """Folds streamed ``ChatCompletionChunk`` deltas into the final ``ChatCompletionsResponse``.
+
+    Content and tool-call argument fragments are collected as lists and joined once at the end,
+    so the stream is never re-serialised or re-parsed.
+    """
+
+    def __init__(self) -> None:
+        self._fields: Dict[str, Any] = {}
+        self._choices: Dict[int, Dict[str, Any]] = {}
+        self.usage: Optional[ChunkUsage] = None
+
+    def add(self, chunk: ChatCompletionChunk) -> ChatCompletionChunk:
+        for key in ("id", "object", "created", "model"):
+            value = chunk.get(key)
+            if value is not None:
+                self._fields[key] = value
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+        for choice in chunk.get("choices") or ():
+            state = self._choices.get(choice.get("index", 0))
+            if state is None:
+                state = self._choices[choice.get("index", 0)] = {"role": None, "content": [], "tool_calls": {}, "finish_reason": None}
+            delta = choice.get("delta") or {}
+            if delta.get("role"):
+                state["role"] = delta["role"]
+            if delta.get("content"):
+                state["content"].append(delta["content"])
+            for fragment in delta.get("tool_calls") or ():
+                call = state["tool_calls"].get(fragment.get("index", 0))
+                if call is None:
+                    call = state["tool_calls"][fragment.get("index", 0)] = {"id": None, "type": "function", "name": [], "arguments": []}
+                if fragment.get("id"):
+                    call["id"] = fragment["id"]
+                if fragment.get("type"):
+                    call["type"] = fragment["type"]
+                function = fragment.get("function") or {}
+                if function.get("name"):
+                    call["name"].append(function["name"])
+                if function.get("arguments"):
+                    call["arguments"].append(function["arguments"])
+            if choice.get("finish_reason"):
+                state["finish_reason"] = choice["finish_reason"]
+        return chunk
+
+    def to_dict(self) -> Dict[str, Any]:
+        choices = []
+        for index in sorted(self._choices):
+            state = self._choices[index]
+            message: Dict[str, Any] = {"role": state["role"] or "assistant", "content": "".join(state["content"]) if state["content"] else None}
+            if state["tool_calls"]:
+                message["tool_calls"] = [
+                    {
+                        "id": call["id"] or "",
+                        "type": call["type"],
+                        "function": {"name": "".join(call["name"]), "arguments": "".join(call["arguments"])},
+                    }
+                    for _, call in sorted(state["tool_calls"].items())
+                ]
+            choices.append({"index": index, "message": message, "finish_reason": state["finish_reason"]})
+        return {**self._fields, "object": "chat.completion", "choices": choices, "usage": self.usage}
+
+    def response(self) -> ChatCompletionsResponse:
+        return ChatCompletionsResponse.from_dict(self.to_dict())
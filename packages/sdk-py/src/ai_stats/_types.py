@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ._lazy import attach
+
+if TYPE_CHECKING:
+    from ai_stats_generated.models.list_models200_response import ListModels200Response as ModelListResponse
+    from ai_stats_generated.models.healthz200_response import Healthz200Response as HealthzGet200Response
+    from ai_stats_generated.models.chat_completions_request import ChatCompletionsRequest
+    from ai_stats_generated.models.chat_completions_response import ChatCompletionsResponse
+    from ai_stats_generated.models.reasoning_config import ReasoningConfig as ChatCompletionsRequestReasoning
+    from ai_stats_generated.models.chat_completions_request_tool_choice import ChatCompletionsRequestToolChoice
+    from ai_stats_generated.models.chat_message import ChatMessage
+    from ai_stats_generated.models.model_id import ModelId
+    from ai_stats_generated.models.images_generation_request import ImagesGenerationRequest as ImageGenerationRequest
+    from ai_stats_generated.models.images_generation_response import ImagesGenerationResponse as ImageGenerationResponse
+    from ai_stats_generated.models.moderations_request import ModerationsRequest as ModerationRequest
+    from ai_stats_generated.models.moderations_response import ModerationsResponse as ModerationResponse
+    from ai_stats_generated.models.video_generation_request import VideoGenerationRequest
+    from ai_stats_generated.models.video_generation_response import VideoGenerationResponse
+    from ai_stats_generated.models.responses_request import ResponsesRequest
+    from ai_stats_generated.models.responses_response import ResponsesResponse
+    from ai_stats_generated.models.audio_speech_request import AudioSpeechRequest
+    from ai_stats_generated.models.audio_transcription_response import AudioTranscriptionResponse
+    from ai_stats_generated.models.audio_translation_response import AudioTranslationResponse
+    from ai_stats_generated.models.batch_request import BatchRequest
+    from ai_stats_generated.models.batch_response import BatchResponse
+    from ai_stats_generated.models.file_response import FileResponse as FileObject
+    from ai_stats_generated.models.list_files_response import ListFilesResponse as FileListResponse
+    from ai_stats_generated.models.embeddings_request import EmbeddingsRequest
+    from ai_stats_generated.models.embeddings_response import EmbeddingsResponse
+    from ai_stats_generated.models.generation_response import GenerationResponse
+    from ai_stats_generated.models.get_analytics200_response import GetAnalytics200Response
+    from ai_stats_generated.models.get_analytics_request import GetAnalyticsRequest
+    from ai_stats_generated.models.images_edit_response import ImagesEditResponse as ImageEditResponse
+    from ai_stats_generated.models.root200_response import Root200Response
+
+    from ._params import AudioTranscriptionRequest, AudioTranslationRequest, ChatCompletionsParams
+
+# Each generated model is imported the first time it is looked up here, so touching one model does
+# not pay for all of them.
+_EXPORTS = {
+    "ModelListResponse": ("ai_stats_generated.models.list_models200_response", "ListModels200Response"),
+    "HealthzGet200Response": ("ai_stats_generated.models.healthz200_response", "Healthz200Response"),
+    "ChatCompletionsRequest": ("ai_stats_generated.models.chat_completions_request", "ChatCompletionsRequest"),
+    "ChatCompletionsResponse": ("ai_stats_generated.models.chat_completions_response", "ChatCompletionsResponse"),
+    "ChatCompletionsRequestReasoning": ("ai_stats_generated.models.reasoning_config", "ReasoningConfig"),
+    "ChatCompletionsRequestToolChoice": ("ai_stats_generated.models.chat_completions_request_tool_choice", "ChatCompletionsRequestToolChoice"),
+    "ChatMessage": ("ai_stats_generated.models.chat_message", "ChatMessage"),
+    "ModelId": ("ai_stats_generated.models.model_id", "ModelId"),
+    "ImageGenerationRequest": ("ai_stats_generated.models.images_generation_request", "ImagesGenerationRequest"),
+    "ImageGenerationResponse": ("ai_stats_generated.models.images_generation_response", "ImagesGenerationResponse"),
+    "ModerationRequest": ("ai_stats_generated.models.moderations_request", "ModerationsRequest"),
+    "ModerationResponse": ("ai_stats_generated.models.moderations_response", "ModerationsResponse"),
+    "VideoGenerationRequest": ("ai_stats_generated.models.video_generation_request", "VideoGenerationRequest"),
+    "VideoGenerationResponse": ("ai_stats_generated.models.video_generation_response", "VideoGenerationResponse"),
+    "ResponsesRequest": ("ai_stats_generated.models.responses_request", "ResponsesRequest"),
+    "ResponsesResponse": ("ai_stats_generated.models.responses_response", "ResponsesResponse"),
+    "AudioSpeechRequest": ("ai_stats_generated.models.audio_speech_request", "AudioSpeechRequest"),
+    "AudioTranscriptionResponse": ("ai_stats_generated.models.audio_transcription_response", "AudioTranscriptionResponse"),
+    "AudioTranslationResponse": ("ai_stats_generated.models.audio_translation_response", "AudioTranslationResponse"),
+    "BatchRequest": ("ai_stats_generated.models.batch_request", "BatchRequest"),
+    "BatchResponse": ("ai_stats_generated.models.batch_response", "BatchResponse"),
+    "FileObject": ("ai_stats_generated.models.file_response", "FileResponse"),
+    "FileListResponse": ("ai_stats_generated.models.list_files_response", "ListFilesResponse"),
+    "EmbeddingsRequest": ("ai_stats_generated.models.embeddings_request", "EmbeddingsRequest"),
+    "EmbeddingsResponse": ("ai_stats_generated.models.embeddings_response", "EmbeddingsResponse"),
+    "GenerationResponse": ("ai_stats_generated.models.generation_response", "GenerationResponse"),
+    "GetAnalytics200Response": ("ai_stats_generated.models.get_analytics200_response", "GetAnalytics200Response"),
+    "GetAnalyticsRequest": ("ai_stats_generated.models.get_analytics_request", "GetAnalyticsRequest"),
+    "ImageEditResponse": ("ai_stats_generated.models.images_edit_response", "ImagesEditResponse"),
+    "Root200Response": ("ai_stats_generated.models.root200_response", "Root200Response"),
+    "ChatCompletionsParams": ("._params", "ChatCompletionsParams"),
+    "AudioTranscriptionRequest": ("._params", "AudioTranscriptionRequest"),
+    "AudioTranslationRequest": ("._params", "AudioTranslationRequest"),
+}
+
+_resolve, __dir__ = attach(__name__, _EXPORTS)
+
+MODEL_IDS: tuple[ModelId, ...]
+
+
+def __getattr__(name: str) -> Any:
+    # ``ModelId`` has hundreds of members; only build the tuple when it is first asked for.
+    if name == "MODEL_IDS":
+        value = globals()["MODEL_IDS"] = tuple(_resolve("ModelId"))
+        return value
+    return _resolve(name)
@@ -100,89 +100,190 @@ __all__ = [
     "VideoGenerationResponseOutputInner",
 ]
 
-# import apis into sdk package
-from ai_stats_generated.api.default_api import DefaultApi as DefaultApi
-
-# import ApiClient
-from ai_stats_generated.api_response import ApiResponse as ApiResponse
-from ai_stats_generated.api_client import ApiClient as ApiClient
-from ai_stats_generated.configuration import Configuration as Configuration
-from ai_stats_generated.exceptions import OpenApiException as OpenApiException
-from ai_stats_generated.exceptions import ApiTypeError as ApiTypeError
-from ai_stats_generated.exceptions import ApiValueError as ApiValueError
-from ai_stats_generated.exceptions import ApiKeyError as ApiKeyError
-from ai_stats_generated.exceptions import ApiAttributeError as ApiAttributeError
-from ai_stats_generated.exceptions import ApiException as ApiException
-
-# import models into sdk package
-from ai_stats_generated.models.audio_content_part import AudioContentPart as AudioContentPart
-from ai_stats_generated.models.audio_content_part_input_audio import AudioContentPartInputAudio as AudioContentPartInputAudio
-from ai_stats_generated.models.audio_speech_request import AudioSpeechRequest as AudioSpeechRequest
-from ai_stats_generated.models.audio_transcription_response import AudioTranscriptionResponse as AudioTranscriptionResponse
-from ai_stats_generated.models.audio_translation_response import AudioTranslationResponse as AudioTranslationResponse
-from ai_stats_generated.models.batch_request import BatchRequest as BatchRequest
-from ai_stats_generated.models.batch_request_counts import BatchRequestCounts as BatchRequestCounts
-from ai_stats_generated.models.batch_response import BatchResponse as BatchResponse
-from ai_stats_generated.models.benchmark_id import BenchmarkId as BenchmarkId
-from ai_stats_generated.models.chat_choice import ChatChoice as ChatChoice
-from ai_stats_generated.models.chat_completions_request import ChatCompletionsRequest as ChatCompletionsRequest
-from ai_stats_generated.models.chat_completions_request_response_format import ChatCompletionsRequestResponseFormat as ChatCompletionsRequestResponseFormat
-from ai_stats_generated.models.chat_completions_request_response_format_one_of import ChatCompletionsRequestResponseFormatOneOf as ChatCompletionsRequestResponseFormatOneOf
-from ai_stats_generated.models.chat_completions_request_tool_choice import ChatCompletionsRequestToolChoice as ChatCompletionsRequestToolChoice
-from ai_stats_generated.models.chat_completions_request_tools_inner import ChatCompletionsRequestToolsInner as ChatCompletionsRequestToolsInner
-from ai_stats_generated.models.chat_completions_response import ChatCompletionsResponse as ChatCompletionsResponse
-from ai_stats_generated.models.chat_message import ChatMessage as ChatMessage
-from ai_stats_generated.models.chat_message_content import ChatMessageContent as ChatMessageContent
-from ai_stats_generated.models.embedding import Embedding as Embedding
-from ai_stats_generated.models.embeddings_request import EmbeddingsRequest as EmbeddingsRequest
-from ai_stats_generated.models.embeddings_request_input import EmbeddingsRequestInput as EmbeddingsRequestInput
-from ai_stats_generated.models.embeddings_response import EmbeddingsResponse as EmbeddingsResponse
-from ai_stats_generated.models.file_response import FileResponse as FileResponse
-from ai_stats_generated.models.generation_response import GenerationResponse as GenerationResponse
-from ai_stats_generated.models.generation_response_usage import GenerationResponseUsage as GenerationResponseUsage
-from ai_stats_generated.models.get_analytics200_response import GetAnalytics200Response as GetAnalytics200Response
-from ai_stats_generated.models.get_analytics_request import GetAnalyticsRequest as GetAnalyticsRequest
-from ai_stats_generated.models.get_generation401_response import GetGeneration401Response as GetGeneration401Response
-from ai_stats_generated.models.get_generation404_response import GetGeneration404Response as GetGeneration404Response
-from ai_stats_generated.models.healthz200_response import Healthz200Response as Healthz200Response
-from ai_stats_generated.models.image import Image as Image
-from ai_stats_generated.models.image_content_part import ImageContentPart as ImageContentPart
-from ai_stats_generated.models.image_content_part_image_url import ImageContentPartImageUrl as ImageContentPartImageUrl
-from ai_stats_generated.models.image_moderation_input import ImageModerationInput as ImageModerationInput
-from ai_stats_generated.models.images_edit_response import ImagesEditResponse as ImagesEditResponse
-from ai_stats_generated.models.images_generation_request import ImagesGenerationRequest as ImagesGenerationRequest
-from ai_stats_generated.models.images_generation_response import ImagesGenerationResponse as ImagesGenerationResponse
-from ai_stats_generated.models.list_files_response import ListFilesResponse as ListFilesResponse
-from ai_stats_generated.models.list_models200_response import ListModels200Response as ListModels200Response
-from ai_stats_generated.models.list_models500_response import ListModels500Response as ListModels500Response
-from ai_stats_generated.models.list_models_organisation_parameter import ListModelsOrganisationParameter as ListModelsOrganisationParameter
-from ai_stats_generated.models.message_content_part import MessageContentPart as MessageContentPart
-from ai_stats_generated.models.model import Model as Model
-from ai_stats_generated.models.model_id import ModelId as ModelId
-from ai_stats_generated.models.model_providers_inner import ModelProvidersInner as ModelProvidersInner
-from ai_stats_generated.models.moderation_categories import ModerationCategories as ModerationCategories
-from ai_stats_generated.models.moderation_category_scores import ModerationCategoryScores as ModerationCategoryScores
-from ai_stats_generated.models.moderation_result import ModerationResult as ModerationResult
-from ai_stats_generated.models.moderations_request import ModerationsRequest as ModerationsRequest
-from ai_stats_generated.models.moderations_request_input import ModerationsRequestInput as ModerationsRequestInput
-from ai_stats_generated.models.moderations_request_input_one_of_inner import ModerationsRequestInputOneOfInner as ModerationsRequestInputOneOfInner
-from ai_stats_generated.models.moderations_response import ModerationsResponse as ModerationsResponse
-from ai_stats_generated.models.organisation_id import OrganisationId as OrganisationId
-from ai_stats_generated.models.reasoning_config import ReasoningConfig as ReasoningConfig
-from ai_stats_generated.models.responses_request import ResponsesRequest as ResponsesRequest
-from ai_stats_generated.models.responses_request_prompt import ResponsesRequestPrompt as ResponsesRequestPrompt
-from ai_stats_generated.models.responses_request_reasoning import ResponsesRequestReasoning as ResponsesRequestReasoning
-from ai_stats_generated.models.responses_response import ResponsesResponse as ResponsesResponse
-from ai_stats_generated.models.root200_response import Root200Response as Root200Response
-from ai_stats_generated.models.text_content_part import TextContentPart as TextContentPart
-from ai_stats_generated.models.text_moderation_input import TextModerationInput as TextModerationInput
-from ai_stats_generated.models.tool_call import ToolCall as ToolCall
-from ai_stats_generated.models.tool_call_content_part import ToolCallContentPart as ToolCallContentPart
-from ai_stats_generated.models.tool_call_content_part_function import ToolCallContentPartFunction as ToolCallContentPartFunction
-from ai_stats_generated.models.tool_call_function import ToolCallFunction as ToolCallFunction
-from ai_stats_generated.models.usage import Usage as Usage
-from ai_stats_generated.models.video_content_part import VideoContentPart as VideoContentPart
-from ai_stats_generated.models.video_generation_request import VideoGenerationRequest as VideoGenerationRequest
-from ai_stats_generated.models.video_generation_response import VideoGenerationResponse as VideoGenerationResponse
-from ai_stats_generated.models.video_generation_response_output_inner import VideoGenerationResponseOutputInner as VideoGenerationResponseOutputInner
+import importlib
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from ai_stats_generated.api.default_api import DefaultApi as DefaultApi
+
+    # import ApiClient
+    from ai_stats_generated.api_response import ApiResponse as ApiResponse
+    from ai_stats_generated.api_client import ApiClient as ApiClient
+    from ai_stats_generated.configuration import Configuration as Configuration
+    from ai_stats_generated.exceptions import OpenApiException as OpenApiException
+    from ai_stats_generated.exceptions import ApiTypeError as ApiTypeError
+    from ai_stats_generated.exceptions import ApiValueError as ApiValueError
+    from ai_stats_generated.exceptions import ApiKeyError as ApiKeyError
+    from ai_stats_generated.exceptions import ApiAttributeError as ApiAttributeError
+    from ai_stats_generated.exceptions import ApiException as ApiException
+
+    # import models into sdk package
+    from ai_stats_generated.models.audio_content_part import AudioContentPart as AudioContentPart
+    from ai_stats_generated.models.audio_content_part_input_audio import AudioContentPartInputAudio as AudioContentPartInputAudio
+    from ai_stats_generated.models.audio_speech_request import AudioSpeechRequest as AudioSpeechRequest
+    from ai_stats_generated.models.audio_transcription_response import AudioTranscriptionResponse as AudioTranscriptionResponse
+    from ai_stats_generated.models.audio_translation_response import AudioTranslationResponse as AudioTranslationResponse
+    from ai_stats_generated.models.batch_request import BatchRequest as BatchRequest
+    from ai_stats_generated.models.batch_request_counts import BatchRequestCounts as BatchRequestCounts
+    from ai_stats_generated.models.batch_response import BatchResponse as BatchResponse
+    from ai_stats_generated.models.benchmark_id import BenchmarkId as BenchmarkId
+    from ai_stats_generated.models.chat_choice import ChatChoice as ChatChoice
+    from ai_stats_generated.models.chat_completions_request import ChatCompletionsRequest as ChatCompletionsRequest
+    from ai_stats_generated.models.chat_completions_request_response_format import ChatCompletionsRequestResponseFormat as ChatCompletionsRequestResponseFormat
+    from ai_stats_generated.models.chat_completions_request_response_format_one_of import ChatCompletionsRequestResponseFormatOneOf as ChatCompletionsRequestResponseFormatOneOf
+    from ai_stats_generated.models.chat_completions_request_tool_choice import ChatCompletionsRequestToolChoice as ChatCompletionsRequestToolChoice
+    from ai_stats_generated.models.chat_completions_request_tools_inner import ChatCompletionsRequestToolsInner as ChatCompletionsRequestToolsInner
+    from ai_stats_generated.models.chat_completions_response import ChatCompletionsResponse as ChatCompletionsResponse
+    from ai_stats_generated.models.chat_message import ChatMessage as ChatMessage
+    from ai_stats_generated.models.chat_message_content import ChatMessageContent as ChatMessageContent
+    from ai_stats_generated.models.embedding import Embedding as Embedding
+    from ai_stats_generated.models.embeddings_request import EmbeddingsRequest as EmbeddingsRequest
+    from ai_stats_generated.models.embeddings_request_input import EmbeddingsRequestInput as EmbeddingsRequestInput
+    from ai_stats_generated.models.embeddings_response import EmbeddingsResponse as EmbeddingsResponse
+    from ai_stats_generated.models.file_response import FileResponse as FileResponse
+    from ai_stats_generated.models.generation_response import GenerationResponse as GenerationResponse
+    from ai_stats_generated.models.generation_response_usage import GenerationResponseUsage as GenerationResponseUsage
+    from ai_stats_generated.models.get_analytics200_response import GetAnalytics200Response as GetAnalytics200Response
+    from ai_stats_generated.models.get_analytics_request import GetAnalyticsRequest as GetAnalyticsRequest
+    from ai_stats_generated.models.get_generation401_response import GetGeneration401Response as GetGeneration401Response
+    from ai_stats_generated.models.get_generation404_response import GetGeneration404Response as GetGeneration404Response
+    from ai_stats_generated.models.healthz200_response import Healthz200Response as Healthz200Response
+    from ai_stats_generated.models.image import Image as Image
+    from ai_stats_generated.models.image_content_part import ImageContentPart as ImageContentPart
+    from ai_stats_generated.models.image_content_part_image_url import ImageContentPartImageUrl as ImageContentPartImageUrl
+    from ai_stats_generated.models.image_moderation_input import ImageModerationInput as ImageModerationInput
+    from ai_stats_generated.models.images_edit_response import ImagesEditResponse as ImagesEditResponse
+    from ai_stats_generated.models.images_generation_request import ImagesGenerationRequest as ImagesGenerationRequest
+    from ai_stats_generated.models.images_generation_response import ImagesGenerationResponse as ImagesGenerationResponse
+    from ai_stats_generated.models.list_files_response import ListFilesResponse as ListFilesResponse
+    from ai_stats_generated.models.list_models200_response import ListModels200Response as ListModels200Response
+    from ai_stats_generated.models.list_models500_response import ListModels500Response as ListModels500Response
+    from ai_stats_generated.models.list_models_organisation_parameter import ListModelsOrganisationParameter as ListModelsOrganisationParameter
+    from ai_stats_generated.models.message_content_part import MessageContentPart as MessageContentPart
+    from ai_stats_generated.models.model import Model as Model
+    from ai_stats_generated.models.model_id import ModelId as ModelId
+    from ai_stats_generated.models.model_providers_inner import ModelProvidersInner as ModelProvidersInner
+    from ai_stats_generated.models.moderation_categories import ModerationCategories as ModerationCategories
+    from ai_stats_generated.models.moderation_category_scores import ModerationCategoryScores as ModerationCategoryScores
+    from ai_stats_generated.models.moderation_result import ModerationResult as ModerationResult
+    from ai_stats_generated.models.moderations_request import ModerationsRequest as ModerationsRequest
+    from ai_stats_generated.models.moderations_request_input import ModerationsRequestInput as ModerationsRequestInput
+    from ai_stats_generated.models.moderations_request_input_one_of_inner import ModerationsRequestInputOneOfInner as ModerationsRequestInputOneOfInner
+    from ai_stats_generated.models.moderations_response import ModerationsResponse as ModerationsResponse
+    from ai_stats_generated.models.organisation_id import OrganisationId as OrganisationId
+    from ai_stats_generated.models.reasoning_config import ReasoningConfig as ReasoningConfig
+    from ai_stats_generated.models.responses_request import ResponsesRequest as ResponsesRequest
+    from ai_stats_generated.models.responses_request_prompt import ResponsesRequestPrompt as ResponsesRequestPrompt
+    from ai_stats_generated.models.responses_request_reasoning import ResponsesRequestReasoning as ResponsesRequestReasoning
+    from ai_stats_generated.models.responses_response import ResponsesResponse as ResponsesResponse
+    from ai_stats_generated.models.root200_response import Root200Response as Root200Response
+    from ai_stats_generated.models.text_content_part import TextContentPart as TextContentPart
+    from ai_stats_generated.models.text_moderation_input import TextModerationInput as TextModerationInput
+    from ai_stats_generated.models.tool_call import ToolCall as ToolCall
+    from ai_stats_generated.models.tool_call_content_part import ToolCallContentPart as ToolCallContentPart
+    from ai_stats_generated.models.tool_call_content_part_function import ToolCallContentPartFunction as ToolCallContentPartFunction
+    from ai_stats_generated.models.tool_call_function import ToolCallFunction as ToolCallFunction
+    from ai_stats_generated.models.usage import Usage as Usage
+    from ai_stats_generated.models.video_content_part import VideoContentPart as VideoContentPart
+    from ai_stats_generated.models.video_generation_request import VideoGenerationRequest as VideoGenerationRequest
+    from ai_stats_generated.models.video_generation_response import VideoGenerationResponse as VideoGenerationResponse
+    from ai_stats_generated.models.video_generation_response_output_inner import VideoGenerationResponseOutputInner as VideoGenerationResponseOutputInner
+
+# Re-exports are imported on first attribute access (PEP 562), not when the package is imported.
+_LAZY_IMPORTS = {
+    "DefaultApi": ("ai_stats_generated.api.default_api", "DefaultApi"),
+    "ApiResponse": ("ai_stats_generated.api_response", "ApiResponse"),
+    "ApiClient": ("ai_stats_generated.api_client", "ApiClient"),
+    "Configuration": ("ai_stats_generated.configuration", "Configuration"),
+    "OpenApiException": ("ai_stats_generated.exceptions", "OpenApiException"),
+    "ApiTypeError": ("ai_stats_generated.exceptions", "ApiTypeError"),
+    "ApiValueError": ("ai_stats_generated.exceptions", "ApiValueError"),
+    "ApiKeyError": ("ai_stats_generated.exceptions", "ApiKeyError"),
+    "ApiAttributeError": ("ai_stats_generated.exceptions", "ApiAttributeError"),
+    "ApiException": ("ai_stats_generated.exceptions", "ApiException"),
+    "AudioContentPart": ("ai_stats_generated.models.audio_content_part", "AudioContentPart"),
+    "AudioContentPartInputAudio": ("ai_stats_generated.models.audio_content_part_input_audio", "AudioContentPartInputAudio"),
+    "AudioSpeechRequest": ("ai_stats_generated.models.audio_speech_request", "AudioSpeechRequest"),
+    "AudioTranscriptionResponse": ("ai_stats_generated.models.audio_transcription_response", "AudioTranscriptionResponse"),
+    "AudioTranslationResponse": ("ai_stats_generated.models.audio_translation_response", "AudioTranslationResponse"),
+    "BatchRequest": ("ai_stats_generated.models.batch_request", "BatchRequest"),
+    "BatchRequestCounts": ("ai_stats_generated.models.batch_request_counts", "BatchRequestCounts"),
+    "BatchResponse": ("ai_stats_generated.models.batch_response", "BatchResponse"),
+    "BenchmarkId": ("ai_stats_generated.models.benchmark_id", "BenchmarkId"),
+    "ChatChoice": ("ai_stats_generated.models.chat_choice", "ChatChoice"),
+    "ChatCompletionsRequest": ("ai_stats_generated.models.chat_completions_request", "ChatCompletionsRequest"),
+    "ChatCompletionsRequestResponseFormat": ("ai_stats_generated.models.chat_completions_request_response_format", "ChatCompletionsRequestResponseFormat"),
+    "ChatCompletionsRequestResponseFormatOneOf": ("ai_stats_generated.models.chat_completions_request_response_format_one_of", "ChatCompletionsRequestResponseFormatOneOf"),
+    "ChatCompletionsRequestToolChoice": ("ai_stats_generated.models.chat_completions_request_tool_choice", "ChatCompletionsRequestToolChoice"),
+    "ChatCompletionsRequestToolsInner": ("ai_stats_generated.models.chat_completions_request_tools_inner", "ChatCompletionsRequestToolsInner"),
+    "ChatCompletionsResponse": ("ai_stats_generated.models.chat_completions_response", "ChatCompletionsResponse"),
+    "ChatMessage": ("ai_stats_generated.models.chat_message", "ChatMessage"),
+    "ChatMessageContent": ("ai_stats_generated.models.chat_message_content", "ChatMessageContent"),
+    "Embedding": ("ai_stats_generated.models.embedding", "Embedding"),
+    "EmbeddingsRequest": ("ai_stats_generated.models.embeddings_request", "EmbeddingsRequest"),
+    "EmbeddingsRequestInput": ("ai_stats_generated.models.embeddings_request_input", "EmbeddingsRequestInput"),
+    "EmbeddingsResponse": ("ai_stats_generated.models.embeddings_response", "EmbeddingsResponse"),
+    "FileResponse": ("ai_stats_generated.models.file_response", "FileResponse"),
+    "GenerationResponse": ("ai_stats_generated.models.generation_response", "GenerationResponse"),
+    "GenerationResponseUsage": ("ai_stats_generated.models.generation_response_usage", "GenerationResponseUsage"),
+    "GetAnalytics200Response": ("ai_stats_generated.models.get_analytics200_response", "GetAnalytics200Response"),
+    "GetAnalyticsRequest": ("ai_stats_generated.models.get_analytics_request", "GetAnalyticsRequest"),
+    "GetGeneration401Response": ("ai_stats_generated.models.get_generation401_response", "GetGeneration401Response"),
+    "GetGeneration404Response": ("ai_stats_generated.models.get_generation404_response", "GetGeneration404Response"),
+    "Healthz200Response": ("ai_stats_generated.models.healthz200_response", "Healthz200Response"),
+    "Image": ("ai_stats_generated.models.image", "Image"),
+    "ImageContentPart": ("ai_stats_generated.models.image_content_part", "ImageContentPart"),
+    "ImageContentPartImageUrl": ("ai_stats_generated.models.image_content_part_image_url", "ImageContentPartImageUrl"),
+    "ImageModerationInput": ("ai_stats_generated.models.image_moderation_input", "ImageModerationInput"),
+    "ImagesEditResponse": ("ai_stats_generated.models.images_edit_response", "ImagesEditResponse"),
+    "ImagesGenerationRequest": ("ai_stats_generated.models.images_generation_request", "ImagesGenerationRequest"),
+    "ImagesGenerationResponse": ("ai_stats_generated.models.images_generation_response", "ImagesGenerationResponse"),
+    "ListFilesResponse": ("ai_stats_generated.models.list_files_response", "ListFilesResponse"),
+    "ListModels200Response": ("ai_stats_generated.models.list_models200_response", "ListModels200Response"),
+    "ListModels500Response": ("ai_stats_generated.models.list_models500_response", "ListModels500Response"),
+    "ListModelsOrganisationParameter": ("ai_stats_generated.models.list_models_organisation_parameter", "ListModelsOrganisationParameter"),
+    "MessageContentPart": ("ai_stats_generated.models.message_content_part", "MessageContentPart"),
+    "Model": ("ai_stats_generated.models.model", "Model"),
+    "ModelId": ("ai_stats_generated.models.model_id", "ModelId"),
+    "ModelProvidersInner": ("ai_stats_generated.models.model_providers_inner", "ModelProvidersInner"),
+    "ModerationCategories": ("ai_stats_generated.models.moderation_categories", "ModerationCategories"),
+    "ModerationCategoryScores": ("ai_stats_generated.models.moderation_category_scores", "ModerationCategoryScores"),
+    "ModerationResult": ("ai_stats_generated.models.moderation_result", "ModerationResult"),
+    "ModerationsRequest": ("ai_stats_generated.models.moderations_request", "ModerationsRequest"),
+    "ModerationsRequestInput": ("ai_stats_generated.models.moderations_request_input", "ModerationsRequestInput"),
+    "ModerationsRequestInputOneOfInner": ("ai_stats_generated.models.moderations_request_input_one_of_inner", "ModerationsRequestInputOneOfInner"),
+    "ModerationsResponse": ("ai_stats_generated.models.moderations_response", "ModerationsResponse"),
+    "OrganisationId": ("ai_stats_generated.models.organisation_id", "OrganisationId"),
+    "ReasoningConfig": ("ai_stats_generated.models.reasoning_config", "ReasoningConfig"),
+    "ResponsesRequest": ("ai_stats_generated.models.responses_request", "ResponsesRequest"),
+    "ResponsesRequestPrompt": ("ai_stats_generated.models.responses_request_prompt", "ResponsesRequestPrompt"),
+    "ResponsesRequestReasoning": ("ai_stats_generated.models.responses_request_reasoning", "ResponsesRequestReasoning"),
+    "ResponsesResponse": ("ai_stats_generated.models.responses_response", "ResponsesResponse"),
+    "Root200Response": ("ai_stats_generated.models.root200_response", "Root200Response"),
+    "TextContentPart": ("ai_stats_generated.models.text_content_part", "TextContentPart"),
+    "TextModerationInput": ("ai_stats_generated.models.text_moderation_input", "TextModerationInput"),
+    "ToolCall": ("ai_stats_generated.models.tool_call", "ToolCall"),
+    "ToolCallContentPart": ("ai_stats_generated.models.tool_call_content_part", "ToolCallContentPart"),
+    "ToolCallContentPartFunction": ("ai_stats_generated.models.tool_call_content_part_function", "ToolCallContentPartFunction"),
+    "ToolCallFunction": ("ai_stats_generated.models.tool_call_function", "ToolCallFunction"),
+    "Usage": ("ai_stats_generated.models.usage", "Usage"),
+    "VideoContentPart": ("ai_stats_generated.models.video_content_part", "VideoContentPart"),
+    "VideoGenerationRequest": ("ai_stats_generated.models.video_generation_request", "VideoGenerationRequest"),
+    "VideoGenerationResponse": ("ai_stats_generated.models.video_generation_response", "VideoGenerationResponse"),
+    "VideoGenerationResponseOutputInner": ("ai_stats_generated.models.video_generation_response_output_inner", "VideoGenerationResponseOutputInner"),
+}
+
+
+def __getattr__(name):
+    try:
+        module, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
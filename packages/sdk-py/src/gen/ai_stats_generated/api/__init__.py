@@ -1,5 +1,27 @@
 # flake8: noqa
 
-# import apis into api package
-from ai_stats_generated.api.default_api import DefaultApi
+import importlib
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    # import apis into api package
+    from ai_stats_generated.api.default_api import DefaultApi
+
+# Re-exports are imported on first attribute access (PEP 562), not when the package is imported.
+_LAZY_IMPORTS = {
+    "DefaultApi": ("ai_stats_generated.api.default_api", "DefaultApi"),
+}
+
+
+def __getattr__(name):
+    try:
+        module, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -12,75 +12,166 @@
     Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from ai_stats_generated.models.audio_content_part import AudioContentPart
-from ai_stats_generated.models.audio_content_part_input_audio import AudioContentPartInputAudio
-from ai_stats_generated.models.audio_speech_request import AudioSpeechRequest
-from ai_stats_generated.models.audio_transcription_response import AudioTranscriptionResponse
-from ai_stats_generated.models.audio_translation_response import AudioTranslationResponse
-from ai_stats_generated.models.batch_request import BatchRequest
-from ai_stats_generated.models.batch_request_counts import BatchRequestCounts
-from ai_stats_generated.models.batch_response import BatchResponse
-from ai_stats_generated.models.benchmark_id import BenchmarkId
-from ai_stats_generated.models.chat_choice import ChatChoice
-from ai_stats_generated.models.chat_completions_request import ChatCompletionsRequest
-from ai_stats_generated.models.chat_completions_request_response_format import ChatCompletionsRequestResponseFormat
-from ai_stats_generated.models.chat_completions_request_response_format_one_of import ChatCompletionsRequestResponseFormatOneOf
-from ai_stats_generated.models.chat_completions_request_tool_choice import ChatCompletionsRequestToolChoice
-from ai_stats_generated.models.chat_completions_request_tools_inner import ChatCompletionsRequestToolsInner
-from ai_stats_generated.models.chat_completions_response import ChatCompletionsResponse
-from ai_stats_generated.models.chat_message import ChatMessage
-from ai_stats_generated.models.chat_message_content import ChatMessageContent
-from ai_stats_generated.models.embedding import Embedding
-from ai_stats_generated.models.embeddings_request import EmbeddingsRequest
-from ai_stats_generated.models.embeddings_request_input import EmbeddingsRequestInput
-from ai_stats_generated.models.embeddings_response import EmbeddingsResponse
-from ai_stats_generated.models.file_response import FileResponse
-from ai_stats_generated.models.generation_response import GenerationResponse
-from ai_stats_generated.models.generation_response_usage import GenerationResponseUsage
-from ai_stats_generated.models.get_analytics200_response import GetAnalytics200Response
-from ai_stats_generated.models.get_analytics_request import GetAnalyticsRequest
-from ai_stats_generated.models.get_generation401_response import GetGeneration401Response
-from ai_stats_generated.models.get_generation404_response import GetGeneration404Response
-from ai_stats_generated.models.healthz200_response import Healthz200Response
-from ai_stats_generated.models.image import Image
-from ai_stats_generated.models.image_content_part import ImageContentPart
-from ai_stats_generated.models.image_content_part_image_url import ImageContentPartImageUrl
-from ai_stats_generated.models.image_moderation_input import ImageModerationInput
-from ai_stats_generated.models.images_edit_response import ImagesEditResponse
-from ai_stats_generated.models.images_generation_request import ImagesGenerationRequest
-from ai_stats_generated.models.images_generation_response import ImagesGenerationResponse
-from ai_stats_generated.models.list_files_response import ListFilesResponse
-from ai_stats_generated.models.list_models200_response import ListModels200Response
-from ai_stats_generated.models.list_models500_response import ListModels500Response
-from ai_stats_generated.models.list_models_organisation_parameter import ListModelsOrganisationParameter
-from ai_stats_generated.models.message_content_part import MessageContentPart
-from ai_stats_generated.models.model import Model
-from ai_stats_generated.models.model_id import ModelId
-from ai_stats_generated.models.model_providers_inner import ModelProvidersInner
-from ai_stats_generated.models.moderation_categories import ModerationCategories
-from ai_stats_generated.models.moderation_category_scores import ModerationCategoryScores
-from ai_stats_generated.models.moderation_result import ModerationResult
-from ai_stats_generated.models.moderations_request import ModerationsRequest
-from ai_stats_generated.models.moderations_request_input import ModerationsRequestInput
-from ai_stats_generated.models.moderations_request_input_one_of_inner import ModerationsRequestInputOneOfInner
-from ai_stats_generated.models.moderations_response import ModerationsResponse
-from ai_stats_generated.models.organisation_id import OrganisationId
-from ai_stats_generated.models.reasoning_config import ReasoningConfig
-from ai_stats_generated.models.responses_request import ResponsesRequest
-from ai_stats_generated.models.responses_request_prompt import ResponsesRequestPrompt
-from ai_stats_generated.models.responses_request_reasoning import ResponsesRequestReasoning
-from ai_stats_generated.models.responses_response import ResponsesResponse
-from ai_stats_generated.models.root200_response import Root200Response
-from ai_stats_generated.models.text_content_part import TextContentPart
-from ai_stats_generated.models.text_moderation_input import TextModerationInput
-from ai_stats_generated.models.tool_call import ToolCall
-from ai_stats_generated.models.tool_call_content_part import ToolCallContentPart
-from ai_stats_generated.models.tool_call_content_part_function import ToolCallContentPartFunction
-from ai_stats_generated.models.tool_call_function import ToolCallFunction
-from ai_stats_generated.models.usage import Usage
-from ai_stats_generated.models.video_content_part import VideoContentPart
-from ai_stats_generated.models.video_generation_request import VideoGenerationRequest
-from ai_stats_generated.models.video_generation_response import VideoGenerationResponse
-from ai_stats_generated.models.video_generation_response_output_inner import VideoGenerationResponseOutputInner
+import importlib
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    # import models into model package
+    from ai_stats_generated.models.audio_content_part import AudioContentPart
+    from ai_stats_generated.models.audio_content_part_input_audio import AudioContentPartInputAudio
+    from ai_stats_generated.models.audio_speech_request import AudioSpeechRequest
+    from ai_stats_generated.models.audio_transcription_response import AudioTranscriptionResponse
+    from ai_stats_generated.models.audio_translation_response import AudioTranslationResponse
+    from ai_stats_generated.models.batch_request import BatchRequest
+    from ai_stats_generated.models.batch_request_counts import BatchRequestCounts
+    from ai_stats_generated.models.batch_response import BatchResponse
+    from ai_stats_generated.models.benchmark_id import BenchmarkId
+    from ai_stats_generated.models.chat_choice import ChatChoice
+    from ai_stats_generated.models.chat_completions_request import ChatCompletionsRequest
+    from ai_stats_generated.models.chat_completions_request_response_format import ChatCompletionsRequestResponseFormat
+    from ai_stats_generated.models.chat_completions_request_response_format_one_of import ChatCompletionsRequestResponseFormatOneOf
+    from ai_stats_generated.models.chat_completions_request_tool_choice import ChatCompletionsRequestToolChoice
+    from ai_stats_generated.models.chat_completions_request_tools_inner import ChatCompletionsRequestToolsInner
+    from ai_stats_generated.models.chat_completions_response import ChatCompletionsResponse
+    from ai_stats_generated.models.chat_message import ChatMessage
+    from ai_stats_generated.models.chat_message_content import ChatMessageContent
+    from ai_stats_generated.models.embedding import Embedding
+    from ai_stats_generated.models.embeddings_request import EmbeddingsRequest
+    from ai_stats_generated.models.embeddings_request_input import EmbeddingsRequestInput
+    from ai_stats_generated.models.embeddings_response import EmbeddingsResponse
+    from ai_stats_generated.models.file_response import FileResponse
+    from ai_stats_generated.models.generation_response import GenerationResponse
+    from ai_stats_generated.models.generation_response_usage import GenerationResponseUsage
+    from ai_stats_generated.models.get_analytics200_response import GetAnalytics200Response
+    from ai_stats_generated.models.get_analytics_request import GetAnalyticsRequest
+    from ai_stats_generated.models.get_generation401_response import GetGeneration401Response
+    from ai_stats_generated.models.get_generation404_response import GetGeneration404Response
+    from ai_stats_generated.models.healthz200_response import Healthz200Response
+    from ai_stats_generated.models.image import Image
+    from ai_stats_generated.models.image_content_part import ImageContentPart
+    from ai_stats_generated.models.image_content_part_image_url import ImageContentPartImageUrl
+    from ai_stats_generated.models.image_moderation_input import ImageModerationInput
+    from ai_stats_generated.models.images_edit_response import ImagesEditResponse
+    from ai_stats_generated.models.images_generation_request import ImagesGenerationRequest
+    from ai_stats_generated.models.images_generation_response import ImagesGenerationResponse
+    from ai_stats_generated.models.list_files_response import ListFilesResponse
+    from ai_stats_generated.models.list_models200_response import ListModels200Response
+    from ai_stats_generated.models.list_models500_response import ListModels500Response
+    from ai_stats_generated.models.list_models_organisation_parameter import ListModelsOrganisationParameter
+    from ai_stats_generated.models.message_content_part import MessageContentPart
+    from ai_stats_generated.models.model import Model
+    from ai_stats_generated.models.model_id import ModelId
+    from ai_stats_generated.models.model_providers_inner import ModelProvidersInner
+    from ai_stats_generated.models.moderation_categories import ModerationCategories
+    from ai_stats_generated.models.moderation_category_scores import ModerationCategoryScores
+    from ai_stats_generated.models.moderation_result import ModerationResult
+    from ai_stats_generated.models.moderations_request import ModerationsRequest
+    from ai_stats_generated.models.moderations_request_input import ModerationsRequestInput
+    from ai_stats_generated.models.moderations_request_input_one_of_inner import ModerationsRequestInputOneOfInner
+    from ai_stats_generated.models.moderations_response import ModerationsResponse
+    from ai_stats_generated.models.organisation_id import OrganisationId
+    from ai_stats_generated.models.reasoning_config import ReasoningConfig
+    from ai_stats_generated.models.responses_request import ResponsesRequest
+    from ai_stats_generated.models.responses_request_prompt import ResponsesRequestPrompt
+    from ai_stats_generated.models.responses_request_reasoning import ResponsesRequestReasoning
+    from ai_stats_generated.models.responses_response import ResponsesResponse
+    from ai_stats_generated.models.root200_response import Root200Response
+    from ai_stats_generated.models.text_content_part import TextContentPart
+    from ai_stats_generated.models.text_moderation_input import TextModerationInput
+    from ai_stats_generated.models.tool_call import ToolCall
+    from ai_stats_generated.models.tool_call_content_part import ToolCallContentPart
+    from ai_stats_generated.models.tool_call_content_part_function import ToolCallContentPartFunction
+    from ai_stats_generated.models.tool_call_function import ToolCallFunction
+    from ai_stats_generated.models.usage import Usage
+    from ai_stats_generated.models.video_content_part import VideoContentPart
+    from ai_stats_generated.models.video_generation_request import VideoGenerationRequest
+    from ai_stats_generated.models.video_generation_response import VideoGenerationResponse
+    from ai_stats_generated.models.video_generation_response_output_inner import VideoGenerationResponseOutputInner
+
+# Re-exports are imported on first attribute access (PEP 562), not when the package is imported.
+_LAZY_IMPORTS = {
+    "AudioContentPart": ("ai_stats_generated.models.audio_content_part", "AudioContentPart"),
+    "AudioContentPartInputAudio": ("ai_stats_generated.models.audio_content_part_input_audio", "AudioContentPartInputAudio"),
+    "AudioSpeechRequest": ("ai_stats_generated.models.audio_speech_request", "AudioSpeechRequest"),
+    "AudioTranscriptionResponse": ("ai_stats_generated.models.audio_transcription_response", "AudioTranscriptionResponse"),
+    "AudioTranslationResponse": ("ai_stats_generated.models.audio_translation_response", "AudioTranslationResponse"),
+    "BatchRequest": ("ai_stats_generated.models.batch_request", "BatchRequest"),
+    "BatchRequestCounts": ("ai_stats_generated.models.batch_request_counts", "BatchRequestCounts"),
+    "BatchResponse": ("ai_stats_generated.models.batch_response", "BatchResponse"),
+    "BenchmarkId": ("ai_stats_generated.models.benchmark_id", "BenchmarkId"),
+    "ChatChoice": ("ai_stats_generated.models.chat_choice", "ChatChoice"),
+    "ChatCompletionsRequest": ("ai_stats_generated.models.chat_completions_request", "ChatCompletionsRequest"),
+    "ChatCompletionsRequestResponseFormat": ("ai_stats_generated.models.chat_completions_request_response_format", "ChatCompletionsRequestResponseFormat"),
+    "ChatCompletionsRequestResponseFormatOneOf": ("ai_stats_generated.models.chat_completions_request_response_format_one_of", "ChatCompletionsRequestResponseFormatOneOf"),
+    "ChatCompletionsRequestToolChoice": ("ai_stats_generated.models.chat_completions_request_tool_choice", "ChatCompletionsRequestToolChoice"),
+    "ChatCompletionsRequestToolsInner": ("ai_stats_generated.models.chat_completions_request_tools_inner", "ChatCompletionsRequestToolsInner"),
+    "ChatCompletionsResponse": ("ai_stats_generated.models.chat_completions_response", "ChatCompletionsResponse"),
+    "ChatMessage": ("ai_stats_generated.models.chat_message", "ChatMessage"),
+    "ChatMessageContent": ("ai_stats_generated.models.chat_message_content", "ChatMessageContent"),
+    "Embedding": ("ai_stats_generated.models.embedding", "Embedding"),
+    "EmbeddingsRequest": ("ai_stats_generated.models.embeddings_request", "EmbeddingsRequest"),
+    "EmbeddingsRequestInput": ("ai_stats_generated.models.embeddings_request_input", "EmbeddingsRequestInput"),
+    "EmbeddingsResponse": ("ai_stats_generated.models.embeddings_response", "EmbeddingsResponse"),
+    "FileResponse": ("ai_stats_generated.models.file_response", "FileResponse"),
+    "GenerationResponse": ("ai_stats_generated.models.generation_response", "GenerationResponse"),
+    "GenerationResponseUsage": ("ai_stats_generated.models.generation_response_usage", "GenerationResponseUsage"),
+    "GetAnalytics200Response": ("ai_stats_generated.models.get_analytics200_response", "GetAnalytics200Response"),
+    "GetAnalyticsRequest": ("ai_stats_generated.models.get_analytics_request", "GetAnalyticsRequest"),
+    "GetGeneration401Response": ("ai_stats_generated.models.get_generation401_response", "GetGeneration401Response"),
+    "GetGeneration404Response": ("ai_stats_generated.models.get_generation404_response", "GetGeneration404Response"),
+    "Healthz200Response": ("ai_stats_generated.models.healthz200_response", "Healthz200Response"),
+    "Image": ("ai_stats_generated.models.image", "Image"),
+    "ImageContentPart": ("ai_stats_generated.models.image_content_part", "ImageContentPart"),
+    "ImageContentPartImageUrl": ("ai_stats_generated.models.image_content_part_image_url", "ImageContentPartImageUrl"),
+    "ImageModerationInput": ("ai_stats_generated.models.image_moderation_input", "ImageModerationInput"),
+    "ImagesEditResponse": ("ai_stats_generated.models.images_edit_response", "ImagesEditResponse"),
+    "ImagesGenerationRequest": ("ai_stats_generated.models.images_generation_request", "ImagesGenerationRequest"),
+    "ImagesGenerationResponse": ("ai_stats_generated.models.images_generation_response", "ImagesGenerationResponse"),
+    "ListFilesResponse": ("ai_stats_generated.models.list_files_response", "ListFilesResponse"),
+    "ListModels200Response": ("ai_stats_generated.models.list_models200_response", "ListModels200Response"),
+    "ListModels500Response": ("ai_stats_generated.models.list_models500_response", "ListModels500Response"),
+    "ListModelsOrganisationParameter": ("ai_stats_generated.models.list_models_organisation_parameter", "ListModelsOrganisationParameter"),
+    "MessageContentPart": ("ai_stats_generated.models.message_content_part", "MessageContentPart"),
+    "Model": ("ai_stats_generated.models.model", "Model"),
+    "ModelId": ("ai_stats_generated.models.model_id", "ModelId"),
+    "ModelProvidersInner": ("ai_stats_generated.models.model_providers_inner", "ModelProvidersInner"),
+    "ModerationCategories": ("ai_stats_generated.models.moderation_categories", "ModerationCategories"),
+    "ModerationCategoryScores": ("ai_stats_generated.models.moderation_category_scores", "ModerationCategoryScores"),
+    "ModerationResult": ("ai_stats_generated.models.moderation_result", "ModerationResult"),
+    "ModerationsRequest": ("ai_stats_generated.models.moderations_request", "ModerationsRequest"),
+    "ModerationsRequestInput": ("ai_stats_generated.models.moderations_request_input", "ModerationsRequestInput"),
+    "ModerationsRequestInputOneOfInner": ("ai_stats_generated.models.moderations_request_input_one_of_inner", "ModerationsRequestInputOneOfInner"),
+    "ModerationsResponse": ("ai_stats_generated.models.moderations_response", "ModerationsResponse"),
+    "OrganisationId": ("ai_stats_generated.models.organisation_id", "OrganisationId"),
+    "ReasoningConfig": ("ai_stats_generated.models.reasoning_config", "ReasoningConfig"),
+    "ResponsesRequest": ("ai_stats_generated.models.responses_request", "ResponsesRequest"),
+    "ResponsesRequestPrompt": ("ai_stats_generated.models.responses_request_prompt", "ResponsesRequestPrompt"),
+    "ResponsesRequestReasoning": ("ai_stats_generated.models.responses_request_reasoning", "ResponsesRequestReasoning"),
+    "ResponsesResponse": ("ai_stats_generated.models.responses_response", "ResponsesResponse"),
+    "Root200Response": ("ai_stats_generated.models.root200_response", "Root200Response"),
+    "TextContentPart": ("ai_stats_generated.models.text_content_part", "TextContentPart"),
+    "TextModerationInput": ("ai_stats_generated.models.text_moderation_input", "TextModerationInput"),
+    "ToolCall": ("ai_stats_generated.models.tool_call", "ToolCall"),
+    "ToolCallContentPart": ("ai_stats_generated.models.tool_call_content_part", "ToolCallContentPart"),
+    "ToolCallContentPartFunction": ("ai_stats_generated.models.tool_call_content_part_function", "ToolCallContentPartFunction"),
+    "ToolCallFunction": ("ai_stats_generated.models.tool_call_function", "ToolCallFunction"),
+    "Usage": ("ai_stats_generated.models.usage", "Usage"),
+    "VideoContentPart": ("ai_stats_generated.models.video_content_part", "VideoContentPart"),
+    "VideoGenerationRequest": ("ai_stats_generated.models.video_generation_request", "VideoGenerationRequest"),
+    "VideoGenerationResponse": ("ai_stats_generated.models.video_generation_response", "VideoGenerationResponse"),
+    "VideoGenerationResponseOutputInner": ("ai_stats_generated.models.video_generation_response_output_inner", "VideoGenerationResponseOutputInner"),
+}
+
+
+def __getattr__(name):
+    try:
+        module, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,161 @@
+import asyncio
+import email.parser
+import itertools
+import json
+import threading
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, AsyncAIStats
+from ai_stats import _batch
+
+
+class _Gateway:
+    """Records uploaded batch files and answers ``/files`` and ``/batches``."""
+
+    def __init__(self, pulled=None):
+        self.files = []
+        self.batches = []
+        self.pulled = pulled
+        self.pulled_at_upload = []
+
+    def _file(self, request, body):
+        assert request.headers["Transfer-Encoding"] == "chunked" and "Content-Length" not in request.headers
+        message = email.parser.BytesParser().parsebytes(b"Content-Type: " + request.headers["Content-Type"].encode() + b"\r\n\r\n" + body)
+        parts = {part.get_param("name", header="content-disposition"): part for part in message.get_payload()}
+        assert parts["purpose"].get_payload() == "batch"
+        self.files.append([json.loads(line) for line in parts["file"].get_payload(decode=True).splitlines()])
+        return httpx.Response(200, json={"id": f"file_{len(self.files)}", "object": "file", "purpose": "batch"})
+
+    def _batch(self, request):
+        body = json.loads(request.content)
+        self.batches.append(body)
+        return httpx.Response(200, json={"id": f"batch_{len(self.batches)}", "object": "batch", "status": "validating", **body})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/files"):
+            if self.pulled is not None:
+                self.pulled_at_upload.append(len(self.pulled))
+            return self._file(request, request.read())
+        return self._batch(request)
+
+    async def ahandler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/files"):
+            return self._file(request, await request.aread())
+        return self._batch(request)
+
+
+def _requests(count, pulled=None):
+    for index in range(count):
+        if pulled is not None:
+            pulled.append(index)
+        yield {"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": f"q{index}"}]}
+
+
+def test_create_batches_streams_shards_and_submits_one_batch_each():
+    pulled = []
+    gateway = _Gateway(pulled)
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(gateway.handler)) as client:
+        shards = list(client.create_batches(_requests(7, pulled), max_lines=3, metadata={"job": "nightly"}))
+
+    assert [(shard.start, shard.count, shard.file.id, shard.batch.id) for shard in shards] == [
+        (0, 3, "file_1", "batch_1"),
+        (3, 3, "file_2", "batch_2"),
+        (6, 1, "file_3", "batch_3"),
+    ]
+    # Requests are read while each file uploads, one line ahead at most.
+    assert gateway.pulled_at_upload == [4, 7, 7]
+    lines = [line for file in gateway.files for line in file]
+    assert [line["custom_id"] for line in lines] == [f"request-{index}" for index in range(7)]
+    assert lines[0] == {
+        "custom_id": "request-0",
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": "q0"}]},
+    }
+    assert gateway.batches[0] == {"input_file_id": "file_1", "endpoint": "/v1/chat/completions", "completion_window": "24h", "metadata": {"job": "nightly"}}
+
+
+def test_shards_respect_the_byte_limit():
+    lines = [b"x" * 40 + b"\n"] * 5
+    shards = []
+    for shard in _batch.shard_lines(lines, max_bytes=100):
+        shards.append(b"".join(shard.lines()))
+    assert [len(shard) for shard in shards] == [82, 82, 41]
+    with pytest.raises(ValueError, match="exceeds"):
+        for shard in _batch.shard_lines([b"y" * 200], max_bytes=100):
+            list(shard.lines())
+
+
+def test_async_create_batches_with_custom_ids():
+    gateway = _Gateway()
+    requests = [(f"row-{index}", body) for index, body in enumerate(_requests(4))]
+
+    async def main():
+        transport = httpx.MockTransport(gateway.ahandler)
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport) as client:
+            return [shard async for shard in client.create_batches(requests, endpoint="/v1/embeddings", max_lines=2)]
+
+    shards = asyncio.run(main())
+    assert [shard.count for shard in shards] == [2, 2]
+    assert [line["custom_id"] for file in gateway.files for line in file] == ["row-0", "row-1", "row-2", "row-3"]
+    assert {line["url"] for file in gateway.files for line in file} == {"/v1/embeddings"}
+
+
+def test_shard_uploads_are_one_shot():
+    shard = next(_batch.shard_lines(_batch.batch_lines(_requests(2))))
+    upload = _batch.shard_upload(shard)
+    assert upload.total is None
+    body = b"".join(upload)
+    assert body.count(b'"custom_id"') == 2 and shard.count == 2
+    # The retry transport checks this flag before resending a body.
+    assert upload._is_stream_consumed
+    with pytest.raises(httpx.StreamConsumed):
+        list(upload)
+
+
+def test_a_failed_shard_is_restarted_from_the_last_yielded_shard():
+    gateway = _Gateway()
+    failures = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/files") and len(gateway.files) == 1 and not failures:
+            failures.append(request.read())
+            return httpx.Response(400, json={"error": "bad_request"})
+        return gateway.handler(request)
+
+    shards = []
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            for shard in client.create_batches(_requests(7), max_lines=3):
+                shards.append(shard)
+        resume_at = shards[-1].start + shards[-1].count
+        remaining = itertools.islice(_requests(7), resume_at, None)
+        shards.extend(client.create_batches(remaining, max_lines=3, start=resume_at))
+
+    # The failed upload took request-3..5 with it; the restart sends them again under the same ids.
+    assert [(shard.start, shard.count) for shard in shards] == [(0, 3), (3, 3), (6, 1)]
+    sent = [line["custom_id"] for file in gateway.files for line in file]
+    assert len(sent) == len(set(sent))
+    assert sent == [f"request-{index}" for index in range(7)]
+
+
+def test_async_create_batches_reads_requests_off_the_event_loop():
+    gateway = _Gateway()
+    threads = []
+
+    def requests():
+        for body in _requests(5):
+            threads.append(threading.current_thread())
+            yield body
+
+    async def main():
+        transport = httpx.MockTransport(gateway.ahandler)
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport) as client:
+            return [shard async for shard in client.create_batches(requests(), max_lines=2, start=10)]
+
+    shards = asyncio.run(main())
+    assert [(shard.start, shard.count) for shard in shards] == [(10, 2), (12, 2), (14, 1)]
+    assert [line["custom_id"] for file in gateway.files for line in file] == [f"request-{index}" for index in range(10, 15)]
+    assert len(threads) == 5 and threading.main_thread() not in threads
@@ -0,0 +1,82 @@
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, AIStatsError, AsyncAIStats
+
+SPEECH = {"model": "openai/tts-1", "input": "hello", "format": "mp3"}
+
+
+class _Synthesis(httpx.SyncByteStream):
+    """Audio body produced piece by piece; records how much was generated when each piece was read."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.produced = 0
+
+    def __iter__(self):
+        for piece in self.pieces:
+            self.produced += 1
+            yield piece
+
+
+def test_stream_speech_yields_audio_before_synthesis_finishes():
+    body = _Synthesis([b"ID3", b"frame1", b"frame2"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/audio/speech"
+        assert json.loads(request.content)["input"] == "hello"
+        return httpx.Response(200, headers={"Content-Type": "audio/mpeg"}, stream=body)
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        chunks = client.stream_speech(SPEECH)
+        assert next(chunks) == b"ID3"
+        assert body.produced == 1
+        assert b"".join(chunks) == b"frame1frame2"
+
+        assert list(client.stream_speech(SPEECH, chunk_size=4)) == [b"ID3f", b"rame", b"1fra", b"me2"]
+
+
+def test_save_speech_writes_to_file_objects_and_paths(tmp_path):
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "audio/mpeg"}, content=b"audio-bytes")
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        buffer = io.BytesIO()
+        assert client.save_speech(SPEECH, buffer) == 11
+        assert buffer.getvalue() == b"audio-bytes"
+
+        target = tmp_path / "speech.mp3"
+        assert client.save_speech(SPEECH, target) == 11
+        assert target.read_bytes() == b"audio-bytes"
+        assert list(tmp_path.iterdir()) == [target]
+
+
+def test_failed_download_leaves_no_file(tmp_path):
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, json={"error": {"message": "bad voice"}})
+
+    target = tmp_path / "speech.mp3"
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(AIStatsError):
+            client.save_speech(SPEECH, target)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_async_stream_and_save_speech(tmp_path):
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "audio/mpeg"}, content=b"audio-bytes")
+
+    async def main():
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+            chunks = [chunk async for chunk in client.stream_speech(SPEECH, chunk_size=5)]
+            written = await client.save_speech(SPEECH, tmp_path / "speech.mp3")
+        return chunks, written
+
+    chunks, written = asyncio.run(main())
+    assert chunks == [b"audio", b"-byte", b"s"]
+    assert written == 11
+    assert (tmp_path / "speech.mp3").read_bytes() == b"audio-bytes"
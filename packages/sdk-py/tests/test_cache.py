@@ -0,0 +1,158 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from ai_stats import AIStats, AsyncAIStats, MemoryCache, ResponseCache, SQLiteCache
+from ai_stats._cache import CACHE_HEADER
+
+
+def _request(**extra):
+    return {"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}], **extra}
+
+
+def _counting_handler(calls, delay=0.0):
+    def handler(request):
+        calls.append(json.loads(request.content))
+        time.sleep(delay)
+        if request.url.path.endswith("/embeddings"):
+            return httpx.Response(200, json={"object": "list", "data": [{"object": "embedding", "index": 0, "embedding": [0.5]}], "model": "m"})
+        return httpx.Response(200, json={"id": f"c{len(calls)}", "choices": []})
+
+    return handler
+
+
+def _client(handler, cache):
+    return AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), cache=cache)
+
+
+def test_memory_cache_lru_ttl_and_byte_bound():
+    cache = MemoryCache(max_entries=2, max_bytes=10)
+    cache.set("a", b"1234", None)
+    cache.set("b", b"5678", None)
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"9", None)
+    assert cache.get("b") is None
+    cache.set("d", b"xxxxxx", None)
+    assert cache.get("a") is None and cache.get("d") == b"xxxxxx"
+    assert cache.evictions == 2
+    cache.set("e", b"", 0.01)
+    time.sleep(0.02)
+    assert cache.get("e") is None
+
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path, max_entries=2)
+    cache.set("a", b"1", None)
+    cache.set("b", b"2", 60)
+    cache.set("c", b"3", None)
+    assert len(cache) == 2 and cache.evictions == 1
+    cache.close()
+    reopened = SQLiteCache(path)
+    assert reopened.get("a") is None
+    assert reopened.get("c") == b"3"
+    reopened.close()
+
+
+def test_deterministic_calls_are_cached_and_nondeterministic_ones_are_not():
+    calls = []
+    cache = ResponseCache()
+    with _client(_counting_handler(calls), cache) as client:
+        first = client.generate_text(_request(temperature=0))
+        again = client.generate_text({"temperature": 0, **_request()})
+        client.generate_text(_request(seed=7))
+        client.generate_text(_request())
+        client.generate_text(_request())
+        client.generate_embedding({"model": "openai/text-embedding-3-small", "input": "hi"})
+        client.generate_embedding({"model": "openai/text-embedding-3-small", "input": "hi"})
+    assert first.id == again.id == "c1"
+    assert len(calls) == 5
+    assert cache.stats()[:3] == (2, 3, 0)
+
+
+def test_hits_replay_the_gateway_headers():
+    def handler(request):
+        headers = {"x-request-id": "req_1", "x-ratelimit-remaining-requests": "99", "Connection": "keep-alive"}
+        return httpx.Response(200, headers=headers, json={"id": "c1", "choices": []})
+
+    cache = ResponseCache()
+    with _client(handler, cache) as client:
+        live = client._http.post("/chat/completions", json=_request(temperature=0))
+        cached = client._http.post("/chat/completions", json=_request(temperature=0))
+    assert live.headers[CACHE_HEADER] == "miss" and cached.headers[CACHE_HEADER] == "hit"
+    for response in (live, cached):
+        assert response.headers["x-request-id"] == "req_1"
+        assert response.headers["x-ratelimit-remaining-requests"] == "99"
+        assert response.headers["content-type"] == "application/json"
+        assert "connection" not in response.headers
+    assert cached.json() == live.json() == {"id": "c1", "choices": []}
+
+
+def test_concurrent_identical_requests_are_coalesced():
+    calls = []
+    cache = ResponseCache()
+    barrier = threading.Barrier(4)
+    with _client(_counting_handler(calls, delay=0.1), cache) as client:
+        def call(_):
+            barrier.wait()
+            return client.generate_text(_request(temperature=0)).id
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(call, range(4)))
+    assert results == ["c1"] * 4
+    assert len(calls) == 1
+    # Each request lands in one bucket: one miss sent the call, three shared it.
+    assert cache.stats()[:3] == (0, 1, 3)
+
+
+def test_async_client_coalesces_and_shares_sqlite_backend(tmp_path):
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"id": "c1", "choices": []})
+
+    cache = ResponseCache(SQLiteCache(str(tmp_path / "cache.db")))
+
+    async def run():
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), cache=cache) as client:
+            await asyncio.gather(*(client.generate_text(_request(temperature=0)) for _ in range(3)))
+            return await client.generate_text(_request(temperature=0))
+
+    assert asyncio.run(run()).id == "c1"
+    assert len(calls) == 1
+    assert cache.stats()[:3] == (1, 1, 2)
+
+
+def test_shared_cache_is_scoped_to_gateway_and_api_key():
+    calls = []
+    cache = ResponseCache()
+    transport = httpx.MockTransport(_counting_handler(calls))
+    clients = [
+        AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport, cache=cache),
+        AIStats(api_key="sk_test_456", base_url="https://example.test/v1", transport=transport, cache=cache),
+        AIStats(api_key="sk_test_123", base_url="https://other.test/v1", transport=transport, cache=cache),
+    ]
+    ids = [client.generate_text(_request(temperature=0)).id for client in clients]
+    assert clients[0].generate_text(_request(temperature=0)).id == "c1"
+    for client in clients:
+        client.close()
+    assert ids == ["c1", "c2", "c3"]
+    assert len(calls) == 3
+
+
+def test_async_coalescing_is_per_event_loop():
+    calls = []
+    cache = ResponseCache()
+
+    async def run(content):
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(_counting_handler(calls)), cache=cache) as client:
+            return (await client.generate_text(_request(temperature=0, seed=content))).id
+
+    assert [asyncio.run(run(seed)) for seed in (1, 2)] == ["c1", "c2"]
+    assert all(not table for table in cache._async_in_flight.values())
@@ -0,0 +1,36 @@
+import pytest
+
+from ai_stats import MODEL_CATALOG, ModelCatalog, ModelId
+
+
+def test_catalogue_matches_the_generated_enum():
+    # Regenerate with ``python scripts/sync_model_ids.py`` when this fails after an OpenAPI update.
+    assert list(MODEL_CATALOG) == sorted(member.value for member in ModelId)
+
+
+def test_membership_and_validation_accept_plain_ids_and_enum_members():
+    assert "anthropic/claude-3-5-haiku-2024-11-04" in MODEL_CATALOG
+    assert ModelId("openai/gpt-4o-mini-2024-07-18") in MODEL_CATALOG
+    assert "openai/not-a-model" not in MODEL_CATALOG
+    assert MODEL_CATALOG.validate(ModelId("openai/gpt-4o-mini-2024-07-18")) == "openai/gpt-4o-mini-2024-07-18"
+    with pytest.raises(ValueError, match="openai/not-a-model"):
+        MODEL_CATALOG.validate("openai/not-a-model")
+
+
+def test_prefix_and_organisation_lookup():
+    catalog = ModelCatalog(["b/x", "a/one", "ab/two", "a/two", "a/one"])
+    assert len(catalog) == 4
+    assert catalog.by_organisation("a") == ("a/one", "a/two")
+    assert catalog.with_prefix("a") == ("a/one", "a/two", "ab/two")
+    assert catalog.with_prefix("zz") == ()
+    assert catalog.organisations() == ("a", "ab", "b")
+
+    anthropic = MODEL_CATALOG.by_organisation("anthropic")
+    assert anthropic and all(model.startswith("anthropic/") for model in anthropic)
+    assert "anthropic" in MODEL_CATALOG.organisations()
+
+
+def test_load_reads_one_id_per_line(tmp_path):
+    path = tmp_path / "ids.txt"
+    path.write_text("b/y\n\na/x\n", encoding="utf-8")
+    assert list(ModelCatalog.load(path)) == ["a/x", "b/y"]
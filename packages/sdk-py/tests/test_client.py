@@ -1,8 +1,24 @@
+import ast
+import inspect
+import re
+import textwrap
+import typing
 import unittest
 
 import httpx
 
-from ai_stats import AIStats, AIStatsError
+from ai_stats import AIStats, AIStatsError, AsyncAIStats, ImageEditResponse
+from ai_stats import _async_client
+from ai_stats._async_client import RESPONSE_TYPES
+from ai_stats_generated.api.default_api import DefaultApi
+
+
+def generated_response_types(operation: str) -> dict:
+	tree = ast.parse(textwrap.dedent(inspect.getsource(getattr(DefaultApi, operation))))
+	for node in ast.walk(tree):
+		if isinstance(node, ast.AnnAssign) and getattr(node.target, "id", None) == "_response_types_map":
+			return ast.literal_eval(node.value)
+	raise LookupError(operation)
 
 
 class AIStatsClientTests(unittest.IsolatedAsyncioTestCase):
@@ -25,7 +41,7 @@ class AIStatsClientTests(unittest.IsolatedAsyncioTestCase):
 			self.assertEqual(request.url.path, "/v1/chat/completions")
 			return httpx.Response(200, json=payload)
 
-		client = AIStats(
+		client = AsyncAIStats(
 			base_url="https://example.test",
 			api_key="sk_test_123",
 			transport=httpx.MockTransport(handler),
@@ -48,7 +64,7 @@ class AIStatsClientTests(unittest.IsolatedAsyncioTestCase):
 				content=content,
 			)
 
-		client = AIStats(
+		client = AsyncAIStats(
 			base_url="https://example.test",
 			api_key="sk_test_123",
 			transport=httpx.MockTransport(handler),
@@ -73,7 +89,7 @@ class AIStatsClientTests(unittest.IsolatedAsyncioTestCase):
 				headers={"X-Gateway-Error-Attribution": "user", "X-Gateway-Request-Id": "req_123"},
 			)
 
-		client = AIStats(
+		client = AsyncAIStats(
 			base_url="https://example.test",
 			api_key="sk_test_123",
 			transport=httpx.MockTransport(handler),
@@ -90,5 +106,71 @@ class AIStatsClientTests(unittest.IsolatedAsyncioTestCase):
 		self.assertEqual(ctx.exception.request_id, "req_123")
 
 
+	async def test_generated_operations_use_async_transport(self) -> None:
+		seen = []
+
+		def handler(request: httpx.Request) -> httpx.Response:
+			seen.append((request.method, request.url.path, request.url.query.decode(), request.headers["Authorization"]))
+			if request.url.path == "/v1/healthz":
+				return httpx.Response(200, json={"status": "ok"})
+			if request.url.path == "/v1/generation":
+				return httpx.Response(200, json={"request_id": "req_1", "success": True})
+			self.assertIn(b'name="model"', request.read())
+			return httpx.Response(200, json={"text": "hello"})
+
+		client = AsyncAIStats(
+			base_url="https://example.test/v1",
+			api_key="sk_test_123",
+			transport=httpx.MockTransport(handler),
+		)
+
+		async with client:
+			health = await client.get_health()
+			generation = await client.get_generation("req_1")
+			transcription = await client.generate_transcription({"model": "openai/whisper-1", "audio_url": "https://x.test/a.mp3"})
+
+		self.assertEqual(health.status, "ok")
+		self.assertTrue(generation.success)
+		self.assertEqual(transcription.text, "hello")
+		self.assertEqual(
+			seen,
+			[
+				("GET", "/v1/healthz", "", "Bearer sk_test_123"),
+				("GET", "/v1/generation", "id=req_1", "Bearer sk_test_123"),
+				("POST", "/v1/audio/transcriptions", "", "Bearer sk_test_123"),
+			],
+		)
+
+	async def test_generated_operations_take_response_types_and_timeouts_from_the_spec(self) -> None:
+		timeouts = []
+
+		def handler(request: httpx.Request) -> httpx.Response:
+			timeouts.append(request.extensions["timeout"])
+			return httpx.Response(200, json={"object": "list", "data": []})
+
+		client = AsyncAIStats(
+			base_url="https://example.test/v1",
+			api_key="sk_test_123",
+			transport=httpx.MockTransport(handler),
+		)
+
+		async with client:
+			files = await client._call("list_files", _request_timeout=(1.5, 7.0))
+
+		self.assertEqual(type(files).__name__, "ListFilesResponse")
+		self.assertEqual(timeouts[0]["connect"], 1.5)
+		self.assertEqual(timeouts[0]["read"], 7.0)
+
+	def test_image_edits_are_annotated_with_the_edit_response(self) -> None:
+		for client in (AIStats, AsyncAIStats):
+			self.assertIs(typing.get_type_hints(client.generate_image_edit)["return"], ImageEditResponse)
+
+	def test_response_types_match_the_generated_operations(self) -> None:
+		called = set(re.findall(r'_call\(\s*"(\w+)"', inspect.getsource(_async_client)))
+		self.assertEqual(set(RESPONSE_TYPES), called)
+		for operation, response_types in RESPONSE_TYPES.items():
+			self.assertEqual(response_types, generated_response_types(operation), operation)
+
+
 if __name__ == "__main__":
 	unittest.main()
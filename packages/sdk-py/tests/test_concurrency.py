@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, AIStatsError, AsyncAIStats
+
+
+class _Gauge:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.current -= 1
+
+
+def _request(i):
+    return {"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": str(i)}]}
+
+
+def _reply(request: httpx.Request) -> httpx.Response:
+    prompt = json.loads(request.content)["messages"][0]["content"]
+    if prompt == "boom":
+        return httpx.Response(503, json={"error": "upstream_unavailable"})
+    return httpx.Response(200, json={"id": prompt, "choices": []})
+
+
+def test_map_chat_completions_bounds_in_flight_and_keeps_order():
+    gauge = _Gauge()
+    pulled = []
+
+    def handler(request):
+        with gauge:
+            time.sleep(0.01)
+            return _reply(request)
+
+    def requests():
+        for i in range(20):
+            pulled.append(i)
+            yield _request(i)
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        results = client.map_chat_completions(requests(), concurrency=4)
+        first = next(results)
+        assert len(pulled) <= 4
+        rest = list(results)
+
+    assert [index for index, _ in [first, *rest]] == list(range(20))
+    assert [response.id for _, response in [first, *rest]] == [str(i) for i in range(20)]
+    assert gauge.peak <= 4
+
+
+def test_map_chat_completions_unordered_returns_exceptions_in_place():
+    requests = [_request(0), _request("boom"), _request(2)]
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(_reply)) as client:
+        results = dict(client.map_chat_completions(requests, concurrency=2, ordered=False, return_exceptions=True))
+        assert sorted(results) == [0, 1, 2]
+        assert isinstance(results[1], AIStatsError)
+        with pytest.raises(AIStatsError):
+            list(client.map_chat_completions(requests, concurrency=2))
+
+
+def test_async_map_chat_completions_bounds_in_flight():
+    gauge = _Gauge()
+
+    async def handler(request):
+        with gauge:
+            await asyncio.sleep(0.01)
+            return _reply(request)
+
+    async def requests():
+        for i in range(30):
+            yield _request(i)
+
+    async def run():
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+            return [item async for item in client.map_chat_completions(requests(), concurrency=5, ordered=False)]
+
+    results = asyncio.run(run())
+    assert sorted(index for index, _ in results) == list(range(30))
+    assert gauge.peak <= 5
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from ai_stats_generated import ApiClient, rest
+from ai_stats_generated.models.reasoning_config import ReasoningConfig
+
+from ai_stats import ChatCompletionsRequest, ChatCompletionsResponse, EmbeddingsResponse, GenerationResponse, ModelId, ModelListResponse
+from ai_stats._deserialize import CompiledApiClient, compile_type, load_model, response_model, validates_in_one_pass
+
+MODELS = {"ok": True, "limit": 2, "offset": 0, "total": 2, "models": [{"model_id": "openai/gpt-4o-mini"}, {"model_id": "anthropic/claude"}]}
+
+
+def test_compiled_loader_is_cached_and_matches_generated_client():
+    assert compile_type("ListModels200Response") is compile_type("ListModels200Response")
+    text = json.dumps(MODELS)
+    compiled = CompiledApiClient().deserialize(text, "ListModels200Response", "application/json; charset=utf-8")
+    generated = ApiClient().deserialize(text, "ListModels200Response", "application/json; charset=utf-8")
+    assert compiled == generated
+    assert response_model("ListModels200Response") is type(compiled)
+    assert response_model("List[ModelId]") is None and response_model("ModelId") is None
+    hits = response_model.cache_info().hits
+    CompiledApiClient().deserialize(text, "ListModels200Response", "application/json")
+    assert response_model.cache_info().hits == hits + 1
+
+
+def test_compiled_client_skips_the_urllib3_rest_client():
+    compiled, generated = CompiledApiClient(), ApiClient()
+    assert compiled.rest_client is None
+    assert set(vars(compiled)) == set(vars(generated))
+    assert compiled.default_headers == generated.default_headers
+
+
+def test_container_native_and_enum_types():
+    assert compile_type("List[Dict[str, int]]")([{"a": "1"}, {"b": 2}]) == [{"a": 1}, {"b": 2}]
+    assert compile_type("List[str]")(None) is None
+    assert compile_type("object")({"x": [1]}) == {"x": [1]}
+    assert compile_type("datetime")("2025-01-02T03:04:05Z").year == 2025
+    assert compile_type("ModelId")("openai/gpt-4o-mini-2024-07-18") is ModelId("openai/gpt-4o-mini-2024-07-18")
+    with pytest.raises(rest.ApiException):
+        compile_type("ModelId")("not-a-model")
+    with pytest.raises(rest.ApiException):
+        CompiledApiClient().deserialize("<html/>", "object", "application/xml")
+
+
+def _assert_same_as_from_dict(klass, data):
+    loaded, generated = load_model(klass, json.dumps(data).encode()), klass.from_dict(data)
+    assert loaded == generated
+    assert loaded.to_dict() == generated.to_dict()
+    assert loaded.model_fields_set == generated.model_fields_set
+    return loaded
+
+
+def test_one_pass_keeps_nulls_defaults_and_fields_set_of_from_dict():
+    # Nullable fields: ``to_dict`` writes the explicit nulls back, and the absent ones, as ``from_dict`` does.
+    assert validates_in_one_pass(GenerationResponse)
+    generation = {"request_id": "r1", "app_id": None, "error_code": None, "usage": None, "throughput": None, "success": True}
+    assert _assert_same_as_from_dict(GenerationResponse, generation).to_dict()["app_id"] is None
+    nested = {"request_id": "r1", "usage": {}}
+    assert _assert_same_as_from_dict(GenerationResponse, nested).usage.model_fields_set == GenerationResponse.from_dict(nested).usage.model_fields_set
+
+    # ``from_dict`` swaps explicit nulls for field defaults, so these models skip the one-pass path.
+    assert not validates_in_one_pass(ReasoningConfig) and not validates_in_one_pass(ChatCompletionsRequest)
+    assert _assert_same_as_from_dict(ReasoningConfig, {"effort": None}).effort is not None
+    chat = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": None, "stream": None}
+    request = _assert_same_as_from_dict(ChatCompletionsRequest, chat)
+    assert request.temperature == 1 and request.stream is False
+
+
+def test_load_model_validates_in_one_pass_where_the_tree_allows():
+    assert validates_in_one_pass(ModelListResponse)
+    assert validates_in_one_pass(EmbeddingsResponse)
+    assert not validates_in_one_pass(ChatCompletionsResponse)
+
+    raw = json.dumps(MODELS).encode()
+    _assert_same_as_from_dict(ModelListResponse, MODELS)
+
+    chat = {"id": "c1", "object": "chat.completion", "created": 1, "model": "m", "choices": [{"index": 0, "message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}]}
+    loaded = load_model(ChatCompletionsResponse, json.dumps(chat).encode())
+    assert loaded == ChatCompletionsResponse.from_dict(chat)
+    assert loaded.choices[0].message.content.actual_instance == "hi"
+
+
+def test_trusted_load_constructs_the_same_tree_without_validating():
+    raw = json.dumps(MODELS).encode()
+    assert load_model(ModelListResponse, raw, trusted=True) == ModelListResponse.from_dict(MODELS)
+
+    chat = {"id": "c1", "object": "chat.completion", "created": 1, "model": "m", "choices": [{"index": 0, "message": {"role": "assistant", "content": "hi", "tool_calls": [{"id": "t", "type": "function", "function": {"name": "f", "arguments": "{}"}}]}, "finish_reason": "stop"}]}
+    trusted = load_model(ChatCompletionsResponse, json.dumps(chat), trusted=True)
+    assert trusted == ChatCompletionsResponse.from_dict(chat)
+    assert trusted.choices[0].message.tool_calls[0].function.name == "f"
+
+    # Nothing is checked: a malformed field comes through as sent.
+    assert load_model(EmbeddingsResponse, b'{"object": "list", "data": "oops"}', trusted=True).data == "oops"
+
+
+def test_client_builds_trusted_responses():
+    client = CompiledApiClient()
+    client.trusted_responses = True
+    text = json.dumps({**MODELS, "total": "two"})
+    assert client.deserialize(text, "ListModels200Response", "application/json").total == "two"
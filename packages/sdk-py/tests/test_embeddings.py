@@ -0,0 +1,159 @@
+import asyncio
+import base64
+import json
+import struct
+from array import array
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, AIStatsError, AsyncAIStats, EmbeddingMatrix, RetryPolicy
+from ai_stats import _embeddings
+
+ROWS = [[0.25, -1.5, 3.0], [1.0, 2.0, 0.5]]
+
+
+def _b64(row):
+    return base64.b64encode(struct.pack(f"<{len(row)}f", *row)).decode()
+
+
+def _handler(seen):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        # Rows may come back out of order; ``index`` says where each belongs.
+        data = [{"object": "embedding", "index": index, "embedding": _b64(row)} for index, row in reversed(list(enumerate(ROWS)))]
+        usage = {"prompt_tokens": 4, "total_tokens": 4}
+        return httpx.Response(200, json={"object": "list", "data": data, "model": "openai/text-embedding-3-small", "usage": usage})
+
+    return handler
+
+
+def test_embed_decodes_base64_into_one_float32_matrix():
+    np = pytest.importorskip("numpy")
+    seen = []
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(_handler(seen))) as client:
+        result = client.embed({"model": "openai/text-embedding-3-small", "input": ["a", "b"]})
+
+    assert seen[0]["encoding_format"] == "base64"
+    assert isinstance(result, EmbeddingMatrix)
+    assert result.vectors.dtype == np.float32 and result.vectors.shape == (2, 3)
+    assert result.vectors.flags.c_contiguous and result.vectors.flags.writeable
+    assert result.tolist() == ROWS
+    assert result.usage.total_tokens == 4
+    assert result.model == "openai/text-embedding-3-small"
+
+
+def test_pure_python_fallback_without_numpy(monkeypatch):
+    monkeypatch.setattr(_embeddings, "_numpy", lambda: None)
+    transport = httpx.MockTransport(_handler([]))
+
+    async def main():
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport) as client:
+            return await client.embed({"model": "openai/text-embedding-3-small", "input": ["a", "b"]})
+
+    result = asyncio.run(main())
+    assert isinstance(result.vectors, array) and result.vectors.typecode == "f"
+    assert len(result) == 2 and list(result[-1]) == ROWS[1]
+    assert result.tolist() == ROWS
+
+
+def test_float_lists_from_upstreams_that_ignore_the_encoding():
+    body = {"data": [{"index": 0, "embedding": [0.5, 1.0]}, {"index": 1, "embedding": _b64([2.0, 4.0])}]}
+    assert _embeddings.decode_embeddings(json.dumps(body)).tolist() == [[0.5, 1.0], [2.0, 4.0]]
+    with pytest.raises(ValueError, match="different dimensions"):
+        _embeddings.decode_embeddings(json.dumps({"data": [{"embedding": [0.5]}, {"embedding": [1.0, 2.0, 3.0]}]}))
+
+
+def _corpus_handler(calls, fail_once=()):
+    def handler(request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["input"]
+        calls.append(texts[0])
+        if texts[0] in fail_once and calls.count(texts[0]) == 1:
+            return httpx.Response(503, json={"error": "overloaded"})
+        # Each vector holds its text's corpus position, so blocks can be checked against their input.
+        data = [{"index": index, "embedding": _b64([float(text[1:])])} for index, text in enumerate(texts)]
+        return httpx.Response(200, json={"data": data, "model": "m"})
+
+    return handler
+
+
+def test_batch_texts_packs_by_count_and_budget():
+    assert list(_embeddings.batch_texts(["a", "b", "c", "d", "e"], batch_size=2)) == [(0, ["a", "b"]), (2, ["c", "d"]), (4, ["e"])]
+    texts = ["aaaa", "bb", "cc", "dddddddd", "e"]
+    assert list(_embeddings.batch_texts(texts, batch_size=None, token_budget=6, count_tokens=len)) == [
+        (0, ["aaaa", "bb"]),
+        (2, ["cc"]),
+        (3, ["dddddddd"]),
+        (4, ["e"]),
+    ]
+    with pytest.raises(ValueError):
+        list(_embeddings.batch_texts(texts, batch_size=None))
+
+
+def test_embed_corpus_yields_ordered_blocks_and_retries_only_failed_batches():
+    pytest.importorskip("numpy")
+    calls = []
+    pulled = []
+
+    def corpus():
+        for position in range(10):
+            pulled.append(position)
+            yield f"t{position}"
+
+    transport = httpx.MockTransport(_corpus_handler(calls, fail_once={"t3"}))
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport) as client:
+        # A 503 without Retry-After is only replayed on idempotent requests; embedding batches are.
+        blocks = client.embed_corpus(corpus(), "m", batch_size=3, concurrency=2, retry=RetryPolicy(backoff=0))
+        first = next(blocks)
+        # Only the in-flight window has been read from the corpus.
+        assert len(pulled) <= 6
+        blocks = [first, *blocks]
+
+    assert [block.start for block in blocks] == [0, 3, 6, 9]
+    assert [row[0] for block in blocks for row in block.embeddings.vectors] == list(range(10))
+    assert sorted(calls) == ["t0", "t3", "t3", "t6", "t9"]
+
+
+def test_embed_corpus_retries_each_batch_in_one_place():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(429, headers={"Retry-After": "0"}, json={"error": "slow down"})
+
+    transport = httpx.MockTransport(handler)
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport, retry=RetryPolicy(backoff=0)) as client:
+        with pytest.raises(AIStatsError):
+            list(client.embed_corpus(["a"], "m", retry=RetryPolicy(backoff=0, max_retries=2)))
+        # Transport and batch retries are not stacked: three attempts, not nine.
+        assert len(calls) == 3
+        calls.clear()
+        with pytest.raises(AIStatsError):
+            list(client.embed_corpus(["a"], "m", retry=None))
+        assert len(calls) == 1
+
+
+def test_embed_corpus_gives_up_on_non_retryable_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, json={"error": "bad input"})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(AIStatsError):
+            list(client.embed_corpus(["a", "b"], "m", batch_size=1))
+
+
+def test_async_embed_corpus_over_an_async_iterable():
+    calls = []
+
+    async def corpus():
+        for position in range(7):
+            yield f"t{position}"
+
+    async def main():
+        transport = httpx.MockTransport(_corpus_handler(calls))
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport) as client:
+            return [block async for block in client.embed_corpus(corpus(), "m", batch_size=None, token_budget=3, count_tokens=lambda text: 1)]
+
+    blocks = asyncio.run(main())
+    assert [(block.start, len(block.embeddings)) for block in blocks] == [(0, 3), (3, 3), (6, 1)]
+    assert [row[0] for block in blocks for row in block.embeddings] == list(range(7))
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, AsyncAIStats, HedgePolicy, LatencyHistogram
+
+PRIMARY = "openai/gpt-4o-mini-2024-07-18"
+ALTERNATE = "anthropic/claude-3-5-haiku-2024-11-04"
+
+
+def _request(model=PRIMARY):
+    return {"model": model, "messages": [{"role": "user", "content": "hi"}]}
+
+
+def test_histogram_percentiles_are_bucket_accurate():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record("m", ms / 1000)
+    assert histogram.count("m") == 100
+    assert 0.05 <= histogram.percentile("m", 0.5) <= 0.05 * 1.15
+    assert 0.095 <= histogram.percentile("m", 0.95) <= 0.095 * 1.15
+    assert histogram.percentile("other", 0.5) is None
+
+
+def test_policy_delay_and_alternate_validation():
+    histogram = LatencyHistogram()
+    policy = HedgePolicy(min_samples=3, initial_delay=1.0, min_delay=0.01)
+    assert policy.delay(histogram, "m") == 1.0
+    for seconds in (0.1, 0.1, 0.2):
+        histogram.record("m", seconds)
+    assert 0.2 <= policy.delay(histogram, "m") < 0.25
+    with pytest.raises(ValueError):
+        HedgePolicy(alternates={PRIMARY: "not-a-model"})
+
+
+def test_generate_text_hedges_slow_primary_to_alternate():
+    release = threading.Event()
+    models = []
+
+    def handler(request):
+        model = json.loads(request.content)["model"]
+        models.append(model)
+        if model == PRIMARY:
+            release.wait(2)
+        return httpx.Response(200, json={"id": model, "choices": []})
+
+    policy = HedgePolicy(initial_delay=0.05, alternates={PRIMARY: ALTERNATE})
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), hedge=policy) as client:
+        started = time.monotonic()
+        assert client.generate_text(_request()).id == ALTERNATE
+        assert time.monotonic() - started < 1
+        release.set()
+        assert client.latency.count((ALTERNATE, "response")) == 1
+    assert models == [PRIMARY, ALTERNATE]
+
+
+def test_fast_primary_is_not_hedged():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"id": "c1", "choices": []})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), hedge=HedgePolicy(initial_delay=1.0)) as client:
+        assert client.generate_text(_request()).id == "c1"
+    assert len(calls) == 1
+
+
+def test_async_stream_hedges_on_first_byte_and_cancels_loser():
+    cancelled = []
+
+    class Body(httpx.AsyncByteStream):
+        def __init__(self, model, delay):
+            self.model, self.delay = model, delay
+
+        async def __aiter__(self):
+            try:
+                await asyncio.sleep(self.delay)
+                yield f'data: {{"id":"{self.model}","choices":[]}}\n\ndata: [DONE]\n\n'.encode()
+            except asyncio.CancelledError:
+                cancelled.append(self.model)
+                raise
+
+        async def aclose(self):
+            if self.delay > 1:
+                cancelled.append(self.model)
+
+    async def handler(request):
+        model = json.loads(request.content)["model"]
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, stream=Body(model, 5 if model == PRIMARY else 0))
+
+    async def run():
+        policy = HedgePolicy(initial_delay=0.05, alternates={PRIMARY: ALTERNATE})
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), hedge=policy) as client:
+            started = time.monotonic()
+            chunks = [chunk async for chunk in client.stream_chat_completions(_request())]
+            return chunks, time.monotonic() - started
+
+    chunks, elapsed = asyncio.run(run())
+    assert [chunk["id"] for chunk in chunks] == [ALTERNATE]
+    assert elapsed < 1
+    assert PRIMARY in cancelled
+
+
+def test_async_hedge_records_the_cancelled_primary():
+    async def handler(request):
+        model = json.loads(request.content)["model"]
+        await asyncio.sleep(5 if model == PRIMARY else 0)
+        return httpx.Response(200, json={"id": model, "choices": []})
+
+    async def run():
+        policy = HedgePolicy(initial_delay=0.05, alternates={PRIMARY: ALTERNATE})
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), hedge=policy) as client:
+            assert (await client.generate_text(_request())).id == ALTERNATE
+            return client.latency
+
+    latency = asyncio.run(run())
+    assert latency.count((ALTERNATE, "response")) == 1
+    # The primary was cancelled after the 50ms hedge delay; that is its lower bound.
+    assert latency.count((PRIMARY, "response")) == 1
+    assert latency.percentile((PRIMARY, "response"), 0.5) >= 0.05
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ai_stats import AIStats, AsyncAIStats, PoolOptions
+
+BODY = json.dumps({"status": "ok"}).encode()
+
+
+class _H2Server:
+    """Cleartext (h2c) HTTP/2 server.
+
+    Requests are answered in batches: once ``hold`` streams are open, or once the connection has
+    been quiet for a moment. ``max_open`` records the most streams ever open on one connection.
+    """
+
+    def __init__(self, hold: int) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        self._h2 = h2
+        self.hold = hold
+        self.connections = 0
+        self.max_open = 0
+        self._socket = socket.create_server(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{self._socket.getsockname()[1]}/v1"
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        h2 = self._h2
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        sock.settimeout(0.1)
+        pending = []
+        with sock:
+            while True:
+                try:
+                    data = sock.recv(65535)
+                except socket.timeout:
+                    data = None
+                except OSError:
+                    return
+                if data == b"":
+                    return
+                for event in conn.receive_data(data) if data else ():
+                    if isinstance(event, h2.events.StreamEnded):
+                        pending.append(event.stream_id)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                self.max_open = max(self.max_open, len(pending))
+                if pending and (data is None or len(pending) >= self.hold):
+                    for stream_id in pending:
+                        headers = [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(BODY)))]
+                        conn.send_headers(stream_id, headers)
+                        conn.send_data(stream_id, BODY, end_stream=True)
+                    pending.clear()
+                sock.sendall(conn.data_to_send())
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+@pytest.fixture
+def h2_server():
+    pytest.importorskip("h2")
+    servers = []
+
+    def start(hold: int) -> _H2Server:
+        servers.append(_H2Server(hold))
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+def test_concurrent_requests_multiplex_over_one_connection(h2_server):
+    server = h2_server(hold=8)
+    with AIStats(api_key="sk_test_123", base_url=server.url, http2=True, pool=PoolOptions(http1=False), timeout=5) as client:
+        with ThreadPoolExecutor(8) as executor:
+            responses = list(executor.map(lambda _: client._http.get("/healthz"), range(8)))
+        stats = client.pool_stats()
+
+    assert {response.http_version for response in responses} == {"HTTP/2"}
+    assert [response.json() for response in responses] == [{"status": "ok"}] * 8
+    # All eight were open at once, as streams of a single connection.
+    assert server.max_open == 8
+    assert server.connections == stats.connections_opened == 1
+
+
+def test_max_streams_caps_streams_in_flight(h2_server):
+    server = h2_server(hold=8)
+    pool = PoolOptions(http1=False, max_streams=3)
+    with AIStats(api_key="sk_test_123", base_url=server.url, http2=True, pool=pool, timeout=5) as client:
+        with ThreadPoolExecutor(8) as executor:
+            responses = list(executor.map(lambda _: client._http.get("/healthz"), range(8)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert 1 < server.max_open <= 3
+    assert server.connections == 1
+
+
+def test_async_client_multiplexes_with_stream_limit(h2_server):
+    server = h2_server(hold=4)
+
+    async def main():
+        pool = PoolOptions(http1=False, max_streams=4)
+        async with AsyncAIStats(api_key="sk_test_123", base_url=server.url, http2=True, pool=pool, timeout=5) as client:
+            return await asyncio.gather(*(client._http.get("/healthz") for _ in range(12)))
+
+    responses = asyncio.run(main())
+    assert {response.http_version for response in responses} == {"HTTP/2"}
+    assert server.max_open == 4
+    assert server.connections == 1
+
+
+def test_http2_falls_back_to_http11_without_h2(monkeypatch):
+    monkeypatch.setitem(sys.modules, "h2", None)
+    with pytest.warns(RuntimeWarning, match="falling back to HTTP/1.1"):
+        options = PoolOptions(http1=False).transport_options(http2=True)
+    assert (options["http1"], options["http2"]) == (True, False)
+
+    with pytest.warns(RuntimeWarning):
+        AIStats(api_key="sk_test_123", http2=True).close()
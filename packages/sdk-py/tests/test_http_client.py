@@ -0,0 +1,83 @@
+import httpx
+import pytest
+
+from ai_stats import AIStats, AIStatsError
+
+
+def _chat_payload():
+    return {
+        "id": "chatcmpl_123",
+        "model": "openai/gpt-4o-mini",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}],
+    }
+
+
+def test_wrapper_calls_share_one_pooled_client():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers["Authorization"]))
+        return httpx.Response(200, json=_chat_payload())
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        pooled = client._http
+        for _ in range(3):
+            response = client.generate_text(
+                {"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]}
+            )
+            assert response.choices[0].message.content.actual_instance == "hi"
+        assert client._http is pooled
+
+    assert seen == [("/v1/chat/completions", "Bearer sk_test_123")] * 3
+    assert pooled.is_closed
+
+
+def test_stream_text_uses_pooled_client():
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b'data: {"a":1}\n\ndata: [DONE]\n\n')
+
+    client = AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler))
+    try:
+        lines = list(client.stream_text({"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]}))
+    finally:
+        client.close()
+
+    assert lines == ['data: {"a":1}', "data: [DONE]"]
+    with pytest.raises(RuntimeError):
+        client._http.get("/healthz")
+
+
+def test_generated_operations_share_the_wrapper_transport():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.headers["Authorization"]))
+        if request.url.path == "/v1/healthz":
+            return httpx.Response(200, json={"status": "ok"})
+        if request.url.path == "/v1/models":
+            return httpx.Response(200, json={"ok": True, "models": [{"model_id": "openai/gpt-4o-mini"}]})
+        return httpx.Response(200, json=_chat_payload())
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        assert client.get_health().status == "ok"
+        assert client.get_models({"limit": 1}).models[0].model_id == "openai/gpt-4o-mini"
+        client.generate_text({"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]})
+
+    assert seen == [
+        ("GET", "/v1/healthz", "Bearer sk_test_123"),
+        ("GET", "/v1/models", "Bearer sk_test_123"),
+        ("POST", "/v1/chat/completions", "Bearer sk_test_123"),
+    ]
+
+
+def test_generated_operation_errors_raise_aistats_error():
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"error": "unauthorised", "message": "bad key"}, headers={"X-Gateway-Request-Id": "req_9"})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(AIStatsError) as excinfo:
+            client.list_files()
+
+    assert excinfo.value.status == 401
+    assert excinfo.value.code == "unauthorised"
+    assert excinfo.value.request_id == "req_9"
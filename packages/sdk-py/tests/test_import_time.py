@@ -0,0 +1,94 @@
+import compileall
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# ``import ai_stats`` must stay cheap for CLI tools and serverless cold starts. Eagerly loading the
+# generated package took ~700ms; the lazy surface takes a few milliseconds.
+IMPORT_BUDGET_MS = 150
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import ai_stats
+elapsed = (time.perf_counter() - start) * 1000
+loaded = sorted(name for name in ("httpx", "pydantic", "ai_stats_generated.api.default_api") if name in sys.modules)
+ai_stats.ChatCompletionsRequest
+models = sum(name.startswith("ai_stats_generated.models.") for name in sys.modules)
+print(json.dumps({"ms": elapsed, "loaded": loaded, "models": models, "api": "ai_stats_generated.api.default_api" in sys.modules}))
+"""
+
+
+def _probe() -> dict:
+    result = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_import_stays_within_budget():
+    # Best of three, so a busy machine does not fail the build.
+    runs = [_probe() for _ in range(3)]
+    assert min(run["ms"] for run in runs) < IMPORT_BUDGET_MS
+    assert runs[0]["loaded"] == []
+
+
+def test_models_load_individually_without_the_api():
+    run = _probe()
+    assert 0 < run["models"] < 30
+    assert not run["api"]
+
+
+def test_lazy_exports_resolve():
+    import ai_stats
+    import ai_stats_generated.models
+
+    assert set(ai_stats.__all__) <= set(dir(ai_stats))
+    assert ai_stats.ModelListResponse is ai_stats_generated.models.ListModels200Response
+    assert ai_stats.MODEL_IDS[0] is next(iter(ai_stats.ModelId))
+    with pytest.raises(AttributeError):
+        ai_stats.NotAnExport
+
+
+SOURCELESS_PROBE = """
+import ai_stats, ai_stats_generated.models
+assert ai_stats.__file__.endswith(".pyc") and ai_stats_generated.models.__file__.endswith(".pyc")
+request = ai_stats.ChatCompletionsRequest.from_dict({"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]})
+assert ai_stats_generated.models.ChatCompletionsRequest is type(request)
+from ai_stats._serialize import dumps_in_one_pass
+assert dumps_in_one_pass(ai_stats.BatchRequest) and not dumps_in_one_pass(ai_stats.GenerationResponse)
+ai_stats.AIStats(api_key="test").close()
+
+import asyncio, httpx
+
+async def call():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"object": "list", "data": []}))
+    async with ai_stats.AsyncAIStats(api_key="test", transport=transport) as client:
+        return await client.list_files()
+
+assert type(asyncio.run(call())).__name__ == "ListFilesResponse"
+print("ok")
+"""
+
+
+def _sourceless_install(target: Path) -> Path:
+    """Copy the packages to ``target`` as a bytecode-only install (``compileall -b``, sources removed)."""
+    for package in (SRC / "ai_stats", SRC / "gen" / "ai_stats_generated"):
+        shutil.copytree(package, target / package.name, ignore=shutil.ignore_patterns("__pycache__"))
+    assert compileall.compile_dir(target, legacy=True, quiet=1)
+    for source in target.rglob("*.py"):
+        source.unlink()
+    return target
+
+
+def test_imports_from_a_sourceless_install(tmp_path):
+    root = _sourceless_install(tmp_path)
+    env = {**os.environ, "PYTHONPATH": str(root)}
+    result = subprocess.run([sys.executable, "-c", SOURCELESS_PROBE], capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
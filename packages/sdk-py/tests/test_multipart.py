@@ -0,0 +1,161 @@
+import asyncio
+import base64
+import email.parser
+import io
+import os
+import threading
+import time
+
+import httpx
+
+from ai_stats import AIStats, AsyncAIStats, FilePart, RetryPolicy
+
+FILE = {"id": "file_1", "object": "file", "bytes": 10, "purpose": "batch"}
+
+
+def _parts(request: httpx.Request, chunked: bool = False) -> dict:
+    body = request.read()
+    if chunked:
+        assert request.headers["Transfer-Encoding"] == "chunked" and "Content-Length" not in request.headers
+    else:
+        assert int(request.headers["Content-Length"]) == len(body)
+    message = email.parser.BytesParser().parsebytes(b"Content-Type: " + request.headers["Content-Type"].encode() + b"\r\n\r\n" + body)
+    return {part.get_param("name", header="content-disposition"): part for part in message.get_payload()}
+
+
+class _Recording(io.BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return super().read(size)
+
+
+def test_upload_file_streams_from_disk_in_bounded_chunks(tmp_path):
+    path = tmp_path / "batch.jsonl"
+    path.write_bytes(b'{"a": 1}\n' * 100)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        parts = _parts(request)
+        seen.append((parts["purpose"].get_payload(), parts["file"].get_filename(), parts["file"].get_payload(decode=True)))
+        return httpx.Response(200, json=FILE)
+
+    progress = []
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        result = client.upload_file(purpose="batch", file=path, chunk_size=128, progress=lambda sent, total: progress.append((sent, total)))
+
+    assert result.id == "file_1"
+    assert seen == [("batch", "batch.jsonl", path.read_bytes())]
+    sent = [sent for sent, _ in progress]
+    assert sent == sorted(sent) and sent[-1] == progress[-1][1]
+    assert max(b - a for a, b in zip([0, *sent], sent) if b - a != 0) <= 256
+
+
+def test_file_objects_are_rewound_for_retries():
+    data = _Recording(b"x" * 1000)
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(_parts(request)["file"].get_payload(decode=True))
+        if len(bodies) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={"error": {"message": "slow down"}})
+        return httpx.Response(200, json=FILE)
+
+    transport = httpx.MockTransport(handler)
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport, retry=RetryPolicy(backoff=0)) as client:
+        client.upload_file(file=("data.bin", data), chunk_size=100)
+
+    assert bodies == [b"x" * 1000, b"x" * 1000]
+    assert max(size for size in data.reads if size is not None) <= 100
+
+
+def test_transcription_streams_audio_as_base64(tmp_path):
+    audio = bytes(range(256)) * 5
+    path = tmp_path / "call.wav"
+    path.write_bytes(audio)
+    forms = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/audio/transcriptions"
+        forms.append({name: part.get_payload() for name, part in _parts(request).items()})
+        return httpx.Response(200, json={"text": "hello"})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        # A chunk size that is not a multiple of 4 still yields one valid base64 string.
+        result = client.generate_transcription({"model": "openai/whisper-1", "language": "en"}, file=FilePart(path), chunk_size=70)
+
+    assert result.text == "hello"
+    assert forms[0]["model"] == "openai/whisper-1"
+    assert base64.b64decode(forms[0]["audio_b64"]) == audio
+
+
+def test_base64_parts_survive_short_reads():
+    class Trickle(io.BytesIO):
+        def read(self, size=-1):
+            return super().read(min(size, 5) if size is not None and size >= 0 else 5)
+
+    audio = bytes(range(256)) * 3
+    forms = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        forms.append(_parts(request)["audio_b64"].get_payload())
+        return httpx.Response(200, json={"text": "hello"})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        client.generate_transcription({"model": "openai/whisper-1"}, file=("call.wav", Trickle(audio)), chunk_size=64)
+
+    assert "=" not in forms[0].rstrip("=")
+    assert base64.b64decode(forms[0]) == audio
+
+
+def _pipe(data: bytes, piece: int = 7) -> io.BufferedReader:
+    """Read end of an OS pipe fed ``data`` a few bytes at a time, so reads come back short."""
+    read_fd, write_fd = os.pipe()
+
+    def feed():
+        with os.fdopen(write_fd, "wb", buffering=0) as writer:
+            for offset in range(0, len(data), piece):
+                writer.write(data[offset : offset + piece])
+                time.sleep(0.0005)
+
+    threading.Thread(target=feed, daemon=True).start()
+    return os.fdopen(read_fd, "rb")
+
+
+def test_pipes_are_sent_chunked_from_their_current_position():
+    data = b"header\n" + bytes(range(256)) * 4
+    files, forms = [], []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/files"):
+            files.append(_parts(request, chunked=True)["file"].get_payload(decode=True))
+            return httpx.Response(200, json=FILE)
+        forms.append(_parts(request, chunked=True)["audio_b64"].get_payload())
+        return httpx.Response(200, json={"text": "hello"})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        pipe = _pipe(data)
+        assert not pipe.seekable()
+        pipe.readline()
+        client.upload_file(purpose="batch", file=pipe, chunk_size=64)
+        with _pipe(data) as audio:
+            client.generate_transcription({"model": "openai/whisper-1"}, file=("call.wav", audio), chunk_size=64)
+
+    assert files == [data[len(b"header\n") :]]
+    assert "=" not in forms[0].rstrip("=")
+    assert base64.b64decode(forms[0]) == data
+
+
+def test_async_upload_file():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert _parts(request)["file"].get_payload(decode=True) == b"hello"
+        return httpx.Response(200, json=FILE)
+
+    async def main():
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+            return await client.upload_file(purpose="batch", file=b"hello")
+
+    assert asyncio.run(main()).id == "file_1"
@@ -0,0 +1,77 @@
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, PoolOptions
+
+
+class _SlowHealth(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(0.05)
+        body = json.dumps({"status": "ok"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHealth)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/v1"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_pool_options_build_limits_and_merge_timeouts():
+    pool = PoolOptions(max_connections=8, max_keepalive_connections=4, keepalive_expiry=5, connect_timeout=2, pool_timeout=1)
+    assert pool.limits() == httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=5)
+    assert pool.timeout(30) == httpx.Timeout(30, connect=2, pool=1)
+    assert pool.timeout(httpx.Timeout(10, read=60)) == httpx.Timeout(10, connect=2, read=60, pool=1)
+
+    client = AIStats(api_key="sk_test_123", timeout=30, pool=pool)
+    assert client._http.timeout == httpx.Timeout(30, connect=2, pool=1)
+    client.close()
+
+
+def test_pool_wait_metrics_from_a_real_pool(server):
+    pool = PoolOptions(max_connections=1, socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)])
+    with AIStats(api_key="sk_test_123", base_url=server, pool=pool, timeout=5) as client:
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: client._http.get("/healthz").raise_for_status(), range(4)))
+        stats = client.pool_stats()
+
+    assert stats.requests == 4
+    # One socket serves everything; the queued requests waited for it.
+    assert stats.connections_opened == 1
+    assert stats.waiting == 0
+    assert stats.max_wait >= 0.04
+    assert stats.wait_p99 >= stats.wait_p50 > 0
+
+
+def test_metrics_count_requests_on_custom_transports_and_keep_caller_traces():
+    events = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.extensions["trace"]("http11.send_request_headers.started", {})
+        return httpx.Response(200, json={"status": "ok"})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        client._http.get("/healthz", extensions={"trace": lambda name, info: events.append(name)})
+        client._http.get("/healthz")
+        assert client.pool_stats().requests == 2
+    assert events == ["http11.send_request_headers.started"]
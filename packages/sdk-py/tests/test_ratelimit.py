@@ -0,0 +1,88 @@
+import asyncio
+import time
+
+import httpx
+
+from ai_stats import AIStats, AsyncAIStats, RateLimit, RateLimiter
+from ai_stats._ratelimit import _parse_seconds
+
+
+def _request(model):
+    return {"model": model, "messages": [{"role": "user", "content": "hi"}]}
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"id": "c1", "choices": []})
+
+
+def test_parse_seconds_accepts_numbers_durations_and_dates():
+    assert _parse_seconds("2") == 2.0
+    assert _parse_seconds("1m30s") == 90.0
+    assert _parse_seconds("250ms") == 0.25
+    assert _parse_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _parse_seconds("soon") is None
+
+
+def test_reserve_paces_per_model_and_provider():
+    limiter = RateLimiter(per_model={"openai/gpt-4o-mini": RateLimit(10, burst=2)}, per_provider={"anthropic": 1})
+    assert limiter.reserve("openai/gpt-4o-mini") == 0.0
+    assert limiter.reserve("openai/gpt-4o-mini") == 0.0
+    assert 0.05 < limiter.reserve("openai/gpt-4o-mini") <= 0.1
+    assert limiter.reserve("anthropic/claude-3-haiku") == 0.0
+    assert limiter.reserve("anthropic/claude-3-5-sonnet") > 0.9
+    assert limiter.reserve("google/gemini-2.0-flash") == 0.0
+
+
+def test_429_blocks_until_retry_after_and_halves_rate():
+    limiter = RateLimiter(per_model={"openai/gpt-4o-mini": 100})
+    request = httpx.Request("POST", "https://example.test/v1/chat/completions")
+    limiter.observe("openai/gpt-4o-mini", httpx.Response(429, headers={"Retry-After": "2"}, request=request))
+    assert 1.9 < limiter.reserve("openai/gpt-4o-mini") <= 2.0
+    assert limiter.reserve("openai/gpt-4o") == 0.0
+    assert limiter._models["openai/gpt-4o-mini"].rate == 50
+
+
+def test_remaining_headers_cap_rate():
+    limiter = RateLimiter(per_model={"m": 100})
+    request = httpx.Request("POST", "https://example.test/v1/chat/completions")
+    limiter.observe("m", httpx.Response(200, headers={"x-ratelimit-remaining-requests": "10", "x-ratelimit-reset-requests": "2s"}, request=request))
+    assert limiter._models["m"].rate == 5
+    limiter.observe("m", httpx.Response(200, headers={"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "500ms"}, request=request))
+    assert 0.4 < limiter.reserve("m") <= 0.5
+
+
+def test_client_hooks_feed_model_into_limiter():
+    seen = []
+
+    def handler(request):
+        seen.append(time.monotonic())
+        if len(seen) == 1:
+            return httpx.Response(429, headers={"retry-after-ms": "150"}, json={"error": "rate_limited"})
+        return _ok(request)
+
+    limiter = RateLimiter()
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), rate_limiter=limiter) as client:
+        try:
+            client.generate_text(_request("openai/gpt-4o-mini"))
+        except httpx.HTTPStatusError:
+            pass
+        client.generate_text(_request("openai/gpt-4o-mini"))
+
+    assert seen[1] - seen[0] >= 0.14
+    assert list(limiter._models) == ["openai/gpt-4o-mini"]
+
+
+def test_async_client_paces_generated_operations():
+    seen = []
+
+    async def handler(request):
+        seen.append(time.monotonic())
+        return _ok(request)
+
+    async def run():
+        limiter = RateLimiter(per_provider={"openai": RateLimit(20, burst=1)})
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), rate_limiter=limiter) as client:
+            await asyncio.gather(*(client.generate_text(_request("openai/gpt-4o-mini")) for _ in range(3)))
+
+    asyncio.run(run())
+    assert seen[-1] - seen[0] >= 0.09
@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, AIStatsError, AsyncAIStats, RetryPolicy
+
+FAST = RetryPolicy(max_retries=3, backoff=0.001, max_backoff=0.002, replay_generations=True)
+
+
+def _request():
+    return {"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]}
+
+
+def _flaky(*failures):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if len(calls) <= len(failures):
+            failure = failures[len(calls) - 1]
+            if isinstance(failure, Exception):
+                raise failure
+            return httpx.Response(failure, json={"error": "upstream_unavailable"})
+        if request.url.path.endswith("/batches"):
+            return httpx.Response(200, json={"id": "batch_1"})
+        if json.loads(request.content).get("stream"):
+            return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=b'data: {"id":"c1","choices":[]}\n\ndata: [DONE]\n\n')
+        return httpx.Response(200, json={"id": "c1", "choices": []})
+
+    return handler, calls
+
+
+def _client(handler, retry=FAST):
+    return AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), retry=retry)
+
+
+def test_transient_statuses_and_resets_are_retried():
+    handler, calls = _flaky(503, httpx.ReadError("connection reset"), 502)
+    with _client(handler) as client:
+        assert client.generate_text(_request()).id == "c1"
+    assert len(calls) == 4
+
+
+def test_gives_up_after_max_retries_and_when_disabled():
+    handler, calls = _flaky(503, 503, 503, 503, 503)
+    with _client(handler) as client, pytest.raises(AIStatsError) as excinfo:
+        client.generate_text(_request())
+    assert excinfo.value.status == 503
+    assert len(calls) == 4
+
+    handler, calls = _flaky(503)
+    with _client(handler, retry=None) as client, pytest.raises(AIStatsError):
+        client.generate_text(_request())
+    assert len(calls) == 1
+
+
+def test_non_replayable_endpoints_only_retry_unsent_or_refused_requests():
+    handler, calls = _flaky(503)
+    with _client(handler) as client, pytest.raises(AIStatsError):
+        client.create_batch({"input_file_id": "file_1", "endpoint": "/v1/chat/completions"})
+    assert len(calls) == 1
+
+    handler, calls = _flaky(httpx.ConnectError("refused"), 429)
+    with _client(handler) as client:
+        assert client.create_batch({"input_file_id": "file_1", "endpoint": "/v1/chat/completions"}).id == "batch_1"
+    assert len(calls) == 3
+
+
+def test_billed_generations_only_retry_unprocessed_requests_by_default():
+    safe = RetryPolicy(max_retries=3, backoff=0.001, max_backoff=0.002)
+    for failure in (502, httpx.ReadError("connection reset")):
+        handler, calls = _flaky(failure)
+        with _client(handler, retry=safe) as client, pytest.raises((AIStatsError, httpx.ReadError)):
+            client.generate_text(_request())
+        assert len(calls) == 1
+
+    def refused(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"}, json={"error": "overloaded"})
+        return httpx.Response(200, json={"id": "c1", "choices": []})
+
+    calls = []
+    with _client(refused, retry=safe) as client:
+        assert client.generate_text(_request()).id == "c1"
+    assert len(calls) == 2
+
+
+def test_each_attempt_is_capped_at_the_remaining_deadline():
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"id": "c1", "choices": []})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), timeout=30.0, retry=RetryPolicy(deadline=5)) as client:
+        client.generate_text(_request())
+    assert 4 < timeouts[0]["read"] <= 5 and 4 < timeouts[0]["connect"] <= 5
+
+
+def test_deadline_budget_stops_retries():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "2"}, json={"error": "rate_limited"})
+
+    policy = RetryPolicy(max_retries=5, backoff=0.001, deadline=0.5)
+    with _client(handler, retry=policy) as client, pytest.raises(AIStatsError):
+        client.generate_text(_request())
+    assert len(calls) == 1
+
+
+def test_stream_failing_before_first_byte_is_replayed():
+    handler, calls = _flaky(httpx.RemoteProtocolError("server disconnected"), 503)
+    with _client(handler) as client:
+        chunks = list(client.stream_chat_completions(_request()))
+    assert [chunk["id"] for chunk in chunks] == ["c1"]
+    assert len(calls) == 3
+
+
+def test_async_client_retries():
+    handler, calls = _flaky(502, httpx.ConnectTimeout("slow"))
+
+    async def run():
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler), retry=FAST) as client:
+            return await client.generate_text(_request())
+
+    assert asyncio.run(run()).id == "c1"
+    assert len(calls) == 3
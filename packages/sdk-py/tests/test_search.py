@@ -0,0 +1,61 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ai_stats import BruteForceIndex, EmbeddingStore, IVFIndex
+from ai_stats import _search
+
+
+def _clustered(rows=2000, dimensions=16, clusters=20, seed=1):
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dimensions))
+    return (centres[rng.integers(clusters, size=rows)] + 0.1 * rng.normal(size=(rows, dimensions))).astype(np.float32)
+
+
+def _exact(vectors, queries, k, metric="cosine"):
+    if metric == "cosine":
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    return np.argsort(-(queries @ vectors.T), axis=1, kind="stable")[:, :k]
+
+
+@pytest.mark.parametrize("metric", ["cosine", "dot"])
+def test_brute_force_matches_exact_search_across_blocks(metric):
+    vectors = _clustered()
+    queries = vectors[:5] + 0.01
+    result = BruteForceIndex(vectors, metric=metric, block_rows=300).search(queries, k=7)
+
+    assert result.rows.shape == result.scores.shape == (5, 7)
+    assert (result.rows == _exact(vectors, queries, 7, metric)).all()
+    assert (np.diff(result.scores, axis=1) <= 0).all()
+
+
+def test_brute_force_over_a_memory_mapped_store(tmp_path):
+    vectors = _clustered(rows=500)
+    with EmbeddingStore(tmp_path / "vectors.npy") as store:
+        store.append(vectors, [str(row) for row in range(500)])
+        index = BruteForceIndex(store, block_rows=128)
+        assert isinstance(index.vectors, np.memmap)
+        assert index.search(vectors[42], k=1).rows[0, 0] == 42
+    # Fewer rows than k: the tail is padded.
+    padded = BruteForceIndex(vectors[:3]).search(vectors[0], k=5)
+    assert padded.rows[0, 3:].tolist() == [-1, -1] and np.isneginf(padded.scores[0, 3:]).all()
+
+
+def test_ivf_recall_and_exhaustive_probe():
+    vectors = _clustered(rows=4000)
+    queries = vectors[::200] + 0.01
+    index = IVFIndex(vectors, n_lists=32, n_probe=4, block_rows=1000)
+    assert index.list_sizes().sum() == 4000
+
+    exact = _exact(vectors, queries, 10)
+    approximate = index.search(queries, k=10).rows
+    recall = np.mean([len(set(found) & set(truth)) / 10 for found, truth in zip(approximate, exact)])
+    assert recall >= 0.9
+    assert (index.search(queries, k=10, n_probe=32).rows == exact).all()
+
+
+def test_search_needs_numpy(monkeypatch):
+    monkeypatch.setattr(_search, "_numpy", lambda: None)
+    with pytest.raises(ImportError, match="NumPy"):
+        BruteForceIndex([[1.0, 0.0]])
@@ -0,0 +1,74 @@
+import datetime
+import decimal
+import json
+from enum import Enum
+
+import httpx
+
+from ai_stats import AIStats, BatchRequest, ChatCompletionsRequest, GenerationResponse, ImageGenerationRequest
+from ai_stats import _serialize
+from ai_stats._ratelimit import MODEL_EXTENSION
+from ai_stats._serialize import JSONBody, encode_json
+
+CHAT = {"model": "openai/gpt-4o-mini", "messages": [{"role": "user", "content": "héllo"}], "temperature": 0}
+
+
+def test_encode_json_matches_to_dict_and_tags_model(monkeypatch):
+    chat = ChatCompletionsRequest.from_dict(CHAT)
+    body = encode_json(chat)
+    assert isinstance(body, JSONBody)
+    assert json.loads(body) == chat.to_dict()
+    assert body.model == "openai/gpt-4o-mini"
+
+    batch = BatchRequest.from_dict({"input_file_id": "file_1", "endpoint": "/v1/chat/completions"})
+    assert json.loads(encode_json(batch)) == batch.to_dict()
+    assert encode_json(batch).model is None
+
+    # Explicit nulls on nullable fields are kept, as ``to_dict`` keeps them.
+    generation = GenerationResponse.from_dict({"request_id": "r1", "app_id": None})
+    assert json.loads(encode_json(generation)) == generation.to_dict()
+    assert not _serialize.dumps_in_one_pass(GenerationResponse)
+    assert _serialize.dumps_in_one_pass(BatchRequest) and _serialize.dumps_in_one_pass(ImageGenerationRequest)
+
+    mixed = {"model": "m", "messages": [chat.messages[0]]}
+    fast = encode_json(mixed)
+    monkeypatch.setattr(_serialize, "orjson", None)
+    assert json.loads(encode_json(mixed)) == json.loads(fast) == {"model": "m", "messages": [chat.messages[0].to_dict()]}
+    assert json.loads(encode_json({"nested": chat})) == {"nested": chat.to_dict()}
+
+
+def test_wire_bodies_are_encoded_once_for_both_paths():
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        if request.url.path.endswith("/batches"):
+            return httpx.Response(200, json={"id": "batch_1"})
+        return httpx.Response(200, json={"id": "c1", "choices": []})
+
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        client.generate_text(CHAT)
+        client.create_batch({"input_file_id": "file_1", "endpoint": "/v1/chat/completions"})
+
+    chat, batch = sent
+    assert chat.content == bytes(encode_json(ChatCompletionsRequest.from_dict({**CHAT, "stream": False})))
+    assert chat.headers["Content-Type"] == "application/json"
+    assert chat.extensions[MODEL_EXTENSION] == "openai/gpt-4o-mini"
+    assert b" " not in batch.content
+    assert json.loads(batch.content) == {"input_file_id": "file_1", "endpoint": "/v1/chat/completions"}
+
+
+def test_fallback_encoder_handles_what_to_dict_leaves(monkeypatch):
+    class Tier(Enum):
+        FLEX = 1
+
+    body = {
+        "at": datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        "on": datetime.date(2025, 1, 2),
+        "tier": Tier.FLEX,
+        "raw": b"abc",
+        "price": decimal.Decimal("0.10"),
+    }
+    expected = {"at": "2025-01-02T03:04:05+00:00", "on": "2025-01-02", "tier": 1, "raw": "abc", "price": "0.10"}
+    monkeypatch.setattr(_serialize, "orjson", None)
+    assert json.loads(encode_json(body)) == expected
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, AIStatsError, AsyncAIStats
+
+HEALTH = {"status": "ok"}
+
+
+def _handler(calls, delay=0.05):
+    def handler(request):
+        calls.append(str(request.url))
+        time.sleep(delay)
+        if request.url.path.endswith("/generation"):
+            if request.url.params["id"] == "missing":
+                return httpx.Response(404, json={"error": "not_found"})
+            return httpx.Response(200, json={"request_id": request.url.params["id"]})
+        return httpx.Response(200, json=HEALTH)
+
+    return handler
+
+
+def test_concurrent_identical_calls_share_one_round_trip():
+    calls = []
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(_handler(calls))) as client:
+        barrier = threading.Barrier(8)
+
+        def health(_):
+            barrier.wait()
+            return client.get_health()
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(health, range(8)))
+        assert all(result is results[0] for result in results)
+        assert client.get_health() is results[0]
+
+        assert client.get_generation("gen_1").request_id == "gen_1"
+        assert client.get_generation("gen_2").request_id == "gen_2"
+    assert calls == [
+        "https://example.test/v1/healthz",
+        "https://example.test/v1/generation?id=gen_1",
+        "https://example.test/v1/generation?id=gen_2",
+    ]
+
+
+def test_ttl_expiry_and_errors_are_not_cached():
+    calls = []
+    with AIStats(
+        api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(_handler(calls, 0)), single_flight_ttl=0.05
+    ) as client:
+        client.get_health()
+        client.get_health()
+        time.sleep(0.06)
+        client.get_health()
+        for _ in range(2):
+            with pytest.raises(AIStatsError):
+                client.get_generation("missing")
+    assert len(calls) == 4
+
+
+def test_async_single_flight_survives_cancelled_caller():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=HEALTH)
+
+    async def run():
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+            first = asyncio.ensure_future(client.get_health())
+            await asyncio.sleep(0)
+            others = [asyncio.ensure_future(client.get_health()) for _ in range(5)]
+            first.cancel()
+            return await asyncio.gather(*others)
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_generation_lookups_are_coalesced_but_never_reused():
+    calls = []
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(_handler(calls))) as client:
+        barrier = threading.Barrier(4)
+
+        def generation(_):
+            barrier.wait()
+            return client.get_generation("gen_1")
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(generation, range(4)))
+        assert all(result.request_id == "gen_1" for result in results)
+        assert client.get_generation("gen_1") is not results[0]
+    assert len(calls) == 2
@@ -0,0 +1,102 @@
+import asyncio
+import base64
+import json
+import struct
+
+import httpx
+import pytest
+
+from ai_stats import AIStats, AsyncAIStats, EmbeddingStore
+from ai_stats import _store
+
+
+def _handler(calls, fail_at=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["input"]
+        calls.extend(texts)
+        if fail_at in texts:
+            return httpx.Response(400, json={"error": "boom"})
+        data = [{"index": index, "embedding": base64.b64encode(struct.pack("<2f", float(text), -float(text))).decode()} for index, text in enumerate(texts)]
+        return httpx.Response(200, json={"data": data, "model": "m"})
+
+    return handler
+
+
+def _records(count):
+    return ((f"doc-{position}", str(position)) for position in range(count))
+
+
+def test_npy_store_is_loadable_and_memory_mapped(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "vectors.npy"
+    with EmbeddingStore(path) as store:
+        store.append(np.arange(6, dtype=np.float32).reshape(2, 3), ["a", "b"])
+        store.append(np.ones((1, 3)), ["c"])
+        mapped = store.vectors()
+        assert isinstance(mapped, np.memmap) and mapped.shape == (3, 3)
+        assert store.index() == {"a": 0, "b": 1, "c": 2}
+
+    assert np.load(path, mmap_mode="r").tolist() == [[0, 1, 2], [3, 4, 5], [1, 1, 1]]
+    with pytest.raises(ValueError, match="3-dimensional"):
+        EmbeddingStore(path, dimensions=4)
+
+
+def test_reopening_after_a_crash_drops_half_written_rows(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "vectors.npy"
+    store = EmbeddingStore(path)
+    store.append(np.zeros((2, 4), dtype=np.float32), ["a", "b"])
+    # Crash: no header update, a torn row and an id whose row never landed.
+    store._data.write(b"\x00" * 7)
+    store._data.flush()
+    store._ids.write(b"c\nd")
+    store._ids.flush()
+
+    with EmbeddingStore(path) as reopened:
+        assert len(reopened) == 2
+        assert list(reopened.ids()) == ["a", "b"]
+    assert np.load(path).shape == (2, 4)
+    assert (tmp_path / "vectors.npy.ids").read_bytes() == b"a\nb\n"
+
+
+def test_write_corpus_resumes_where_a_failed_run_stopped(tmp_path):
+    calls = []
+    path = tmp_path / "vectors.f32"
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(_handler(calls, fail_at="5"))) as client:
+        with EmbeddingStore(path) as store, pytest.raises(httpx.HTTPStatusError):
+            store.write_corpus(lambda texts: client.embed_corpus(texts, "m", batch_size=2, concurrency=1), _records(8))
+
+    calls.clear()
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(_handler(calls))) as client:
+        with EmbeddingStore(path, dimensions=2) as store:
+            assert len(store) == 4
+            assert store.write_corpus(lambda texts: client.embed_corpus(texts, "m", batch_size=2, concurrency=1), _records(8)) == 4
+            assert calls == ["4", "5", "6", "7"]
+            assert list(store.ids()) == [f"doc-{position}" for position in range(8)]
+            with pytest.raises(ValueError, match="same corpus"):
+                list(store.resume([("other", "x")]))
+
+    raw = path.read_bytes()
+    assert struct.unpack("<16f", raw)[::2] == tuple(float(position) for position in range(8))
+
+
+def test_async_write_corpus_without_numpy(tmp_path, monkeypatch):
+    monkeypatch.setattr(_store, "_numpy", lambda: None)
+    from ai_stats import _embeddings
+
+    monkeypatch.setattr(_embeddings, "_numpy", lambda: None)
+
+    async def records():
+        for record in _records(5):
+            yield record
+
+    async def main():
+        transport = httpx.MockTransport(_handler([]))
+        async with AsyncAIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=transport) as client:
+            with EmbeddingStore(tmp_path / "vectors.f32") as store:
+                written = await store.awrite_corpus(lambda texts: client.embed_corpus(texts, "m", batch_size=2), records())
+                return written, list(store.vectors())
+
+    written, vectors = asyncio.run(main())
+    assert written == 5
+    assert vectors[::2] == [0.0, 1.0, 2.0, 3.0, 4.0]
@@ -0,0 +1,51 @@
+import httpx
+
+from ai_stats import AIStats, ChatCompletionAccumulator, SSEDecoder
+
+
+def test_decoder_handles_split_reads_comments_and_multiline_data():
+    decoder = SSEDecoder()
+    events = []
+    for piece in (b": keep-alive\r\n\r\nevent: delta\r\ndata: {\"a\":", b"\r\ndata: 1}\r", b"\n\r\nid: 7\ndata: x\n", b"\n"):
+        events.extend(decoder.feed(piece))
+    events.extend(decoder.flush())
+
+    assert [(e.event, e.data, e.id) for e in events] == [("delta", '{"a":\n1}', None), (None, "x", "7")]
+
+
+def test_decoder_flushes_unterminated_event():
+    decoder = SSEDecoder()
+    assert decoder.feed(b"data: [DONE]") == []
+    assert [e.data for e in decoder.flush()] == ["[DONE]"]
+
+
+def test_stream_chat_completions_accumulates_tool_calls_and_usage():
+    body = b"".join(
+        [
+            b'data: {"id":"c1","model":"openai/gpt-4o-mini","choices":[{"index":0,"delta":{"role":"assistant","content":"Hel"}}]}\n\n',
+            b": ping\n\n",
+            b'data: {"id":"c1","choices":[{"index":0,"delta":{"content":"lo","tool_calls":[{"index":0,"id":"call_1","type":"function","function":{"name":"lookup","arguments":"{\\"q\\":"}}]}}]}\n\n',
+            b'data: {"id":"c1","choices":[{"index":0,"delta":{"tool_calls":[{"index":0,"function":{"arguments":"\\"x\\"}"}}]},"finish_reason":"tool_calls"}]}\n\n',
+            b'data: {"id":"c1","choices":[],"usage":{"prompt_tokens":3,"completion_tokens":2,"total_tokens":5}}\n\n',
+            b"data: [DONE]\n\n",
+        ]
+    )
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=body)
+
+    accumulator = ChatCompletionAccumulator()
+    with AIStats(api_key="sk_test_123", base_url="https://example.test/v1", transport=httpx.MockTransport(handler)) as client:
+        chunks = [
+            accumulator.add(chunk)
+            for chunk in client.stream_chat_completions(model="openai/gpt-4o-mini", messages=[{"role": "user", "content": "hi"}])
+        ]
+
+    assert len(chunks) == 4
+    response = accumulator.response()
+    message = response.choices[0].message
+    assert response.id == "c1"
+    assert message.content.actual_instance == "Hello"
+    assert message.tool_calls[0].function.arguments == '{"q":"x"}'
+    assert response.choices[0].finish_reason == "tool_calls"
+    assert response.usage.total_tokens == 5